@@ -4,17 +4,37 @@ Configuration Management
 配置管理模块
 
 基于 DEVELOPMENT_GUIDE.md 第3章和第4章实现
+
+加载优化：
+- 优先使用 libyaml（CSafeLoader），不可用时回退到纯 Python 解析器
+- 校验并补全默认值后的配置以 JSON 快照缓存，按配置文件 mtime 与内容摘要失效
+  （需显式指定快照目录，服务进程使用 Config.load(path, DEFAULT_SNAPSHOT_DIR)）
+- 推导值（内容区域、各字号行高与最大行数、排版配置指纹）随快照缓存
 """
 
+import hashlib
+import json
+import os
 import yaml
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
-from logging.handlers import RotatingFileHandler
+from typing import Optional, Dict, Any, List
+from dataclasses import asdict, dataclass, field, fields
+
+from utils.logger import setup_logging
+from utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 C 实现的 YAML 解析器
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# 配置快照格式版本（快照结构变化时递增）
+_SNAPSHOT_VERSION = 1
+
+# 服务进程使用的配置快照目录（相对项目根目录）
+DEFAULT_SNAPSHOT_DIR = "data/cache/config"
+
 
 @dataclass
 class DisplayConfig:
@@ -32,6 +52,24 @@ class DisplayConfig:
     margin: int
     title_height: int
     footer_height: int
+    # 摘要自适应字号（可选）
+    summary_auto_size: bool = False
+    font_size_summary_min: int = 12
+    font_size_summary_max: int = 20
+    fit_time_budget_ms: int = 30
+    # 渲染结果缓存（打包帧）
+    render_cache_entries: int = 128
+    render_cache_max_kb: int = 2048
+    render_backend: str = "pil"
+    # 预渲染：屏幕刷新期间提前渲染接下来的文章
+    render_ahead_depth: int = 3
+    # 标题列表页
+    list_title_lines: int = 2
+    # 文章配图缩略图（1 位抖动，按 URL 缓存）
+    thumbnails_enabled: bool = False
+    thumbnail_height: int = 96
+    thumbnail_dither: str = "ordered"
+    thumbnail_cache_dir: str = "data/cache/thumbnails"
 
 
 @dataclass
@@ -41,6 +79,8 @@ class ServicesConfig:
     interval_minutes: int
     max_articles_per_fetch: int
     daily_limit: int
+    # 订阅源地址列表
+    feeds: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -60,6 +100,16 @@ class LoggingConfig:
     logfile: str
     max_log_size: int
     backup_count: int
+    # 异步写出：有界队列容量（0 表示在调用线程中同步写出）与队列满时的丢弃策略
+    queue_size: int = 10000
+    drop_policy: str = "drop_new"
+    # 内存环形缓冲：日志文件按批写出（间隔、flush_level 及以上或退出时），每日写入上限（0 不限）
+    ring_enabled: bool = False
+    ring_size: int = 262144
+    ring_dir: str = ""
+    flush_interval: float = 300
+    flush_level: str = "WARNING"
+    daily_max_bytes: int = 0
 
 
 @dataclass
@@ -68,6 +118,122 @@ class NetworkConfig:
     timeout_seconds: int
     retries: int
     retry_delay: int
+    # 并发抓取：全局同时请求数与每个主机的连接数上限
+    max_concurrency: int = 16
+    per_host_limit: int = 4
+    user_agent: str = "AI-RSS-Client/1.0"
+
+
+@dataclass
+class RefreshConfig:
+    """刷新调度配置（可选节，缺省时使用默认值）"""
+    enabled: bool = True
+    region_rows: int = 6
+    du_max_changed_ratio: float = 0.5
+    max_partial_updates: int = 5
+    max_partial_minutes: float = 15
+    full_clear_every: int = 20
+    full_clear_minutes: float = 240
+
+
+@dataclass
+class TracingConfig:
+    """阶段耗时追踪配置（可选节，缺省时关闭）"""
+    enabled: bool = False
+    trace_dir: str = "data/traces"
+    max_events: int = 10000
+
+
+@dataclass
+class DerivedConfig:
+    """由显示配置推导的排版参数（随配置快照缓存，字体文件变化时重新计算）"""
+    content_width: int
+    content_top: int
+    content_bottom: int
+    layout_profile: str                                        # 显示配置与字体文件的指纹
+    line_heights: Dict[int, int] = field(default_factory=dict)  # 字号 -> 行高
+    max_lines: Dict[int, int] = field(default_factory=dict)     # 字号 -> 内容区域最大行数
+
+    @property
+    def content_height(self) -> int:
+        """内容区域高度"""
+        return self.content_bottom - self.content_top
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DerivedConfig':
+        """从快照字典恢复（JSON 键为字符串）"""
+        data = dict(data)
+        for name in ('line_heights', 'max_lines'):
+            data[name] = {int(k): v for k, v in data[name].items()}
+        return cls(**data)
+
+
+# 配置节: (名称, 类型, 是否必需)
+_SECTIONS = (
+    ('display', DisplayConfig, True),
+    ('services', ServicesConfig, True),
+    ('display_scheduler', DisplaySchedulerConfig, True),
+    ('logging', LoggingConfig, True),
+    ('network', NetworkConfig, True),
+    ('refresh', RefreshConfig, False),
+    ('tracing', TracingConfig, False),
+)
+
+
+def _schema_digest() -> str:
+    """配置结构指纹（增删字段或修改默认值后旧快照自动失效）"""
+    schema = [(name, [(f.name, repr(f.default)) for f in fields(cls)])
+              for name, cls, _ in _SECTIONS + (('derived', DerivedConfig, False),)]
+    schema.append(_SNAPSHOT_VERSION)
+    return hashlib.blake2b(repr(schema).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _file_identity(*paths: str) -> list:
+    """文件标识（路径、修改时间、大小），与 FontManager.get_identity 一致"""
+    identity = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+            identity.append([path, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            identity.append([path, None, None])
+    return identity
+
+
+def _derive(display: DisplayConfig, font_identity: list) -> DerivedConfig:
+    """
+    计算推导值（需要加载字体，只在快照失效时执行）
+
+    内容区域与 ContentRenderer 一致；行数按默认排版引擎的行距计算
+    """
+    from display.fonts import create_font_manager
+    from display.layout_engine import create_layout_engine
+
+    content_top = display.title_height + display.margin + 5
+    content_bottom = display.height - display.footer_height - display.margin
+
+    sizes = {display.font_size_title, display.font_size_headline,
+             display.font_size_summary, display.font_size_meta}
+    if display.summary_auto_size:
+        sizes.update(range(display.font_size_summary_min, display.font_size_summary_max + 1))
+
+    fonts = create_font_manager(display)
+    layout = create_layout_engine()
+    line_heights, max_lines = {}, {}
+    for size in sorted(sizes):
+        font = fonts.get_font(size)
+        line_heights[size] = layout.font_height(font)
+        max_lines[size] = layout.calculate_max_lines(content_bottom - content_top, font)
+
+    profile = (asdict(display), layout.line_spacing, layout.wrap_mode, font_identity)
+    return DerivedConfig(
+        content_width=display.width - display.margin * 2,
+        content_top=content_top,
+        content_bottom=content_bottom,
+        layout_profile=hashlib.blake2b(repr(profile).encode('utf-8'), digest_size=16).hexdigest(),
+        line_heights=line_heights,
+        max_lines=max_lines,
+    )
 
 
 class Config:
@@ -77,16 +243,31 @@ class Config:
     支持从 YAML 文件加载配置，并提供类型安全的访问
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None,
+                 cache_dir: Optional[str] = None):
         """
         初始化配置管理器
 
         Args:
             config_path: 配置文件路径，默认为 "config.yml"
+            cache_dir: 配置快照目录（默认 None，不读写快照；服务进程传入 DEFAULT_SNAPSHOT_DIR）
         """
         self.config_path = config_path or "config.yml"
+        self.cache_dir = cache_dir
+        self.from_snapshot = False
+        self._derived = None
         self._load()
 
+    @property
+    def derived(self) -> DerivedConfig:
+        """推导的排版参数（快照未命中时首次访问才计算）"""
+        if self._derived is None:
+            self._derived = _derive(self.display, self._font_identity())
+            # 加载后被代码修改过的显示配置不写入快照
+            if asdict(self.display) == self._sections['display']:
+                self._save_snapshot()
+        return self._derived
+
     def _load(self):
         """加载并解析配置文件"""
         path = Path(self.config_path)
@@ -98,18 +279,28 @@ class Config:
             )
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            # 验证必需字段
-            self._validate(data)
-
-            # 映射到 Dataclass（类型安全）
-            self.display = DisplayConfig(**data['display'])
-            self.services = ServicesConfig(**data['services'])
-            self.display_scheduler = DisplaySchedulerConfig(**data['display_scheduler'])
-            self.logging = LoggingConfig(**data['logging'])
-            self.network = NetworkConfig(**data['network'])
+            # 首次加载时追踪尚未按配置启用，只有热加载会记录该阶段
+            with span("config.load"):
+                snapshot = self._load_snapshot(path)
+                if snapshot is not None:
+                    self._apply(snapshot['sections'])
+                    self._sections = snapshot['sections']
+                    if snapshot.get('derived'):
+                        self._derived = DerivedConfig.from_dict(snapshot['derived'])
+                    self.from_snapshot = True
+                else:
+                    with open(path, 'rb') as f:
+                        raw = f.read()
+                    data = yaml.load(raw, Loader=_YAML_LOADER)
+
+                    # 验证必需字段
+                    self._validate(data)
+
+                    # 映射到 Dataclass（类型安全）
+                    self._apply(data)
+                    self._sections = {name: asdict(getattr(self, name)) for name, _, _ in _SECTIONS}
+                    self._source = self._source_identity(path, raw)
+                    self._save_snapshot()
 
             logger.info(f"配置加载成功: {self.config_path}")
 
@@ -123,6 +314,104 @@ class Config:
             logger.error(f"加载配置文件失败: {e}")
             raise
 
+    def _apply(self, data: Dict[str, Any]):
+        """将各配置节映射到 Dataclass（可选节缺省时使用默认值）"""
+        for name, cls, required in _SECTIONS:
+            section = data[name] if required else (data.get(name) or {})
+            setattr(self, name, cls(**section))
+
+    @staticmethod
+    def _source_identity(path: Path, raw: bytes) -> Dict[str, Any]:
+        """配置文件标识（mtime、大小、内容摘要）"""
+        stat = path.stat()
+        return {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'digest': hashlib.blake2b(raw, digest_size=16).hexdigest(),
+        }
+
+    def _font_identity(self) -> list:
+        return _file_identity(self.display.font_file, self.display.font_file_fallback)
+
+    def _snapshot_path(self, path: Path) -> Optional[Path]:
+        """快照文件路径（按配置文件绝对路径区分）"""
+        if not self.cache_dir:
+            return None
+        name = hashlib.blake2b(str(path.resolve()).encode('utf-8'), digest_size=8).hexdigest()
+        return Path(self.cache_dir) / f"{name}.json"
+
+    def _load_snapshot(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        读取有效的配置快照
+
+        mtime 和大小未变时直接使用；变化时比较内容摘要（只 touch 过的文件仍然命中）。
+        字体文件变化时保留配置节，推导值重新计算。
+
+        Returns:
+            dict: 快照内容，不存在或已失效时返回 None
+        """
+        snapshot_path = self._snapshot_path(path)
+        if snapshot_path is None:
+            return None
+
+        try:
+            with open(snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            if snapshot['schema'] != _schema_digest():
+                return None
+
+            source = snapshot['source']
+            stat = path.stat()
+            if (source['mtime_ns'], source['size']) != (stat.st_mtime_ns, stat.st_size):
+                raw = path.read_bytes()
+                if hashlib.blake2b(raw, digest_size=16).hexdigest() != source['digest']:
+                    return None
+                snapshot['source'] = self._source_identity(path, raw)
+                snapshot['stale'] = True
+
+            display = snapshot['sections']['display']
+            if snapshot['fonts'] != _file_identity(display['font_file'],
+                                                   display['font_file_fallback']):
+                snapshot['derived'] = None
+        except (KeyError, TypeError):
+            return None
+
+        self._source = snapshot['source']
+        if snapshot.pop('stale', False):
+            self._write_snapshot(snapshot_path, snapshot)
+        return snapshot
+
+    def _save_snapshot(self):
+        """写入当前配置的快照（失败时只记录日志）"""
+        snapshot_path = self._snapshot_path(Path(self.config_path))
+        if snapshot_path is None:
+            return
+
+        snapshot = {
+            'schema': _schema_digest(),
+            'source': self._source,
+            'fonts': self._font_identity(),
+            'sections': self._sections,
+            'derived': asdict(self._derived) if self._derived else None,
+        }
+        self._write_snapshot(snapshot_path, snapshot)
+
+    @staticmethod
+    def _write_snapshot(snapshot_path: Path, snapshot: Dict[str, Any]):
+        """原子写入快照文件"""
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp, snapshot_path)
+        except OSError as e:
+            logger.debug(f"配置快照写入失败: {e}")
+
     @staticmethod
     def _validate(data: Dict[str, Any]):
         """
@@ -150,75 +439,41 @@ class Config:
             )
 
     @classmethod
-    def load(cls, config_path: Optional[str] = None) -> 'Config':
+    def load(cls, config_path: Optional[str] = None,
+             cache_dir: Optional[str] = None) -> 'Config':
         """
         加载配置的工厂方法
 
         Args:
             config_path: 可选的配置文件路径
+            cache_dir: 配置快照目录（默认 None，不读写快照；服务进程传入 DEFAULT_SNAPSHOT_DIR）
 
         Returns:
             Config: 配置对象
         """
-        return cls(config_path)
+        return cls(config_path, cache_dir)
 
 
-def setup_logging(config: Config) -> logging.Logger:
+def diff_config(old: Config, new: Config) -> Dict[str, Dict[str, tuple]]:
     """
-    设置日志系统
-
-    基于 DEVELOPMENT_GUIDE.md 第7.1节实现
-    支持文件轮转和控制台输出
+    比较两份配置
 
     Args:
-        config: 配置对象
+        old: 原配置
+        new: 新配置
 
     Returns:
-        logging.Logger: 配置好的根日志记录器
+        dict: {配置节: {字段: (旧值, 新值)}}，只包含有变化的节和字段
     """
-    log_level = getattr(logging, config.logging.level.upper())
-    log_file = config.logging.logfile
-
-    # 创建日志目录
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # 配置根日志记录器
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-
-    # 清除现有的处理器
-    root_logger.handlers.clear()
-
-    # 格式化器
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    # 文件处理器（带轮转）
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=config.logging.max_log_size,
-        backupCount=config.logging.backup_count,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-
-    # 控制台处理器
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-
-    # 添加处理器
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-
-    logger.info(f"日志系统初始化完成 (级别: {config.logging.level})")
-    logger.info(f"日志文件: {log_file}")
-
-    return root_logger
+    changes = {}
+    for name, _, _ in _SECTIONS:
+        before = asdict(getattr(old, name))
+        after = asdict(getattr(new, name))
+        fields_changed = {key: (before.get(key), value)
+                          for key, value in after.items() if before.get(key) != value}
+        if fields_changed:
+            changes[name] = fields_changed
+    return changes
 
 
 # 测试代码
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+批量渲染器
+将大量卡片分发到进程池渲染（夜间预渲染、可视化测试脚本等）
+
+功能：
+- 每个工作进程通过进程池初始化函数只创建一次 FontManager/LayoutEngine/ContentRenderer
+- 按提交顺序流式返回结果（打包帧或 PNG）
+- 单进程模式（workers=1）在当前进程中渲染，结果完全相同
+
+用法:
+    with create_batch_renderer(config, workers=4) as batch:
+        for frame in batch.render_frames(articles):
+            ...
+        batch.save_pngs(articles, "data/prerender")
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .fonts import create_font_manager
+from .layout_engine import create_layout_engine
+from .renderer import ContentRenderer, create_renderer
+
+logger = logging.getLogger(__name__)
+
+# 输出格式
+OUTPUT_FRAME = "frame"  # 1-bpp 打包帧（可直接交给 EpaperDriver）
+OUTPUT_PNG = "png"      # PNG 文件内容
+
+# 渲染任务: (文章, 索引, 总数, 输出格式)
+_Job = Tuple[Dict[str, Any], int, int, str]
+
+# 工作进程内的渲染器（由 _init_worker 创建）
+_worker_renderer: Optional[ContentRenderer] = None
+
+
+def _build_renderer(config) -> ContentRenderer:
+    """按配置创建渲染器（字体与排版引擎只加载一次）"""
+    font_manager = create_font_manager(config.display)
+    layout_engine = create_layout_engine()
+    return create_renderer(config, font_manager, layout_engine)
+
+
+def _init_worker(config):
+    """进程池初始化函数：在工作进程中创建渲染器"""
+    global _worker_renderer
+    _worker_renderer = _build_renderer(config)
+    logger.debug(f"批量渲染工作进程就绪: pid={os.getpid()}")
+
+
+def _render_job(renderer: ContentRenderer, job: _Job) -> bytes:
+    """渲染一张卡片"""
+    article, index, total, output = job
+    if output == OUTPUT_PNG:
+        buffer = io.BytesIO()
+        renderer.render_news_card(article, index, total).save(buffer, format='PNG')
+        return buffer.getvalue()
+    return renderer.render_news_card_frame(article, index, total)
+
+
+def _run_job(job: _Job) -> bytes:
+    """工作进程入口"""
+    return _render_job(_worker_renderer, job)
+
+
+class BatchRenderer:
+    """
+    进程池批量渲染器
+
+    结果按提交顺序返回；进程池在第一次渲染时创建，之后复用到 close()
+    """
+
+    def __init__(self, config, workers: Optional[int] = None, chunksize: int = 4,
+                 mp_context: Optional[str] = None):
+        """
+        初始化批量渲染器
+
+        Args:
+            config: Config 配置对象（传给每个工作进程）
+            workers: 工作进程数（默认 CPU 核数，1 表示在当前进程中渲染）
+            chunksize: 每次分发给工作进程的卡片数
+            mp_context: 进程启动方式（'fork' / 'spawn' / 'forkserver'，默认系统默认）
+        """
+        self.config = config
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunksize = max(1, chunksize)
+        self.mp_context = mp_context
+
+        self._pool = None
+        self._local_renderer: Optional[ContentRenderer] = None
+
+    def render_frames(self, articles: Iterable[Dict[str, Any]], total: Optional[int] = None,
+                      start: int = 1) -> Iterator[bytes]:
+        """
+        批量渲染为打包帧（按顺序流式返回）
+
+        Args:
+            articles: 文章序列
+            total: 页眉显示的文章总数（默认为文章数）
+            start: 第一篇文章的索引
+
+        Returns:
+            Iterator[bytes]: 打包帧
+        """
+        return self._map(self._jobs(articles, total, start, OUTPUT_FRAME))
+
+    def render_pngs(self, articles: Iterable[Dict[str, Any]], total: Optional[int] = None,
+                    start: int = 1) -> Iterator[bytes]:
+        """
+        批量渲染为 PNG（按顺序流式返回文件内容）
+
+        Args:
+            articles: 文章序列
+            total: 页眉显示的文章总数（默认为文章数）
+            start: 第一篇文章的索引
+
+        Returns:
+            Iterator[bytes]: PNG 文件内容
+        """
+        return self._map(self._jobs(articles, total, start, OUTPUT_PNG))
+
+    def save_pngs(self, articles: Iterable[Dict[str, Any]], output_dir: str,
+                  prefix: str = "card", total: Optional[int] = None) -> List[Path]:
+        """
+        批量渲染并保存 PNG 文件
+
+        Args:
+            articles: 文章序列
+            output_dir: 输出目录
+            prefix: 文件名前缀（文件名为 <prefix>_<索引>.png）
+            total: 页眉显示的文章总数（默认为文章数）
+
+        Returns:
+            List[Path]: 保存的文件路径（按顺序）
+        """
+        articles = list(articles)
+        directory = Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        paths = []
+        for index, data in enumerate(self.render_pngs(articles, total), 1):
+            path = directory / f"{prefix}_{index:04d}.png"
+            path.write_bytes(data)
+            paths.append(path)
+
+        logger.info(f"批量渲染完成: {len(paths)} 张 -> {directory}")
+        return paths
+
+    @staticmethod
+    def _jobs(articles: Iterable[Dict[str, Any]], total: Optional[int],
+              start: int, output: str) -> List[_Job]:
+        articles = list(articles)
+        total = len(articles) if total is None else total
+        return [(article, index, total, output) for index, article in enumerate(articles, start)]
+
+    def _map(self, jobs: List[_Job]) -> Iterator[bytes]:
+        """按顺序分发任务"""
+        if self.workers == 1 or len(jobs) <= 1:
+            if self._local_renderer is None:
+                self._local_renderer = _build_renderer(self.config)
+            return (_render_job(self._local_renderer, job) for job in jobs)
+
+        return self._get_pool().imap(_run_job, jobs, chunksize=self.chunksize)
+
+    def _get_pool(self):
+        """创建进程池（首次使用时）"""
+        if self._pool is None:
+            context = multiprocessing.get_context(self.mp_context)
+            self._pool = context.Pool(self.workers, initializer=_init_worker,
+                                      initargs=(self.config,))
+            logger.info(f"批量渲染进程池已启动: {self.workers} 个工作进程")
+        return self._pool
+
+    def close(self):
+        """关闭进程池"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None and self._pool is not None:
+            self._pool.terminate()
+        self.close()
+        return False
+
+
+def create_batch_renderer(config, workers: Optional[int] = None,
+                          chunksize: int = 4) -> BatchRenderer:
+    """
+    创建批量渲染器（工厂函数）
+
+    Args:
+        config: Config 配置对象
+        workers: 工作进程数（默认 CPU 核数）
+        chunksize: 每次分发给工作进程的卡片数
+
+    Returns:
+        BatchRenderer: 批量渲染器实例
+    """
+    return BatchRenderer(config, workers=workers, chunksize=chunksize)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+LRU 缓存
+供排版、渲染等模块缓存可复用的计算结果
+
+功能：
+- 条目数上限与内存上限（字节）双重约束
+- 命中/未命中/淘汰计数
+- 线程安全
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+def estimate_size(value: Any) -> int:
+    """
+    估算缓存值占用的内存（字节）
+
+    对字符串/字节串、元组/列表做浅层递归，其他对象使用 sys.getsizeof
+
+    Args:
+        value: 缓存值
+
+    Returns:
+        int: 估算字节数
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class LRUCache:
+    """
+    最近最少使用（LRU）缓存
+
+    超出条目数或内存上限时，从最久未使用的条目开始淘汰
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = estimate_size):
+        """
+        初始化缓存
+
+        Args:
+            max_entries: 最大条目数（0 表示禁用缓存）
+            max_bytes: 内存上限（字节），None 表示不限制
+            sizeof: 估算缓存值大小的函数
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+
+        # {key: (value, size)}
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        获取缓存值（命中时标记为最近使用）
+
+        Args:
+            key: 缓存键
+            default: 未命中时的返回值
+
+        Returns:
+            缓存值或 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None):
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+            size: 值的大小（字节），None 时自动估算
+        """
+        if self.max_entries <= 0:
+            return
+
+        if size is None:
+            size = self._sizeof(value)
+
+        # 单个值超过内存上限时不缓存
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._data[key] = (value, size)
+            self._bytes += size
+
+            while (len(self._data) > self.max_entries or
+                   (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def discard(self, key: Hashable):
+        """移除指定条目（不存在时忽略）"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self):
+        """清空缓存（保留统计计数）"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> dict:
+        """获取缓存统计信息"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
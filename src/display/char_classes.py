@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+字符断行分类表
+参考 UAX #14（Unicode 换行算法）的思路，为排版引擎提供查表式字符分类
+
+分类：
+- A (ALPHA):       字母、数字等，连续出现时组成单词，单词内部不断行
+- S (SPACE):       空白字符，之后允许断行
+- I (IDEOGRAPHIC): 汉字、假名、谚文、全角字符等，前后均允许断行
+- O (OPEN):        开括号/开引号（「（《 等），之后不允许断行
+- C (CLOSE):       闭括号、句读点、长音符、小假名等，之前不允许断行（避头尾）
+
+基本多文种平面（BMP）使用 65536 项的查找表，可直接交给 str.translate 在 C 层批量分类；
+辅助平面使用区间表二分查找。
+"""
+
+import re
+from bisect import bisect_right
+from typing import Iterator, Tuple
+
+CLASS_ALPHA = 'A'
+CLASS_SPACE = 'S'
+CLASS_IDEOGRAPHIC = 'I'
+CLASS_OPEN = 'O'
+CLASS_CLOSE = 'C'
+
+# 东亚宽字符类（原 LayoutEngine._is_cjk 的判定范围）
+EAST_ASIAN_CLASSES = frozenset((CLASS_IDEOGRAPHIC, CLASS_OPEN, CLASS_CLOSE))
+
+# 表意类区间（BMP）
+_IDEOGRAPHIC_RANGES = [
+    (0x1100, 0x11FF),   # Hangul Jamo
+    (0x2E80, 0x2FDF),   # CJK Radicals Supplement, Kangxi Radicals
+    (0x2FF0, 0x2FFF),   # Ideographic Description Characters
+    (0x3000, 0x303F),   # CJK Symbols and Punctuation
+    (0x3040, 0x309F),   # Hiragana
+    (0x30A0, 0x30FF),   # Katakana
+    (0x3100, 0x312F),   # Bopomofo
+    (0x3130, 0x318F),   # Hangul Compatibility Jamo
+    (0x3190, 0x31FF),   # Kanbun, Bopomofo Extended, CJK Strokes, Katakana Phonetic Extensions
+    (0x3200, 0x33FF),   # Enclosed CJK Letters and Months, CJK Compatibility
+    (0x3400, 0x4DBF),   # CJK Extension A
+    (0x4E00, 0x9FFF),   # CJK Unified Ideographs
+    (0xA960, 0xA97F),   # Hangul Jamo Extended-A
+    (0xAC00, 0xD7AF),   # Hangul Syllables
+    (0xD7B0, 0xD7FF),   # Hangul Jamo Extended-B
+    (0xF900, 0xFAFF),   # CJK Compatibility Ideographs
+    (0xFE30, 0xFE4F),   # CJK Compatibility Forms
+    (0xFF00, 0xFFEF),   # Halfwidth and Fullwidth Forms
+]
+
+# 辅助平面区间: (起始, 结束, 分类)，按起始升序
+_ASTRAL_RANGES = [
+    (0x1B000, 0x1B16F, CLASS_IDEOGRAPHIC),   # Kana Supplement / Extended-A
+    (0x1F300, 0x1FAFF, CLASS_IDEOGRAPHIC),   # Emoji 与图形符号
+    (0x20000, 0x2FA1F, CLASS_IDEOGRAPHIC),   # CJK Extension B-F, Compatibility Supplement
+    (0x30000, 0x323AF, CLASS_IDEOGRAPHIC),   # CJK Extension G-H
+]
+
+# 之前不允许断行的字符（闭括号、句读点、长音符、叠字符、小假名）
+_CLOSE_CHARS = (
+    "、。〉》」』】〕〗〙〛〞〟"
+    "，．：；！？）］｝｠｡｣､"
+    "ー々ゝゞヽヾ・"
+    "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶ"
+)
+
+# 之后不允许断行的字符（开括号、开引号）
+_OPEN_CHARS = "〈《「『【〔〖〘〚〝（［｛｟｢"
+
+# 空白字符（与 str.isspace() 在 BMP 中的判定一致）
+_SPACE_CHARS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def _build_bmp_table() -> str:
+    """构建 BMP 分类表（长度 65536 的字符串，第 i 项为码位 i 的分类）"""
+    table = [CLASS_ALPHA] * 0x10000
+
+    for start, end in _IDEOGRAPHIC_RANGES:
+        table[start:end + 1] = [CLASS_IDEOGRAPHIC] * (end - start + 1)
+    for char in _CLOSE_CHARS:
+        table[ord(char)] = CLASS_CLOSE
+    for char in _OPEN_CHARS:
+        table[ord(char)] = CLASS_OPEN
+    for char in _SPACE_CHARS:
+        table[ord(char)] = CLASS_SPACE
+
+    return "".join(table)
+
+
+_BMP_TABLE = _build_bmp_table()
+_ASTRAL_STARTS = [start for start, _, _ in _ASTRAL_RANGES]
+
+# 连续同类字符
+_RUN_PATTERN = re.compile(r"A+|S+|I+|O+|C+")
+
+# translate 之后仍残留的非 ASCII 字符即为辅助平面字符
+_UNCLASSIFIED_PATTERN = re.compile(r"[^\x00-\x7f]")
+
+
+def _astral_class(code: int) -> str:
+    """辅助平面字符分类"""
+    i = bisect_right(_ASTRAL_STARTS, code) - 1
+    if i >= 0 and code <= _ASTRAL_RANGES[i][1]:
+        return _ASTRAL_RANGES[i][2]
+    return CLASS_ALPHA
+
+
+def char_class(char: str) -> str:
+    """
+    获取单个字符的断行分类
+
+    Args:
+        char: 单个字符
+
+    Returns:
+        str: 分类代码（CLASS_*）
+    """
+    code = ord(char)
+    if code < 0x10000:
+        return _BMP_TABLE[code]
+    return _astral_class(code)
+
+
+def classify(text: str) -> str:
+    """
+    批量分类：返回与 text 等长的分类代码字符串
+
+    Args:
+        text: 文本内容
+
+    Returns:
+        str: 第 i 个字符为 text[i] 的分类代码
+    """
+    codes = text.translate(_BMP_TABLE)
+    if not codes.isascii():
+        codes = _UNCLASSIFIED_PATTERN.sub(lambda m: _astral_class(ord(m.group())), codes)
+    return codes
+
+
+def iter_runs(text: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    按连续同类字符分段
+
+    Args:
+        text: 文本内容
+
+    Yields:
+        (分类, 起始偏移, 结束偏移)
+    """
+    codes = classify(text)
+    for match in _RUN_PATTERN.finditer(codes):
+        start = match.start()
+        yield codes[start], start, match.end()
+
+
+def is_east_asian(char: str) -> bool:
+    """
+    判断字符是否为东亚宽字符（汉字、假名、谚文、全角字符及 CJK 标点）
+
+    Args:
+        char: 单个字符
+
+    Returns:
+        bool: 是否为东亚宽字符
+    """
+    return char_class(char) in EAST_ASIAN_CLASSES
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+静态页面框架（chrome）模板
+每种显示配置只绘制一次页眉黑底、页脚分割线，卡片从模板副本开始，只绘制可变部分
+
+功能：
+- 预渲染的底图（页眉背景 + 页脚分割线）
+- 固定文字（"AI-RSS | "）与计数器字符（0-9、/）的位图缓存
+- 按位图拼接页眉文字，不再逐卡调用字体光栅化
+- 打包帧版本的底图，供直接渲染到帧缓冲区的后端使用
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .framebuffer import FrameBuffer, GlyphCache
+
+logger = logging.getLogger(__name__)
+
+# 页眉固定文字
+HEADER_BRAND = "AI-RSS"
+HEADER_PREFIX = HEADER_BRAND + " | "
+
+
+class ChromeTemplate:
+    """
+    页面框架模板
+
+    与 ContentRenderer 的页眉/页脚布局一致：
+    页眉为 (0, 0)-(width, title_height) 的黑色矩形，页脚分割线位于 height - footer_height
+    """
+
+    def __init__(self, width: int, height: int, margin: int,
+                 title_height: int, footer_height: int,
+                 header_font: ImageFont.FreeTypeFont):
+        """
+        初始化模板（立即绘制底图）
+
+        Args:
+            width: 屏幕宽度
+            height: 屏幕高度
+            margin: 页边距
+            title_height: 页眉高度
+            footer_height: 页脚高度
+            header_font: 页眉字体
+        """
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.title_height = title_height
+        self.footer_height = footer_height
+        self.header_font = header_font
+
+        # 文字位图缓存: {文字: (遮罩, x 偏移, y 偏移, 前进宽度)}
+        self._bitmaps: Dict[str, Tuple[Image.Image, int, int, float]] = {}
+
+        self.base = self._render_base()
+        self.base_frame = FrameBuffer.from_image(self.base)
+
+    def _render_base(self) -> Image.Image:
+        """绘制底图：页眉黑底 + 页脚分割线"""
+        image = Image.new('1', (self.width, self.height), 255)
+        draw = ImageDraw.Draw(image)
+
+        draw.rectangle([(0, 0), (self.width, self.title_height)], fill=0)
+
+        footer_y = self.height - self.footer_height
+        draw.line([(self.margin, footer_y), (self.width - self.margin, footer_y)], fill=0, width=1)
+
+        return image
+
+    def new_canvas(self) -> Image.Image:
+        """获取一张以模板为底的新画布"""
+        return self.base.copy()
+
+    def new_frame(self) -> FrameBuffer:
+        """获取一个以模板为底的新帧缓冲区"""
+        return self.base_frame.copy()
+
+    def header_tokens(self, index: int, total: int) -> List[str]:
+        """
+        页眉文字拆分为可缓存的片段（固定前缀 + 逐个计数器字符）
+
+        Args:
+            index: 当前索引
+            total: 总数
+
+        Returns:
+            List[str]: 文字片段
+        """
+        if total > 0:
+            return [HEADER_PREFIX] + list(f"{index}/{total}")
+        return [HEADER_BRAND]
+
+    def draw_header(self, image: Image.Image, index: int, total: int, text_y: int):
+        """
+        在画布上绘制居中的页眉文字（白字）
+
+        Args:
+            image: 画布（new_canvas() 返回的图像）
+            index: 当前索引
+            total: 总数
+            text_y: 文字顶部 Y 坐标
+        """
+        tokens = self.header_tokens(index, total)
+        width = sum(self._get_bitmap(token)[3] for token in tokens)
+        self.draw_tokens(image, tokens, int((self.width - width) // 2), text_y, fill=255)
+
+    def draw_header_frame(self, fb: FrameBuffer, glyphs: GlyphCache,
+                          index: int, total: int, text_y: int):
+        """
+        在帧缓冲区上绘制居中的页眉文字（白字，逐字符使用字形缓存）
+
+        Args:
+            fb: 帧缓冲区（new_frame() 返回）
+            glyphs: 字形缓存
+            index: 当前索引
+            total: 总数
+            text_y: 文字顶部 Y 坐标
+        """
+        text = "".join(self.header_tokens(index, total))
+        width = sum(self._get_bitmap(char)[3] for char in text)
+        glyphs.draw_text(fb, text, self.header_font, int((self.width - width) // 2), text_y, fill=255)
+
+    def draw_tokens(self, image: Image.Image, tokens: List[str],
+                    x: int, y: int, fill: int = 0):
+        """
+        按缓存位图依次绘制文字片段
+
+        Args:
+            image: 画布
+            tokens: 文字片段
+            x: 起始 X 坐标
+            y: 文字顶部 Y 坐标
+            fill: 颜色（0=黑，255=白）
+        """
+        pen = 0.0
+        for token in tokens:
+            mask, dx, dy, advance = self._get_bitmap(token)
+            if mask is not None:
+                image.paste(fill, (x + int(pen) + dx, y + dy), mask)
+            pen += advance
+
+    def _get_bitmap(self, token: str) -> Tuple[Image.Image, int, int, float]:
+        """
+        获取文字片段的位图（首次使用时光栅化）
+
+        Args:
+            token: 文字片段
+
+        Returns:
+            (mask, dx, dy, advance): '1' 模式遮罩（1 为笔画）、相对绘制点的偏移、前进宽度
+        """
+        cached = self._bitmaps.get(token)
+        if cached is not None:
+            return cached
+
+        font = self.header_font
+        left, top, right, bottom = font.getbbox(token)
+        dx, dy = min(left, 0), min(top, 0)
+        size = (right - dx, bottom - dy)
+
+        mask = None
+        if size[0] > 0 and size[1] > 0:
+            mask = Image.new('1', size, 0)
+            ImageDraw.Draw(mask).text((-dx, -dy), token, font=font, fill=1)
+
+        cached = (mask, dx, dy, font.getlength(token))
+        self._bitmaps[token] = cached
+        return cached
+
+    def get_stats(self) -> dict:
+        """获取位图缓存信息"""
+        return {'bitmaps': len(self._bitmaps)}
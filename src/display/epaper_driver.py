@@ -11,17 +11,35 @@ E-Paper Display Driver
 - 硬件冲突检测
 - 优雅的错误处理
 - 资源自动清理
+- 防残影刷新调度（DU / GC / 完整清屏）
+- 单线程优先级命令队列（多生产者安全共享屏幕）
+- 支持直接显示打包帧（跳过 getbuffer 转换）
+- 分阶段耗时追踪（SPI 传输、查找表上传、BUSY 等待、睡眠/唤醒）
 """
 
 import sys
+import itertools
 import logging
+import queue
 import subprocess
+import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple, Callable, Union
 from PIL import Image
 
+from utils.hotlog import get_hot_logger, lazy
+from utils.tracing import span
+
+from .framebuffer import Frame, frame_size, is_frame, pack_image, unpack_frame
+from .refresh_scheduler import (
+    RefreshScheduler, RefreshPlan, create_refresh_scheduler,
+    WAVEFORM_NONE, WAVEFORM_DU, WAVEFORM_FULL
+)
+
 logger = logging.getLogger(__name__)
+hot_logger = get_hot_logger(__name__)
 
 
 class EpaperDriverError(Exception):
@@ -29,6 +47,58 @@ class EpaperDriverError(Exception):
     pass
 
 
+# 命令优先级（数值越小越优先）
+PRIORITY_ALERT = 0          # 告警
+PRIORITY_INPUT = 10         # 用户输入（翻页等）
+PRIORITY_SCHEDULED = 20     # 定时调度
+PRIORITY_MAINTENANCE = 30   # 睡眠等维护操作
+_PRIORITY_STOP = 1000       # 停止工作线程（排在所有命令之后）
+
+
+class _Command:
+    """队列中的硬件命令"""
+
+    __slots__ = ('priority', 'seq', 'func', 'args', 'future')
+
+    def __init__(self, priority: int, seq: int, func: Optional[Callable], args: tuple):
+        self.priority = priority
+        self.seq = seq
+        self.func = func
+        self.args = args
+        self.future = Future()
+
+    def __lt__(self, other: '_Command') -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+def _run_command_worker(commands: 'queue.PriorityQueue[_Command]'):
+    """
+    硬件命令工作线程
+
+    按优先级串行执行所有硬件操作。空闲时不持有驱动对象的引用，
+    因此驱动对象仍可被正常回收。
+
+    Args:
+        commands: 命令优先级队列
+    """
+    while True:
+        command = commands.get()
+        if command.func is None:
+            command.future.set_result(None)
+            break
+
+        # 已被取消（例如被更新的显示请求取代）的命令直接跳过
+        if command.future.set_running_or_notify_cancel():
+            try:
+                result = command.func(*command.args)
+            except BaseException as e:
+                command.future.set_exception(e)
+            else:
+                command.future.set_result(result)
+
+        command = None
+
+
 class EpaperDriver:
     """
     墨水屏驱动封装类
@@ -41,12 +111,14 @@ class EpaperDriver:
     DEFAULT_WIDTH = 240
     DEFAULT_HEIGHT = 360
 
-    def __init__(self, lib_path: Optional[str] = None):
+    def __init__(self, lib_path: Optional[str] = None,
+                 refresh_scheduler: Optional[RefreshScheduler] = None):
         """
         初始化墨水屏驱动
 
         Args:
             lib_path: 墨水屏库路径，默认为 "lib/waveshare_epd"
+            refresh_scheduler: 刷新调度器（可选，None 时每次都使用 GC 全刷新）
         """
         self.lib_path = Path(lib_path or "lib/waveshare_epd")
         self.epd = None
@@ -54,6 +126,15 @@ class EpaperDriver:
         self.is_initialized = False
         self.width = self.DEFAULT_WIDTH
         self.height = self.DEFAULT_HEIGHT
+        self.refresh_scheduler = refresh_scheduler
+
+        # 命令队列：所有硬件操作都在唯一的工作线程中执行
+        self._commands = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._queue_lock = threading.Lock()
+        self._worker = None
+        self._retiring_worker = None
+        self._pending_display = {}  # {优先级: 尚未执行的显示命令}
 
         # 尝试加载硬件驱动
         self._load_hardware_driver()
@@ -70,9 +151,9 @@ class EpaperDriver:
             lib_abs_path = self.lib_path.parent.resolve()
             if lib_abs_path.exists():
                 sys.path.insert(0, str(lib_abs_path))
-                logger.debug(f"添加库路径: {lib_abs_path}")
+                logger.debug("添加库路径: %s", lib_abs_path)
             else:
-                logger.warning(f"库路径不存在: {lib_abs_path}")
+                logger.warning("库路径不存在: %s", lib_abs_path)
 
             # 导入硬件驱动
             from waveshare_epd import epd3in52
@@ -83,16 +164,16 @@ class EpaperDriver:
             self.height = self.epd.height
             self.is_mock = False
 
-            logger.info(f"✅ 硬件驱动加载成功 (Waveshare 3.52\" {self.width}x{self.height})")
+            logger.info("✅ 硬件驱动加载成功 (Waveshare 3.52\" %dx%d)", self.width, self.height)
 
         except ImportError as e:
             self.is_mock = True
-            logger.warning(f"⚠️  无法导入墨水屏库: {e}")
+            logger.warning("⚠️  无法导入墨水屏库: %s", e)
             logger.info("📝 切换到 Mock 模拟模式（仅生成调试图像）")
 
         except Exception as e:
             self.is_mock = True
-            logger.error(f"❌ 硬件初始化异常: {e}")
+            logger.error("❌ 硬件初始化异常: %s", e)
             logger.info("📝 切换到 Mock 模拟模式")
 
     def _check_hardware_conflicts(self) -> bool:
@@ -125,7 +206,7 @@ class EpaperDriver:
                 )
 
                 if result.returncode == 0 and result.stdout.strip() == "active":
-                    logger.warning(f"⚠️  检测到运行中的服务: {service}")
+                    logger.warning("⚠️  检测到运行中的服务: %s", service)
                     logger.warning("⚠️  可能存在 GPIO/SPI 资源冲突")
                     return False
 
@@ -136,10 +217,22 @@ class EpaperDriver:
             logger.debug("⚠️  无法检查服务状态（systemctl 不可用）")
             return True
         except Exception as e:
-            logger.debug(f"⚠️  硬件冲突检查失败: {e}")
+            logger.debug("⚠️  硬件冲突检查失败: %s", e)
             return True
 
     def init_display(self) -> bool:
+        """
+        初始化墨水屏显示器（在工作线程中执行，阻塞直到完成）
+
+        Returns:
+            bool: 初始化成功返回 True，失败返回 False
+
+        Raises:
+            EpaperDriverError: 如果硬件初始化失败且不在 Mock 模式
+        """
+        return self._call(self._do_init_display, PRIORITY_INPUT)
+
+    def _do_init_display(self) -> bool:
         """
         初始化墨水屏显示器
 
@@ -162,6 +255,7 @@ class EpaperDriver:
         if self.is_mock:
             logger.info("📝 [Mock] 屏幕初始化完成（模拟模式）")
             self.is_initialized = True
+            self._reset_refresh_scheduler()
             return True
 
         # 检查硬件冲突
@@ -169,119 +263,310 @@ class EpaperDriver:
             logger.warning("⚠️  检测到硬件冲突，切换到 Mock 模式")
             self.is_mock = True
             self.is_initialized = True
+            self._reset_refresh_scheduler()
             return True
 
         try:
             # 完整的初始化序列（基于原有程序验证）
-            self.epd.init()
+            with span("epd.wake"):
+                self.epd.init()
             logger.debug("执行 display_NUM(WHITE) 清屏...")
-            self.epd.display_NUM(self.epd.WHITE)
+            with span("epd.spi_transfer"):
+                self.epd.display_NUM(self.epd.WHITE)
             logger.debug("执行 lut_GC() 加载刷新查找表...")
-            self.epd.lut_GC()
+            with span("epd.lut_upload", lut="GC"):
+                self.epd.lut_GC()
             logger.debug("执行 refresh() 强制刷新...")
-            self.epd.refresh()
+            with span("epd.busy_wait"):
+                self.epd.refresh()
             logger.debug("等待刷新完成（2秒）...")
-            time.sleep(2)
+            with span("epd.settle_wait"):
+                time.sleep(2)
 
             self.is_initialized = True
+            self._reset_refresh_scheduler()
             logger.info("✅ 硬件屏幕初始化完成（包含完整刷新序列）")
             return True
 
         except Exception as e:
-            logger.error(f"❌ 硬件屏幕初始化失败: {e}")
+            logger.error("❌ 硬件屏幕初始化失败: %s", e)
             self.is_initialized = False
             raise EpaperDriverError(f"墨水屏初始化失败: {e}")
 
-    def display_image(self, image: Image.Image) -> bool:
+    def display_image(self, image: Union[Image.Image, Frame], waveform: Optional[str] = None,
+                      priority: int = PRIORITY_SCHEDULED) -> bool:
         """
-        显示图像到墨水屏
+        显示图像到墨水屏（阻塞直到刷新完成）
+
+        不希望等待刷新的生产者请使用 submit_display()
 
         Args:
-            image: PIL Image 对象（推荐使用 '1' 模式，单色）
+            image: PIL Image 对象（推荐使用 '1' 模式，单色）或打包帧（bytes）
+            waveform: 强制使用的刷新波形（DU/GC/FULL，默认由刷新调度器决定）
+            priority: 命令优先级
 
         Returns:
             bool: 显示成功返回 True，失败返回 False
         """
+        return self._call(self._do_display, priority, image, waveform)
+
+    def submit_display(self, image: Union[Image.Image, Frame], priority: int = PRIORITY_SCHEDULED,
+                       waveform: Optional[str] = None, coalesce: bool = True) -> Future:
+        """
+        提交显示请求（立即返回，不等待刷新）
+
+        Args:
+            image: PIL Image 对象或打包帧（bytes）
+            priority: 命令优先级（PRIORITY_ALERT / PRIORITY_INPUT / PRIORITY_SCHEDULED）
+            waveform: 强制使用的刷新波形（可选）
+            coalesce: 是否取代同一优先级中尚未执行的显示请求（只显示最新画面）
+
+        Returns:
+            Future: 结果为 bool；被更新请求取代时处于已取消状态
+        """
+        return self._submit(self._do_display, priority, (image, waveform), coalesce=coalesce)
+
+    def submit_clear(self, priority: int = PRIORITY_SCHEDULED) -> Future:
+        """
+        提交清屏请求（立即返回）
+
+        Args:
+            priority: 命令优先级
+
+        Returns:
+            Future: 结果为 bool
+        """
+        return self._submit(self._do_clear, priority)
+
+    def submit_sleep(self, priority: int = PRIORITY_MAINTENANCE) -> Future:
+        """
+        提交睡眠请求（立即返回，默认排在已提交的显示请求之后）
+
+        Args:
+            priority: 命令优先级
+
+        Returns:
+            Future: 结果为 None
+        """
+        return self._submit(self._do_sleep, priority)
+
+    def apply_config(self, config, changes: Dict[str, Dict[str, tuple]]) -> Optional[Future]:
+        """
+        应用热加载后的刷新调度配置（不重新初始化面板，也不清屏）
+
+        新调度器沿用当前屏幕内容，在工作线程中两次刷新之间替换
+
+        Args:
+            config: 新的 Config 配置对象
+            changes: diff_config() 的结果
+
+        Returns:
+            Future: 替换命令，refresh 节未变化时返回 None
+        """
+        if 'refresh' not in changes:
+            return None
+        return self._submit(self._do_apply_refresh_config, PRIORITY_ALERT, (config,))
+
+    def _do_apply_refresh_config(self, config):
+        """在工作线程中替换刷新调度器"""
+        previous = self.refresh_scheduler
+        scheduler = create_refresh_scheduler(config)
+        if scheduler is not None and previous is not None:
+            scheduler.reset(previous.last_frame)
+        self.refresh_scheduler = scheduler
+        logger.info("刷新调度配置已更新: %s", '启用' if scheduler else '关闭')
+
+    def _do_display(self, image: Union[Image.Image, Frame], waveform: Optional[str] = None) -> bool:
+        """在工作线程中显示图像"""
         if not self.is_initialized:
             logger.error("❌ 显示器未初始化，请先调用 init_display()")
             return False
 
-        if self.is_mock:
-            # Mock 模式：保存图像到本地
-            return self._mock_display(image)
-        else:
-            # 硬件模式：发送到墨水屏
-            return self._hardware_display(image)
+        with span("epd.display", mock=self.is_mock):
+            if self.is_mock:
+                # Mock 模式：保存图像到本地
+                return self._mock_display(image, waveform)
+            else:
+                # 硬件模式：发送到墨水屏
+                return self._hardware_display(image, waveform)
 
-    def _mock_display(self, image: Image.Image) -> bool:
+    def _plan_refresh(self, frame: Optional[bytes],
+                      waveform: Optional[str]) -> Optional[RefreshPlan]:
+        """
+        通过刷新调度器选择本次刷新波形
+
+        Args:
+            frame: 打包后的帧缓冲区
+            waveform: 强制波形（可选）
+
+        Returns:
+            RefreshPlan: 刷新决策，未配置调度器且未强制波形时返回 None
+        """
+        if self.refresh_scheduler is None:
+            return RefreshPlan(waveform) if waveform else None
+
+        plan = self.refresh_scheduler.plan(frame, force=waveform)
+        logger.debug("刷新决策: %s (%s, 变化区域 %s, 面积 %.0f%%)",
+                     plan.waveform, plan.reason, plan.changed_regions, plan.changed_ratio * 100)
+        return plan
+
+    def _record_refresh(self, plan: Optional[RefreshPlan], frame: Optional[bytes]):
+        """显示成功后通知刷新调度器"""
+        if self.refresh_scheduler is not None and plan is not None:
+            self.refresh_scheduler.record(plan, frame)
+
+    def _reset_refresh_scheduler(self):
+        """屏幕已刷为全白，重置刷新调度状态"""
+        if self.refresh_scheduler is not None:
+            white_frame = b'\xff' * (self.width // 8 * self.height)
+            self.refresh_scheduler.reset(white_frame)
+
+    def _pack_frame(self, image: Union[Image.Image, Frame]) -> Optional[bytes]:
+        """
+        将图像打包为 1-bpp 帧（与面板竖屏缓冲区布局一致，用于变化检测）
+
+        Args:
+            image: PIL Image 对象或打包帧
+
+        Returns:
+            bytes: 帧缓冲区，尺寸不匹配时返回 None
+        """
+        if is_frame(image):
+            return bytes(image) if len(image) == frame_size(self.width, self.height) else None
+        if image.size != (self.width, self.height):
+            return None
+        return pack_image(image)
+
+    def _mock_display(self, image: Union[Image.Image, Frame],
+                      waveform: Optional[str] = None) -> bool:
         """
         Mock 模式显示（保存图像到文件）
 
         Args:
-            image: PIL Image 对象
+            image: PIL Image 对象或打包帧
+            waveform: 强制波形（可选）
 
         Returns:
             bool: 成功返回 True
         """
         try:
+            frame = self._pack_frame(image) if self.refresh_scheduler else None
+            plan = self._plan_refresh(frame, waveform)
+            if plan is not None:
+                logger.info("📝 [Mock] 刷新波形: %s (%s)", plan.waveform, plan.reason)
+
+            if is_frame(image):
+                image = unpack_frame(image, self.width, self.height)
+
             debug_path = Path("data/debug_current_view.png")
             debug_path.parent.mkdir(parents=True, exist_ok=True)
 
             # 保存为 PNG（无损）
-            image.save(debug_path)
-            logger.info(f"📝 [Mock] 图像已保存至: {debug_path.absolute()}")
+            with span("epd.mock_save"):
+                image.save(debug_path)
+            logger.info("📝 [Mock] 图像已保存至: %s", lazy(debug_path.absolute))
             logger.info("💡 提示: 下载此文件查看显示效果")
 
+            self._record_refresh(plan, frame)
             return True
 
         except Exception as e:
-            logger.error(f"❌ [Mock] 保存图像失败: {e}")
+            logger.error("❌ [Mock] 保存图像失败: %s", e)
             return False
 
-    def _hardware_display(self, image: Image.Image) -> bool:
+    def _hardware_display(self, image: Union[Image.Image, Frame],
+                          waveform: Optional[str] = None) -> bool:
         """
         硬件模式显示（发送到墨水屏）
 
         重要：墨水屏需要调用 refresh() 才能真正显示图像
         流程：display() 发送数据 -> refresh() 触发刷新
 
+        配置了刷新调度器时，按决策加载对应查找表：
+        - DU: lut_DU() 快速刷新，不额外等待
+        - GC: lut_GC() 全刷新
+        - FULL: 先刷白（display_NUM + lut_GC + refresh），再 GC 显示图像
+
         Args:
-            image: PIL Image 对象
+            image: PIL Image 对象或打包帧（打包帧直接发送，不经过 getbuffer）
+            waveform: 强制波形（可选）
 
         Returns:
             bool: 成功返回 True，失败返回 False
         """
         try:
             # 转换为墨水屏缓冲区
-            buffer = self.epd.getbuffer(image)
+            if is_frame(image):
+                buffer = bytes(image)
+            else:
+                with span("epd.getbuffer"):
+                    buffer = self.epd.getbuffer(image)
+            frame = bytes(buffer) if self.refresh_scheduler else None
+            plan = self._plan_refresh(frame, waveform)
+
+            if plan is not None and plan.waveform == WAVEFORM_NONE:
+                logger.info("✅ 画面未变化，跳过刷新")
+                self._record_refresh(plan, frame)
+                return True
+
+            if plan is not None and plan.waveform == WAVEFORM_FULL:
+                logger.debug("完整清屏：先刷白...")
+                with span("epd.spi_transfer"):
+                    self.epd.display_NUM(self.epd.WHITE)
+                with span("epd.lut_upload", lut="GC"):
+                    self.epd.lut_GC()
+                with span("epd.busy_wait"):
+                    self.epd.refresh()
 
             # 发送到屏幕
-            self.epd.display(buffer)
+            with span("epd.spi_transfer", size=len(buffer)):
+                self.epd.display(buffer)
             logger.debug("图像数据已发送")
 
-            # 关键：必须调用 refresh() 才能真正显示图像
-            self.epd.refresh()
+            # 加载刷新查找表（未配置调度器时沿用初始化时加载的 GC 表）
+            if plan is not None:
+                with span("epd.lut_upload", lut=plan.waveform):
+                    if plan.waveform == WAVEFORM_DU:
+                        self.epd.lut_DU()
+                    else:
+                        self.epd.lut_GC()
+
+            # 关键：必须调用 refresh() 才能真正显示图像（refresh() 内等待 BUSY 释放）
+            with span("epd.busy_wait"):
+                self.epd.refresh()
             logger.debug("刷新命令已发送")
 
-            # 等待刷新完成（墨水屏刷新需要时间）
-            time.sleep(2)
+            # 等待刷新完成（墨水屏刷新需要时间，DU 的 refresh() 已等待 BUSY 释放）
+            if plan is None or plan.waveform != WAVEFORM_DU:
+                with span("epd.settle_wait"):
+                    time.sleep(2)
 
-            logger.info("✅ 图像已显示至墨水屏")
+            self._record_refresh(plan, frame)
+            waveform_name = plan.waveform if plan is not None else "GC"
+            logger.info("✅ 图像已显示至墨水屏 (%s)", waveform_name)
             return True
 
         except Exception as e:
-            logger.error(f"❌ 硬件显示失败: {e}")
+            logger.error("❌ 硬件显示失败: %s", e)
             return False
 
-    def clear(self) -> bool:
+    def clear(self, priority: int = PRIORITY_SCHEDULED) -> bool:
         """
-        清屏（全白）
+        清屏（全白，阻塞直到完成）
+
+        Args:
+            priority: 命令优先级
 
         Returns:
             bool: 成功返回 True，失败返回 False
         """
+        return self._call(self._do_clear, priority)
+
+    def _do_clear(self) -> bool:
+        """在工作线程中清屏"""
         if self.is_mock:
             logger.info("📝 [Mock] 执行清屏")
+            self._reset_refresh_scheduler()
             return True
 
         if not self.is_initialized:
@@ -289,48 +574,166 @@ class EpaperDriver:
             return False
 
         try:
-            self.epd.init()  # 重新初始化以清屏
+            with span("epd.wake"):
+                self.epd.init()  # 重新初始化以清屏
             # 墨水屏通常有专门的 Clear 方法，但具体看驱动实现
-            # 这里我们通过发送全白图像来清屏
-            from PIL import Image
+            # 这里我们通过发送全白图像来清屏（直接调用硬件显示，不经过命令队列）
             white_image = Image.new('1', (self.width, self.height), 255)
-            self.display_image(white_image)
+            if not self._hardware_display(white_image,
+                                          WAVEFORM_FULL if self.refresh_scheduler else None):
+                return False
 
             logger.info("✅ 屏幕已清屏")
             return True
 
         except Exception as e:
-            logger.error(f"❌ 清屏失败: {e}")
+            logger.error("❌ 清屏失败: %s", e)
             return False
 
-    def sleep(self):
+    def sleep(self, priority: int = PRIORITY_MAINTENANCE):
         """
-        进入睡眠模式
+        进入睡眠模式（阻塞直到完成）
 
         重要：墨水屏不使用时应进入睡眠模式以节省功耗
+
+        Args:
+            priority: 命令优先级（默认排在已提交的显示请求之后）
         """
+        self._call(self._do_sleep, priority)
+
+    def _do_sleep(self):
+        """在工作线程中进入睡眠模式"""
         if self.is_mock:
             logger.info("📝 [Mock] 屏幕进入睡眠模式")
             return
 
         if self.epd:
             try:
-                self.epd.sleep()
+                with span("epd.sleep"):
+                    self.epd.sleep()
                 self.is_initialized = False
                 logger.info("✅ 硬件屏幕已进入睡眠模式")
             except Exception as e:
-                logger.error(f"❌ 睡眠模式设置失败: {e}")
+                logger.error("❌ 睡眠模式设置失败: %s", e)
+
+    def close(self, wait: bool = True):
+        """
+        让屏幕进入睡眠并停止工作线程
+
+        已提交的命令会先执行完毕。之后再调用任何操作会自动重启工作线程。
+
+        Args:
+            wait: 是否等待工作线程退出
+        """
+        with self._queue_lock:
+            worker, commands = self._worker, self._commands
+            if worker is None:
+                return
+
+            # 旧线程处理完旧队列后退出；之后的命令进入新队列
+            self._worker = None
+            self._retiring_worker = worker
+            self._commands = queue.PriorityQueue()
+            self._pending_display.clear()
+            commands.put(_Command(PRIORITY_MAINTENANCE, next(self._seq), self._do_close, ()))
+            commands.put(_Command(_PRIORITY_STOP, next(self._seq), None, ()))
+
+        if wait and worker is not threading.current_thread():
+            worker.join()
+
+    def _do_close(self):
+        """在工作线程中执行关闭前的睡眠"""
+        if self.is_initialized:
+            self._do_sleep()
+
+    # ========== 命令队列 ==========
+
+    def _ensure_worker(self):
+        """启动工作线程（调用方须持有 _queue_lock）"""
+        if self._worker is None or not self._worker.is_alive():
+            # close() 之后重新启动时，先等旧线程执行完剩余命令，保证硬件操作不重叠
+            retiring = self._retiring_worker
+            if retiring is not None and retiring is not threading.current_thread():
+                retiring.join()
+            self._retiring_worker = None
+
+            self._worker = threading.Thread(
+                target=_run_command_worker,
+                args=(self._commands,),
+                name="EpaperDriver",
+                daemon=True
+            )
+            self._worker.start()
+
+    def _submit(self, func: Callable, priority: int, args: tuple = (),
+                coalesce: bool = False) -> Future:
+        """
+        将硬件操作放入命令队列
+
+        Args:
+            func: 在工作线程中执行的方法
+            priority: 命令优先级
+            args: 位置参数
+            coalesce: 是否取代同一优先级中尚未执行的同类命令
+
+        Returns:
+            Future: 命令结果
+        """
+        command = _Command(priority, next(self._seq), func, args)
+
+        with self._queue_lock:
+            if coalesce:
+                previous = self._pending_display.get(priority)
+                if previous is not None and previous.future.cancel():
+                    hot_logger.debug("显示请求已被更新的请求取代 (优先级 %d)", priority, per_second=1)
+                self._pending_display[priority] = command
+                command.future.add_done_callback(
+                    lambda _, p=priority, c=command: self._forget_pending(p, c))
+
+            self._ensure_worker()
+            self._commands.put(command)
+
+        return command.future
+
+    def _forget_pending(self, priority: int, command: _Command):
+        """
+        显示命令完成后，从待合并表中移除
+
+        在工作线程中回调，不获取 _queue_lock（close() 可能持锁等待工作线程）
+        """
+        if self._pending_display.get(priority) is command:
+            self._pending_display.pop(priority, None)
+
+    def _call(self, func: Callable, priority: int, *args):
+        """
+        同步执行硬件操作
+
+        在工作线程内部调用时直接执行（避免自身等待死锁），
+        否则提交到命令队列并等待结果。
+        """
+        if threading.current_thread() is self._worker:
+            return func(*args)
+        return self._submit(func, priority, args).result()
 
     def __del__(self):
         """
         析构函数 - 确保资源清理
 
         注意：Python 不保证 __del__ 会被调用
-        建议显式调用 sleep() 方法
+        建议显式调用 close() 方法
+
+        析构可能发生在任意线程（例如垃圾回收时），因此这里不直接操作硬件，
+        而是把睡眠命令交给工作线程，排在正在进行的刷新之后执行。
         """
         try:
             if self.epd and self.is_initialized and not self.is_mock:
-                self.sleep()
+                worker = self._worker
+                if worker is not None and worker.is_alive():
+                    self._commands.put(_Command(PRIORITY_MAINTENANCE, next(self._seq),
+                                                self.epd.sleep, ()))
+                    self._commands.put(_Command(_PRIORITY_STOP, next(self._seq), None, ()))
+                else:
+                    self.epd.sleep()
         except:
             pass  # 析构中忽略所有错误
 
@@ -345,19 +748,22 @@ class EpaperDriver:
         """
         上下文管理器出口 - 自动清理资源
         """
-        self.sleep()
+        self.close()
         return False
 
 
 # 便捷函数
-def create_driver(lib_path: Optional[str] = None) -> EpaperDriver:
+def create_driver(lib_path: Optional[str] = None, config=None) -> EpaperDriver:
     """
     创建墨水屏驱动实例
 
     Args:
         lib_path: 可选的库路径
+        config: 可选的配置对象（提供时按 refresh 节启用刷新调度）
 
     Returns:
         EpaperDriver: 驱动实例
     """
-    return EpaperDriver(lib_path)
+    refresh_scheduler = create_refresh_scheduler(config) if config is not None else None
+
+    return EpaperDriver(lib_path, refresh_scheduler=refresh_scheduler)
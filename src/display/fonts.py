@@ -15,7 +15,11 @@ from typing import Optional, Tuple
 from PIL import ImageFont
 from pathlib import Path
 
+from utils.hotlog import HOT_DEBUG, get_hot_logger
+from utils.tracing import span
+
 logger = logging.getLogger(__name__)
+hot_logger = get_hot_logger(__name__)
 
 
 class FontManager:
@@ -69,9 +73,12 @@ class FontManager:
 
         # 检查缓存
         cache_key = (font_path, size)
-        if cache_key in self._cache:
-            logger.debug(f"从缓存获取字体: {Path(font_path).name} {size}px")
-            return self._cache[cache_key]
+        font = self._cache.get(cache_key)
+        if font is not None:
+            # 排版时每次字号试探都会取字体，只在热路径调试开启时记录
+            if HOT_DEBUG:
+                hot_logger.debug("从缓存获取字体: %s %dpx", font_path, size, per_second=5)
+            return font
 
         # 加载字体
         font = self._load_font(font_path, size)
@@ -117,8 +124,9 @@ class FontManager:
         """
         # 尝试加载指定字体
         try:
-            font = ImageFont.truetype(font_path, size)
-            logger.debug(f"✅ 字体加载成功: {Path(font_path).name} {size}px")
+            with span("font.load", size=size):
+                font = ImageFont.truetype(font_path, size)
+            logger.debug("✅ 字体加载成功: %s %dpx", font_path, size)
             return font
         except OSError as e:
             logger.warning(f"⚠️  字体加载失败: {font_path} - {e}")
@@ -127,7 +135,8 @@ class FontManager:
             if font_path != self.font_file_fallback:
                 logger.info(f"📝 尝试回退字体: {self.font_file_fallback}")
                 try:
-                    font = ImageFont.truetype(self.font_file_fallback, size)
+                    with span("font.load", size=size):
+                        font = ImageFont.truetype(self.font_file_fallback, size)
                     logger.info(f"✅ 回退字体加载成功: {Path(self.font_file_fallback).name}")
                     return font
                 except OSError as e2:
@@ -194,6 +203,42 @@ class FontManager:
         _, height = self.measure_text("测试ABC", font)
         return height
 
+    def get_identity(self) -> tuple:
+        """
+        字体文件标识（路径、修改时间、大小），字体文件被替换后随之变化
+
+        Returns:
+            tuple: ((路径, mtime_ns, 大小), ...)，文件不存在时 mtime/大小为 None
+        """
+        identity = []
+        for path in (self.font_file, self.font_file_fallback):
+            try:
+                stat = Path(path).stat()
+                identity.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                identity.append((path, None, None))
+        return tuple(identity)
+
+    def reconfigure(self, font_file: str, font_file_fallback: str) -> bool:
+        """
+        切换字体文件（配置热加载时调用）
+
+        Args:
+            font_file: 主字体文件路径
+            font_file_fallback: 回退字体路径
+
+        Returns:
+            bool: 字体文件是否变化（变化时清空字体缓存）
+        """
+        if (font_file, font_file_fallback) == (self.font_file, self.font_file_fallback):
+            return False
+
+        self.font_file = font_file
+        self.font_file_fallback = font_file_fallback
+        self.clear_cache()
+        self._validate_fonts()
+        return True
+
     def clear_cache(self):
         """清空字体缓存"""
         self._cache.clear()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+帧缓冲区工具
+在 PIL 图像与墨水屏打包帧（1-bpp，行优先，高位在前，1=白）之间转换，
+并提供不经过 PIL 图像、直接在打包帧上绘制矩形和文字的帧缓冲区
+
+竖屏（图像尺寸与面板一致）时，打包帧与 waveshare getbuffer() 的输出逐字节相同，
+可以直接交给 epd.display()，跳过 getbuffer() 的逐像素循环。
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .layout_engine import LayoutEngine
+
+# 打包帧类型
+Frame = Union[bytes, bytearray]
+
+
+def frame_size(width: int, height: int) -> int:
+    """打包帧的字节数"""
+    return (width + 7) // 8 * height
+
+
+def is_frame(data) -> bool:
+    """判断是否为打包帧（而非 PIL 图像）"""
+    return isinstance(data, (bytes, bytearray, memoryview))
+
+
+def pack_image(image: Image.Image) -> bytes:
+    """
+    将图像打包为 1-bpp 帧
+
+    Args:
+        image: PIL Image 对象
+
+    Returns:
+        bytes: 打包帧
+    """
+    return image.convert('1').tobytes()
+
+
+def unpack_frame(frame: Frame, width: int, height: int) -> Image.Image:
+    """
+    将打包帧还原为 '1' 模式图像（用于 Mock 模式保存和调试导出）
+
+    Args:
+        frame: 打包帧
+        width: 宽度
+        height: 高度
+
+    Returns:
+        Image.Image: '1' 模式图像
+    """
+    if len(frame) != frame_size(width, height):
+        raise ValueError(f"帧大小不匹配: {len(frame)} != {frame_size(width, height)}")
+    return Image.frombytes('1', (width, height), bytes(frame))
+
+
+class FrameBuffer:
+    """
+    打包帧缓冲区
+
+    每行保存为一个整数（最高位为最左像素，1 表示黑色墨水），
+    绘制文字和矩形都是整行的位运算；to_bytes() 输出面板顺序的打包帧（1=白）。
+    """
+
+    def __init__(self, width: int, height: int, rows: Optional[List[int]] = None):
+        """
+        Args:
+            width: 宽度
+            height: 高度
+            rows: 初始行数据（None 表示全白）
+        """
+        self.width = width
+        self.height = height
+        self.stride = (width + 7) // 8
+        self._row_bits = self.stride * 8
+        self._full = (1 << self._row_bits) - 1
+        # 可见像素位（行尾补齐位与 PIL 一致，保持为 0）
+        self._visible = ((1 << width) - 1) << (self._row_bits - width)
+        self.rows = list(rows) if rows is not None else [0] * height
+
+    @classmethod
+    def from_image(cls, image: Image.Image) -> 'FrameBuffer':
+        """从 PIL 图像创建（用于预渲染的模板）"""
+        fb = cls(*image.size)
+        fb.load_frame(pack_image(image))
+        return fb
+
+    def load_frame(self, frame: Frame):
+        """载入打包帧"""
+        stride = self.stride
+        visible = self._visible
+        self.rows = [
+            ~int.from_bytes(frame[i:i + stride], 'big') & visible
+            for i in range(0, stride * self.height, stride)
+        ]
+
+    def copy(self) -> 'FrameBuffer':
+        """复制缓冲区"""
+        return FrameBuffer(self.width, self.height, self.rows)
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, fill: int = 0):
+        """
+        填充矩形（含边界，与 ImageDraw.rectangle 一致）
+
+        Args:
+            x0, y0, x1, y1: 左上角与右下角坐标
+            fill: 颜色（0=黑，255=白）
+        """
+        x0, x1 = max(x0, 0), min(x1, self.width - 1)
+        y0, y1 = max(y0, 0), min(y1, self.height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+
+        mask = ((1 << (x1 - x0 + 1)) - 1) << (self._row_bits - 1 - x1)
+        rows = self.rows
+        if fill:
+            mask = ~mask
+            for y in range(y0, y1 + 1):
+                rows[y] &= mask
+        else:
+            for y in range(y0, y1 + 1):
+                rows[y] |= mask
+
+    def blit(self, bitmap: List[int], bitmap_width: int, x: int, y: int, fill: int = 0):
+        """
+        按位图遮罩绘制（位图每行一个整数，最高位为最左像素，1 为笔画）
+
+        Args:
+            bitmap: 位图行数据
+            bitmap_width: 位图宽度
+            x: 左上角 X 坐标
+            y: 左上角 Y 坐标
+            fill: 颜色（0=黑，255=白）
+        """
+        shift = self._row_bits - x - bitmap_width
+        full = self._full
+        rows = self.rows
+        first = max(0, -y)
+        last = min(len(bitmap), self.height - y)
+
+        for r in range(first, last):
+            bits = bitmap[r] << shift if shift >= 0 else bitmap[r] >> -shift
+            bits &= full
+            if fill:
+                rows[y + r] &= ~bits
+            else:
+                rows[y + r] |= bits
+
+    def to_bytes(self) -> bytes:
+        """输出打包帧（1=白）"""
+        visible = self._visible
+        stride = self.stride
+        return b''.join((~row & visible).to_bytes(stride, 'big') for row in self.rows)
+
+    def to_image(self) -> Image.Image:
+        """导出为 '1' 模式图像（调试用）"""
+        return unpack_frame(self.to_bytes(), self.width, self.height)
+
+
+class GlyphCache:
+    """
+    字形位图缓存
+
+    每个（字体, 字符）只光栅化一次，之后按累计宽度直接拼接到帧缓冲区。
+    度量使用单色（'1'）模式，与在 '1' 模式画布上 ImageDraw.text 的字形位置一致：
+    字形按行内位置缓存，行首字符另有整行平移量。
+    """
+
+    def __init__(self):
+        # {(字体标识, 字符): (位图行, 位图宽度, x 偏移, y 偏移, 前进宽度, 行首平移)}
+        self._glyphs: Dict[Tuple[tuple, str], Tuple[List[int], int, int, int, float, int]] = {}
+
+    def draw_text(self, fb: FrameBuffer, text: str, font: ImageFont.FreeTypeFont,
+                  x: int, y: int, fill: int = 0):
+        """
+        在帧缓冲区上绘制单行文字
+
+        Args:
+            fb: 帧缓冲区
+            text: 文字
+            font: 字体对象
+            x: 左边界
+            y: 文字顶部（与 ImageDraw.text 的默认锚点一致）
+            fill: 颜色（0=黑，255=白）
+        """
+        if not text:
+            return
+
+        font_key = LayoutEngine.font_key(font)
+        x += self._get_glyph(font_key, font, text[0])[5]
+        pen = 0.0
+        for char in text:
+            bitmap, width, dx, dy, advance, _ = self._get_glyph(font_key, font, char)
+            if bitmap:
+                fb.blit(bitmap, width, x + int(pen) + dx, y + dy, fill)
+            pen += advance
+
+    def _get_glyph(self, font_key: tuple, font: ImageFont.FreeTypeFont,
+                   char: str) -> Tuple[List[int], int, int, int, float, int]:
+        """获取字形位图（首次使用时光栅化）"""
+        key = (font_key, char)
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            return glyph
+
+        advance = font.getlength(char, mode='1')
+        bitmap, width, dx, dy, shift = [], 0, 0, 0, 0
+
+        # 前面加一个空格光栅化，得到字形在行内时相对笔位置的位图
+        lead = font.getlength(' ', mode='1')
+        origin = font.size
+        canvas = (int(lead + advance) + 3 * font.size, 3 * font.size)
+        mask = Image.new('1', canvas, 0)
+        ImageDraw.Draw(mask).text((origin, origin), ' ' + char, font=font, fill=1)
+        box = mask.getbbox()
+
+        if box is not None:
+            left, top, right, bottom = box
+            width = right - left
+            stride = (width + 7) // 8
+            pad = stride * 8 - width
+            data = mask.crop(box).tobytes()
+            bitmap = [int.from_bytes(data[i:i + stride], 'big') >> pad
+                      for i in range(0, stride * (bottom - top), stride)]
+            dx = left - origin - int(lead)
+            dy = top - origin
+
+            # 单独绘制时的位置差即为该字符位于行首时的整行平移量
+            alone = Image.new('1', canvas, 0)
+            ImageDraw.Draw(alone).text((origin, origin), char, font=font, fill=1)
+            shift = alone.getbbox()[0] - origin - dx
+
+        glyph = (bitmap, width, dx, dy, advance, shift)
+        self._glyphs[key] = glyph
+        return glyph
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
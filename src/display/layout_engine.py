@@ -5,16 +5,131 @@
 
 功能：
 - 智能自动换行（支持中英文）
+- 增量换行：逐字符宽度只测量一次，按累计宽度数组二分查找断行点
+- 超长不可断单词（URL、哈希等）按字符强制断行
+- 查表式字符分类（支持汉字、假名、谚文及 CJK 标点避头尾）
+- 换行结果 LRU 缓存（重复渲染同一篇文章时跳过换行）
+- 行区间（LineSpan）表示：只记录源文本偏移和宽度，不复制字符串
+- 单次排版结果（TextBlock）：行、行宽、总尺寸、截断标记、基线一次算出
+- 自适应字号：二分查找能放入区域的最大字号
 - 文本截断和省略
 - 布局计算
 - 文本块高度计算
 """
 
+import hashlib
 import logging
-from typing import List, Tuple, Optional
+import sys
+import time
+import weakref
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, chain
+from typing import Callable, List, Tuple, Optional, Dict, Sequence
 from PIL import ImageFont
 
+try:
+    import numpy as np
+except ImportError:  # NumPy 是可选依赖，缺失时使用 array('d')
+    np = None
+
+from utils.hotlog import HOT_DEBUG, get_hot_logger
+
+from .cache import LRUCache, estimate_size
+from .char_classes import (
+    iter_runs, is_east_asian, CLASS_SPACE, CLASS_IDEOGRAPHIC, CLASS_OPEN, CLASS_CLOSE
+)
+
 logger = logging.getLogger(__name__)
+hot_logger = get_hot_logger(__name__)
+
+# 换行模式
+WRAP_MODE_LEGACY = "legacy"            # 逐字符拼接并重新测量整行（原算法，保留用于对比）
+WRAP_MODE_INCREMENTAL = "incremental"  # 累计宽度数组 + 二分查找断行点
+
+# 浮点累加误差容差（像素）
+_WIDTH_EPSILON = 1e-3
+
+# 强制断行/截断时，真实宽度校验的最大回退次数（限制测量开销）
+_MAX_VERIFY_STEPS = 8
+
+
+class LineSpan:
+    """
+    换行结果中的一行：源文本偏移区间 + 宽度
+
+    只保存偏移，绘制时再从源文本切片，避免换行过程中反复拼接字符串。
+    缓存中的实例会被共享，视为不可变对象。
+    """
+
+    __slots__ = ('start', 'end', 'width', 'suffix')
+
+    def __init__(self, start: int, end: int, width: float, suffix: str = ""):
+        """
+        Args:
+            start: 起始偏移
+            end: 结束偏移（不含）
+            width: 行宽（像素，含后缀）
+            suffix: 追加在行尾的文本（截断时的省略号）
+        """
+        self.start = start
+        self.end = end
+        self.width = width
+        self.suffix = suffix
+
+    def text_of(self, source: str) -> str:
+        """从源文本取出本行内容（含后缀）"""
+        line = source[self.start:self.end]
+        return line + self.suffix if self.suffix else line
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LineSpan):
+            return NotImplemented
+        return (self.start, self.end, self.width, self.suffix) == \
+            (other.start, other.end, other.width, other.suffix)
+
+    def __repr__(self) -> str:
+        suffix = f", suffix={self.suffix!r}" if self.suffix else ""
+        return f"LineSpan({self.start}, {self.end}, width={self.width:.1f}{suffix})"
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """
+    文本块排版结果（一次换行得到的全部度量）
+
+    行的纵向位置与渲染器一致：第 i 行顶部位于 i × line_pitch，
+    基线位于顶部 + 字体上升高度。
+    """
+    text: str
+    spans: Tuple[LineSpan, ...]
+    width: float          # 最宽一行的宽度
+    height: int           # 行数 × 行高 × 行距（与 calculate_text_height 一致）
+    line_height: int      # 单行高度
+    line_pitch: int       # 相邻两行顶部的间距
+    baselines: Tuple[int, ...]
+    truncated: bool = False
+
+    @property
+    def lines(self) -> List[str]:
+        """每行文本（截断行含省略号）"""
+        return [span.text_of(self.text) for span in self.spans]
+
+    @property
+    def widths(self) -> List[float]:
+        """每行宽度"""
+        return [span.width for span in self.spans]
+
+    @property
+    def tops(self) -> List[int]:
+        """每行顶部相对文本块顶部的偏移"""
+        return [i * self.line_pitch for i in range(len(self.spans))]
+
+    @property
+    def advance(self) -> int:
+        """逐行绘制后光标下移的距离"""
+        return len(self.spans) * self.line_pitch
 
 
 class LayoutEngine:
@@ -28,14 +143,34 @@ class LayoutEngine:
     # 省略号符号
     ELLIPSIS = "..."
 
-    def __init__(self, line_spacing: float = 1.2):
+    def __init__(self, line_spacing: float = 1.2,
+                 wrap_mode: str = WRAP_MODE_INCREMENTAL,
+                 break_long_words: bool = True,
+                 cache_size: int = 512,
+                 cache_max_bytes: Optional[int] = 2 * 1024 * 1024):
         """
         初始化排版引擎
 
         Args:
             line_spacing: 行距倍数（默认 1.2）
+            wrap_mode: 换行模式（'incremental' 或 'legacy'）
+            break_long_words: 是否在字符边界强制拆分超过 max_width 的单词
+                （仅 incremental 模式；legacy 模式保持原行为，超长单词独占一行）
+            cache_size: 换行结果缓存的最大条目数（0 表示禁用）
+            cache_max_bytes: 换行结果缓存的内存上限（字节）
         """
+        if wrap_mode not in (WRAP_MODE_LEGACY, WRAP_MODE_INCREMENTAL):
+            raise ValueError(f"无效的换行模式: {wrap_mode}")
+
         self.line_spacing = line_spacing
+        self.wrap_mode = wrap_mode
+        self.break_long_words = break_long_words
+
+        # 字符宽度表: {font: {char: advance}}（字体被释放时自动清除）
+        self._advance_tables = weakref.WeakKeyDictionary()
+
+        # 换行结果缓存: {(文本摘要, 字体标识, max_width, max_lines, ...): 结果}
+        self._wrap_cache = LRUCache(max_entries=cache_size, max_bytes=cache_max_bytes)
 
     def wrap_text(self, text: str, font: ImageFont.FreeTypeFont,
                   max_width: int) -> List[str]:
@@ -53,9 +188,130 @@ class LayoutEngine:
         Returns:
             List[str]: 换行后的文本列表
         """
+        return [span.text_of(text) for span in self.wrap_spans(text, font, max_width)]
+
+    def wrap_spans(self, text: str, font: ImageFont.FreeTypeFont,
+                   max_width: int) -> List[LineSpan]:
+        """
+        自动换行，返回行区间（不复制文本）
+
+        Args:
+            text: 要换行的文本
+            font: 字体对象
+            max_width: 最大宽度（像素）
+
+        Returns:
+            List[LineSpan]: 每行在 text 中的偏移区间及宽度
+        """
         if not text:
             return []
 
+        key = self._cache_key(text, font, max_width)
+        spans = self._wrap_cache.get(key)
+        if spans is None:
+            if self.wrap_mode == WRAP_MODE_LEGACY:
+                spans = self._spans_from_lines(text, font,
+                                               self._wrap_text_legacy(text, font, max_width))
+            else:
+                spans = self._wrap_spans_incremental(text, font, max_width)
+            spans = tuple(spans)
+            self._wrap_cache.put(key, spans)
+
+        return list(spans)
+
+    def _wrap_spans_incremental(self, text: str, font: ImageFont.FreeTypeFont,
+                                max_width: int) -> List[LineSpan]:
+        """
+        增量换行（近似线性时间）
+
+        1. 每个不同字符的宽度只测量一次，构建累计宽度数组
+        2. 按字符分类逐段找出所有断行机会（空格之后、表意字符前后，遵守避头尾）
+        3. 对断行机会处的累计宽度二分查找每行的最远断点
+        4. 用真实宽度（含字距调整）校验每行，超宽时回退一个断点
+
+        断行规则与原算法一致：单词与其后的空格为一个单位，表意字符各自为一个单位
+        （闭合标点附着在前一单位上，开括号附着在后一单位上）。
+        单个单位超过 max_width 时：break_long_words 为 True 则在字符边界强制断行
+        （同样通过累计宽度二分查找，测量次数有上限），否则独占一行。
+
+        Args:
+            text: 要换行的文本
+            font: 字体对象
+            max_width: 最大宽度（像素）
+
+        Returns:
+            List[LineSpan]: 换行后的行区间（宽度为真实测量值；强制断行处为累计宽度）
+        """
+        cumulative = self._cumulative_advances(text, font)
+
+        # 如果文本很短，不需要换行（先用累计宽度粗筛，避免测量整段长文本）
+        if cumulative[-1] <= max_width * 2:
+            width = self._get_text_width(text, font)
+            if width <= max_width:
+                return [LineSpan(0, len(text), width)]
+
+        breaks = self._break_opportunities(text)
+
+        # 断行机会处的累计宽度（单调递增，紧凑数组，不装箱为 float 对象）
+        if np is not None:
+            break_widths = array('d', cumulative[np.asarray(breaks)].tobytes())
+        else:
+            break_widths = array('d', (cumulative[i] for i in breaks))
+
+        spans = []
+        length = len(text)
+        pos = 0  # 当前行起点（强制断行后可能位于单位中间）
+        j = 0    # 满足 breaks[j] <= pos < breaks[j + 1] 的断行机会索引
+
+        while pos < length:
+            limit = cumulative[pos] + max_width + _WIDTH_EPSILON
+
+            # 最远的、使本行宽度不超过 max_width 的断点
+            k = bisect_right(break_widths, limit, j + 1) - 1
+            if k > j:
+                # 校验真实宽度（字距调整可能使整行略宽于逐字累加）
+                width = self._get_text_width(text[pos:breaks[k]], font)
+                while width > max_width and k > j + 1:
+                    k -= 1
+                    width = self._get_text_width(text[pos:breaks[k]], font)
+
+                if width <= max_width or not self.break_long_words:
+                    spans.append(LineSpan(pos, breaks[k], width))
+                    pos = breaks[k]
+                    j = k
+                    continue
+
+            # 当前单位本身已超宽
+            end = breaks[j + 1]
+            if not self.break_long_words:
+                # 独占一行
+                spans.append(LineSpan(pos, end, self._get_text_width(text[pos:end], font)))
+                pos = end
+                j += 1
+                continue
+
+            # 在字符边界强制断行
+            cut = self._fit_prefix(text, font, cumulative, pos, end, max_width)
+            spans.append(LineSpan(pos, cut, float(cumulative[cut] - cumulative[pos])))
+            pos = cut
+            if pos == end:
+                j += 1
+
+        return spans
+
+    def _wrap_text_legacy(self, text: str, font: ImageFont.FreeTypeFont,
+                          max_width: int) -> List[str]:
+        """
+        原换行算法：逐字符拼接并重新测量整行
+
+        Args:
+            text: 要换行的文本
+            font: 字体对象
+            max_width: 最大宽度（像素）
+
+        Returns:
+            List[str]: 换行后的文本列表
+        """
         # 如果文本很短，不需要换行
         if self._get_text_width(text, font) <= max_width:
             return [text]
@@ -135,30 +391,103 @@ class LayoutEngine:
         Returns:
             str: 截断后的文本
         """
+        spans = self.truncate_spans(text, font, max_width, max_lines, add_ellipsis)
+        return "\n".join(span.text_of(text) for span in spans)
+
+    def truncate_spans(self, text: str, font: ImageFont.FreeTypeFont,
+                       max_width: int, max_lines: int,
+                       add_ellipsis: bool = True) -> List[LineSpan]:
+        """
+        截断文本，返回行区间（最后一行的省略号记录在 suffix 中）
+
+        Args:
+            text: 原始文本
+            font: 字体对象
+            max_width: 最大宽度（像素）
+            max_lines: 最大行数
+            add_ellipsis: 是否添加省略号
+
+        Returns:
+            List[LineSpan]: 截断后的行区间
+        """
         if not text:
-            return ""
+            return []
+
+        return list(self.layout_block(text, font, max_width, max_lines, add_ellipsis).spans)
 
-        # 先换行
-        lines = self.wrap_text(text, font, max_width)
+    def layout_block(self, text: str, font: ImageFont.FreeTypeFont, max_width: int,
+                     max_lines: Optional[int] = None,
+                     add_ellipsis: bool = True) -> TextBlock:
+        """
+        一次完成换行、截断和尺寸计算
 
-        # 如果行数未超限，直接返回
-        if len(lines) <= max_lines:
-            return "\n".join(lines)
+        Args:
+            text: 文本内容
+            font: 字体对象
+            max_width: 最大宽度（像素）
+            max_lines: 最大行数（None 表示不限制）
+            add_ellipsis: 截断时是否在最后一行添加省略号
 
-        # 需要截断
-        visible_lines = lines[:max_lines]
+        Returns:
+            TextBlock: 排版结果
+        """
+        key = self._cache_key(text, font, max_width, max_lines, add_ellipsis, 'block')
+        block = self._wrap_cache.get(key)
+        if block is None:
+            block = self._layout_block(text, font, max_width, max_lines, add_ellipsis)
+            self._wrap_cache.put(key, block,
+                                 size=sys.getsizeof(block) + estimate_size(block.spans))
+
+        return block
+
+    def _layout_block(self, text: str, font: ImageFont.FreeTypeFont, max_width: int,
+                      max_lines: Optional[int], add_ellipsis: bool) -> TextBlock:
+        """排版文本块（不经过缓存）"""
+        spans = self.wrap_spans(text, font, max_width)
+
+        truncated = max_lines is not None and len(spans) > max_lines
+        if truncated:
+            spans = self._clip_spans(text, font, spans, max_width, max_lines, add_ellipsis)
+
+        line_height = self.font_height(font)
+        line_pitch = int(line_height * self.line_spacing)
+        ascent = font.getmetrics()[0] if hasattr(font, 'getmetrics') else line_height
+
+        return TextBlock(
+            text=text,
+            spans=tuple(spans),
+            width=max((span.width for span in spans), default=0),
+            height=int(len(spans) * line_height * self.line_spacing),
+            line_height=line_height,
+            line_pitch=line_pitch,
+            baselines=tuple(i * line_pitch + ascent for i in range(len(spans))),
+            truncated=truncated,
+        )
+
+    def _clip_spans(self, text: str, font: ImageFont.FreeTypeFont, spans: List[LineSpan],
+                    max_width: int, max_lines: int, add_ellipsis: bool) -> List[LineSpan]:
+        """保留前 max_lines 行，并在最后一行放入省略号"""
+        visible = spans[:max_lines]
 
         if add_ellipsis and max_lines > 0:
             # 处理最后一行，添加省略号
-            last_line = visible_lines[-1]
+            last = visible[-1]
+            last_line = text[last.start:last.end]
+            ellipsis_width = self._get_text_width(self.ELLIPSIS, font)
 
-            # 逐步缩短最后一行，直到省略号能放下
-            while self._get_text_width(last_line + self.ELLIPSIS, font) > max_width and len(last_line) > 0:
-                last_line = last_line[:-1]
+            # 按累计宽度直接定位能放下省略号的位置（避免逐字符缩短再测量）
+            available = max_width - ellipsis_width
+            cut, width = len(last_line), last.width
+            if self._get_text_width(last_line, font) > available:
+                cumulative = self._cumulative_advances(last_line, font)
+                cut = self._fit_prefix(last_line, font, cumulative, 0, len(last_line),
+                                       available, allow_empty=True)
+                width = float(cumulative[cut])
 
-            visible_lines[-1] = last_line + self.ELLIPSIS
+            visible[-1] = LineSpan(last.start, last.start + cut, width + ellipsis_width,
+                                   self.ELLIPSIS)
 
-        return "\n".join(visible_lines)
+        return visible
 
     def calculate_text_height(self, text: str, font: ImageFont.FreeTypeFont,
                              max_width: int) -> int:
@@ -176,17 +505,8 @@ class LayoutEngine:
         if not text:
             return 0
 
-        lines = self.wrap_text(text, font, max_width)
-        if not lines:
-            return 0
-
-        # 单行高度
-        line_height = self._get_font_height(font)
-
         # 总高度 = 行数 × 行高 × 行距
-        total_height = len(lines) * line_height * self.line_spacing
-
-        return int(total_height)
+        return self.layout_block(text, font, max_width).height
 
     def calculate_max_lines(self, available_height: int,
                            font: ImageFont.FreeTypeFont) -> int:
@@ -203,7 +523,7 @@ class LayoutEngine:
         if available_height <= 0:
             return 0
 
-        line_height = self._get_font_height(font)
+        line_height = self.font_height(font)
         adjusted_line_height = line_height * self.line_spacing
 
         max_lines = int(available_height / adjusted_line_height)
@@ -228,12 +548,12 @@ class LayoutEngine:
         if max_width is None:
             max_width = container_width
 
-        # 换行
-        lines = self.wrap_text(text, font, max_width)
-
-        # 计算文本块尺寸
-        text_width = max(self._get_text_width(line, font) for line in lines) if lines else 0
-        text_height = self.calculate_text_height(text, font, max_width)
+        # 计算文本块尺寸（一次换行）
+        if text:
+            block = self.layout_block(text, font, max_width)
+            text_width, text_height = block.width, block.height
+        else:
+            text_width, text_height = 0, 0
 
         # 计算居中位置
         x = int((container_width - text_width) / 2)
@@ -264,64 +584,114 @@ class LayoutEngine:
         max_lines = self.calculate_max_lines(area_height, font)
 
         # 截断文本
-        return self.truncate_text(text, font, area_width, max_lines, add_ellipsis)
+        return "\n".join(self.layout_block(text, font, area_width, max_lines, add_ellipsis).lines)
 
-    # ========== 私有辅助方法 ==========
-
-    @staticmethod
-    def _is_cjk(char: str) -> bool:
+    def fit_best_size(self, text: str, area: Tuple[int, int],
+                      min_size: int, max_size: int,
+                      get_font: Callable[[int], ImageFont.FreeTypeFont],
+                      deadline: Optional[float] = None) -> Tuple[int, TextBlock]:
         """
-        判断字符是否为中日韩（CJK）字符
+        二分查找能完整放入区域的最大字号
+
+        每次试探复用该字号字体的字符宽度表（字体由 get_font 缓存，宽度表随字体保留），
+        先用累计宽度估算行数下限，明显放不下时无需换行。
 
         Args:
-            char: 单个字符
+            text: 文本内容
+            area: 区域 (宽, 高)
+            min_size: 最小字号
+            max_size: 最大字号
+            get_font: 按字号获取字体的函数（如 FontManager.get_font）
+            deadline: 截止时间（time.perf_counter() 时刻），超时后停止查找
 
         Returns:
-            bool: 是否为 CJK 字符
+            (size, block): 选定字号及其排版结果；
+            没有字号能完整放入（或未找到前已超时）时返回 min_size 的截断结果
         """
-        # CJK 统一表意文字范围
-        code = ord(char)
+        area_width, area_height = area
+        best = None
+        lo, hi = min_size, max_size
+        probes = 0
+
+        while lo <= hi:
+            if deadline is not None and time.perf_counter() > deadline:
+                logger.debug("字号查找超时: %d 次试探", probes)
+                break
+
+            size = (lo + hi) // 2
+            block = self._probe_size(text, get_font(size), area_width, area_height)
+            probes += 1
+            if HOT_DEBUG:
+                hot_logger.debug("字号试探: %dpx %s", size, "放得下" if block is not None else "放不下",
+                                 every=10)
+
+            if block is not None:
+                best = (size, block)
+                lo = size + 1
+            else:
+                hi = size - 1
 
-        # CJK Unified Ideographs
-        if 0x4E00 <= code <= 0x9FFF:
-            return True
+        if best is not None:
+            return best
 
-        # CJK Extension A
-        if 0x3400 <= code <= 0x4DBF:
-            return True
+        font = get_font(min_size)
+        max_lines = self.calculate_max_lines(area_height, font)
+        return min_size, self.layout_block(text, font, area_width, max_lines, add_ellipsis=True)
 
-        # CJK Extension B-F
-        if 0x20000 <= code <= 0x2EBEF:
-            return True
+    def _probe_size(self, text: str, font: ImageFont.FreeTypeFont,
+                    area_width: int, area_height: int) -> Optional[TextBlock]:
+        """
+        试探字号：文本能完整放入区域时返回排版结果，否则返回 None
 
-        # 全角标点
-        if 0xFF00 <= code <= 0xFFEF:
-            return True
+        Args:
+            text: 文本内容
+            font: 待试探字号的字体
+            area_width: 区域宽度
+            area_height: 区域高度
 
-        return False
+        Returns:
+            Optional[TextBlock]: 排版结果
+        """
+        max_lines = self.calculate_max_lines(area_height, font)
+
+        # 总宽度超过全部行容量时一定放不下（行数下限估算，不换行）
+        if text and self._cumulative_advances(text, font)[-1] > area_width * max_lines + _WIDTH_EPSILON:
+            return None
+
+        block = self.layout_block(text, font, area_width, max_lines)
+        if block.truncated or block.width > area_width:
+            return None
+        return block
+
+    def get_cache_info(self) -> dict:
+        """获取换行结果缓存信息（命中/未命中/淘汰计数、内存占用）"""
+        return self._wrap_cache.get_stats()
+
+    def clear_cache(self):
+        """清空换行结果缓存和字符宽度表"""
+        self._wrap_cache.clear()
+        self._advance_tables.clear()
+        logger.debug("排版缓存已清空")
 
     @staticmethod
-    def _get_text_width(text: str, font: ImageFont.FreeTypeFont) -> float:
+    def font_key(font: ImageFont.FreeTypeFont) -> tuple:
         """
-        获取文本宽度（兼容不同 PIL 版本）
+        字体标识（字体文件、字号、字体索引）
 
         Args:
-            text: 文本内容
             font: 字体对象
 
         Returns:
-            float: 文本宽度
+            tuple: 可哈希的字体标识
         """
-        try:
-            # 新版 PIL (>= 10.0.0) 推荐使用
-            return font.getlength(text)
-        except AttributeError:
-            # 旧版 PIL
-            width, _ = font.getsize(text)
-            return float(width)
+        path = getattr(font, 'path', None)
+        if path is None:
+            # PIL 默认字体等没有文件路径的字体，按对象区分
+            return ('id', id(font))
+        return (path, getattr(font, 'size', None), getattr(font, 'index', 0))
 
     @staticmethod
-    def _get_font_height(font: ImageFont.FreeTypeFont) -> int:
+    def font_height(font: ImageFont.FreeTypeFont) -> int:
         """
         获取字体高度（兼容不同 PIL 版本）
 
@@ -340,15 +710,216 @@ class LayoutEngine:
             _, height = font.getsize("测试ABC")
             return height
 
+    # ========== 私有辅助方法 ==========
+
+    def _cache_key(self, text: str, font: ImageFont.FreeTypeFont,
+                   max_width: int, max_lines: Optional[int] = None, *extra) -> tuple:
+        """
+        构建排版缓存键: (文本摘要, 字体标识, max_width, max_lines, ...)
+
+        Args:
+            text: 文本内容
+            font: 字体对象
+            max_width: 最大宽度
+            max_lines: 最大行数（None 表示不限制）
+            extra: 其他影响结果的参数
+
+        Returns:
+            tuple: 缓存键
+        """
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        return (digest, self.font_key(font), max_width, max_lines,
+                self.wrap_mode, self.break_long_words) + extra
+
+    def _spans_from_lines(self, text: str, font: ImageFont.FreeTypeFont,
+                          lines: List[str]) -> List[LineSpan]:
+        """
+        将逐行文本转换为行区间（各行按顺序拼接即为原文）
+
+        Args:
+            text: 原文
+            font: 字体对象
+            lines: 换行后的文本列表
+
+        Returns:
+            List[LineSpan]: 行区间
+        """
+        spans = []
+        pos = 0
+        for line in lines:
+            spans.append(LineSpan(pos, pos + len(line), self._get_text_width(line, font)))
+            pos += len(line)
+        return spans
+
+    def _get_advance_table(self, font: ImageFont.FreeTypeFont, text: str) -> Dict[str, float]:
+        """
+        获取字体的字符宽度表，并补齐 text 中尚未测量的字符
+
+        Args:
+            font: 字体对象
+            text: 需要测量的文本
+
+        Returns:
+            Dict[str, float]: {字符: 宽度}
+        """
+        table = self._advance_tables.get(font)
+        if table is None:
+            table = {}
+            self._advance_tables[font] = table
+
+        for char in set(text).difference(table):
+            table[char] = self._get_text_width(char, font)
+
+        return table
+
+    def _cumulative_advances(self, text: str, font: ImageFont.FreeTypeFont) -> Sequence[float]:
+        """
+        构建累计宽度数组：result[i] 为 text[:i] 的逐字符宽度之和（长度 len(text)+1）
+
+        Args:
+            text: 文本内容
+            font: 字体对象
+
+        Returns:
+            numpy.ndarray 或 array('d')
+        """
+        table = self._get_advance_table(font, text)
+        advances = map(table.__getitem__, text)
+
+        if np is not None:
+            result = np.empty(len(text) + 1, dtype=np.float64)
+            result[0] = 0.0
+            np.cumsum(np.fromiter(advances, dtype=np.float64, count=len(text)), out=result[1:])
+            return result
+
+        return array('d', accumulate(chain((0.0,), advances)))
+
+    def _fit_prefix(self, text: str, font: ImageFont.FreeTypeFont,
+                    cumulative: Sequence[float], start: int, end: int,
+                    max_width: float, allow_empty: bool = False) -> int:
+        """
+        在字符边界上找出 text[start:end] 中宽度不超过 max_width 的最长前缀
+
+        先对累计宽度二分查找，再用真实宽度校验（最多回退 _MAX_VERIFY_STEPS 个字符），
+        测量开销与文本长度无关。
+
+        Args:
+            text: 文本内容
+            font: 字体对象
+            cumulative: text 的累计宽度数组
+            start: 起始偏移
+            end: 结束偏移（不含）
+            max_width: 最大宽度
+            allow_empty: 是否允许返回空前缀（否则至少包含一个字符）
+
+        Returns:
+            int: 前缀结束偏移
+        """
+        limit = cumulative[start] + max_width + _WIDTH_EPSILON
+        if np is not None and isinstance(cumulative, np.ndarray):
+            cut = int(np.searchsorted(cumulative[start:end + 1], limit, side='right')) - 1 + start
+        else:
+            cut = bisect_right(cumulative, limit, start, end + 1) - 1
+
+        min_cut = start if allow_empty else start + 1
+        cut = max(cut, min_cut)
+
+        for _ in range(_MAX_VERIFY_STEPS):
+            if cut <= min_cut or self._get_text_width(text[start:cut], font) <= max_width:
+                break
+            cut -= 1
+
+        return cut
+
+    def _break_opportunities(self, text: str) -> Sequence[int]:
+        """
+        计算断行机会（升序字符偏移，首项为 0，末项为 len(text)）
+
+        按连续同类字符（见 char_classes）逐段处理：
+        - 单词（ALPHA）内部不断行
+        - 空白之后可断行
+        - 表意字符之间及前后可断行
+        - 闭合标点之前不断行，开括号之后不断行
+
+        Args:
+            text: 文本内容
+
+        Returns:
+            Sequence[int]: 允许断行的位置（array('q')）
+        """
+        breaks = array('q', (0,))
+        no_break_at = -1  # 开括号之后的位置
+
+        for cls, start, end in iter_runs(text):
+            if cls == CLASS_SPACE:
+                if end != no_break_at:
+                    breaks.append(end)
+
+            elif cls == CLASS_IDEOGRAPHIC:
+                first = max(breaks[-1] + 1, start + 1 if start == no_break_at else start)
+                breaks.extend(range(first, end + 1))
+
+            elif cls == CLASS_CLOSE:
+                if start > 0 and breaks[-1] == start:
+                    breaks.pop()
+                breaks.append(end)
+
+            elif cls == CLASS_OPEN:
+                if start > breaks[-1] and start != no_break_at:
+                    breaks.append(start)
+                no_break_at = end
+
+        if breaks[-1] != len(text):
+            breaks.append(len(text))
+
+        return breaks
+
+    @staticmethod
+    def _is_cjk(char: str) -> bool:
+        """
+        判断字符是否为东亚宽字符（汉字、假名、谚文、全角字符及 CJK 标点）
+
+        Args:
+            char: 单个字符
+
+        Returns:
+            bool: 是否为 CJK 字符
+        """
+        return is_east_asian(char)
+
+    @staticmethod
+    def _get_text_width(text: str, font: ImageFont.FreeTypeFont) -> float:
+        """
+        获取文本宽度（兼容不同 PIL 版本）
+
+        Args:
+            text: 文本内容
+            font: 字体对象
+
+        Returns:
+            float: 文本宽度
+        """
+        try:
+            # 新版 PIL (>= 10.0.0) 推荐使用
+            return font.getlength(text)
+        except AttributeError:
+            # 旧版 PIL
+            width, _ = font.getsize(text)
+            return float(width)
+
 
-def create_layout_engine(line_spacing: float = 1.2) -> LayoutEngine:
+def create_layout_engine(line_spacing: float = 1.2,
+                         wrap_mode: str = WRAP_MODE_INCREMENTAL,
+                         cache_size: int = 512) -> LayoutEngine:
     """
     创建排版引擎实例（工厂函数）
 
     Args:
         line_spacing: 行距倍数
+        wrap_mode: 换行模式（'incremental' 或 'legacy'）
+        cache_size: 换行结果缓存的最大条目数（0 表示禁用）
 
     Returns:
         LayoutEngine: 排版引擎实例
     """
-    return LayoutEngine(line_spacing=line_spacing)
+    return LayoutEngine(line_spacing=line_spacing, wrap_mode=wrap_mode, cache_size=cache_size)
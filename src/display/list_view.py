@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+标题列表排版
+一屏显示尽可能多的标题（每行标题截断到固定行数），只排版当前滚动位置可见的行
+
+功能：
+- 行排版结果按内容缓存（坐标相对行顶部），滚动一页只排版新出现的行
+- 从任意偏移向后排满一页；向前翻页时反向累计行高
+- 与渲染分离：ListPage 只包含位置和文本块
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import List, Sequence, Tuple
+
+from PIL import ImageFont
+
+from .cache import LRUCache
+from .layout_engine import LayoutEngine, TextBlock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ListRow:
+    """
+    一行（一篇文章）的排版结果
+
+    items 中的坐标相对行左上角: (dx, dy, 文本块, 字体)
+    """
+    height: int
+    items: Tuple[Tuple[int, int, TextBlock, ImageFont.FreeTypeFont], ...] = field(repr=False)
+    overflow: bool = False  # 标题被截断
+
+
+@dataclass
+class ListPage:
+    """列表页的排版结果"""
+    offset: int                      # 第一行的文章下标
+    next_offset: int                 # 下一页第一行的文章下标
+    total: int                       # 文章总数
+    rows: List[Tuple[int, int, ListRow]] = field(default_factory=list)  # (文章下标, 行顶部 y, 行)
+
+    @property
+    def has_more(self) -> bool:
+        """后面是否还有文章"""
+        return self.next_offset < self.total
+
+    @property
+    def remaining(self) -> int:
+        """本页之后剩余的文章数"""
+        return self.total - self.next_offset
+
+
+class ListLayout:
+    """
+    标题列表排版器
+
+    行排版只依赖文章的标题与元数据文字，以内容摘要为键缓存
+    """
+
+    ROW_PADDING = 4   # 行内上下留白
+    META_GAP = 2      # 标题与元数据之间的间距
+
+    def __init__(self, layout_engine: LayoutEngine,
+                 title_font: ImageFont.FreeTypeFont, meta_font: ImageFont.FreeTypeFont,
+                 width: int, title_lines: int = 2, cache_size: int = 256):
+        """
+        初始化列表排版器
+
+        Args:
+            layout_engine: 排版引擎
+            title_font: 标题字体
+            meta_font: 元数据字体
+            width: 行内容宽度
+            title_lines: 每行标题最多显示的行数
+            cache_size: 行排版缓存条目数
+        """
+        self.layout = layout_engine
+        self.title_font = title_font
+        self.meta_font = meta_font
+        self.width = width
+        self.title_lines = max(title_lines, 1)
+        self._rows = LRUCache(max_entries=cache_size)
+
+    def row_key(self, title: str, meta: str) -> bytes:
+        """行排版缓存键"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(title.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(meta.encode('utf-8'))
+        return digest.digest()
+
+    def layout_row(self, title: str, meta: str) -> ListRow:
+        """
+        排版一行（命中缓存时不重新排版）
+
+        Args:
+            title: 标题
+            meta: 元数据文字（来源、时间）
+
+        Returns:
+            ListRow: 行排版结果
+        """
+        key = self.row_key(title, meta)
+        row = self._rows.get(key)
+        if row is not None:
+            return row
+
+        items = []
+        y = self.ROW_PADDING
+        block = self.layout.layout_block(title, self.title_font, self.width,
+                                         max_lines=self.title_lines)
+        items.append((0, y, block, self.title_font))
+        y += len(block.spans) * block.line_pitch
+
+        if meta:
+            meta_block = self.layout.layout_block(meta, self.meta_font, self.width, max_lines=1)
+            y += self.META_GAP
+            items.append((0, y, meta_block, self.meta_font))
+            y += meta_block.line_height
+
+        row = ListRow(height=y + self.ROW_PADDING, items=tuple(items), overflow=block.truncated)
+        self._rows.put(key, row, size=1)
+        return row
+
+    def layout_page(self, rows: Sequence[Tuple[str, str]], offset: int,
+                    top: int, bottom: int) -> ListPage:
+        """
+        从 offset 开始排满一页（只排版可见行）
+
+        Args:
+            rows: 每篇文章的 (标题, 元数据)，可以是惰性序列
+            offset: 第一行的文章下标
+            top: 列表区域顶部
+            bottom: 列表区域底部
+
+        Returns:
+            ListPage: 列表页排版结果
+        """
+        total = len(rows)
+        offset = min(max(offset, 0), total)
+        page = ListPage(offset=offset, next_offset=offset, total=total)
+
+        y = top
+        for i in range(offset, total):
+            row = self.layout_row(*rows[i])
+            # 至少放一行，避免单行过高时无法翻页
+            if y + row.height > bottom and page.rows:
+                break
+            page.rows.append((i, y, row))
+            y += row.height
+            page.next_offset = i + 1
+
+        return page
+
+    def previous_offset(self, rows: Sequence[Tuple[str, str]], offset: int,
+                        height: int) -> int:
+        """
+        向前翻一页时新一页的起始下标（反向累计行高）
+
+        Args:
+            rows: 每篇文章的 (标题, 元数据)
+            offset: 当前页第一行的文章下标
+            height: 列表区域高度
+
+        Returns:
+            int: 上一页第一行的文章下标
+        """
+        used = 0
+        start = min(offset, len(rows))
+        while start > 0:
+            row = self.layout_row(*rows[start - 1])
+            if used + row.height > height and start < offset:
+                break
+            used += row.height
+            start -= 1
+        return start
+
+    def clear_cache(self):
+        """清空行排版缓存"""
+        self._rows.clear()
+
+    def get_cache_info(self) -> dict:
+        """获取行排版缓存统计"""
+        return self._rows.get_stats()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+分页引擎
+将长文章一次性排版为页索引（每页在原文中的字符偏移），翻页时只排版当前页的文字
+
+功能：
+- 全文只换行一次，生成页索引
+- 页索引按字体/字号/区域区分，保存在文章字典中（可随文章一起序列化）
+- 跳转到第 N 页为 O(1)
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import ImageFont
+
+from .layout_engine import LayoutEngine, TextBlock
+
+logger = logging.getLogger(__name__)
+
+# 文章字典中保存页索引的字段: {布局标识: PageIndex.to_dict()}
+PAGE_INDEX_FIELD = 'page_index'
+
+
+def text_digest(text: str) -> str:
+    """文本摘要（用于判断页索引是否过期）"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@dataclass
+class PageIndex:
+    """
+    页索引
+
+    offsets[i] 为第 i 页（从 0 开始）的起始字符偏移，最后一项为文本长度，
+    第 i 页的文字为 text[offsets[i]:offsets[i + 1]]
+    """
+    layout_key: str
+    digest: str
+    offsets: List[int] = field(default_factory=list)
+
+    @property
+    def page_count(self) -> int:
+        """总页数"""
+        return max(len(self.offsets) - 1, 0)
+
+    def page_range(self, page: int) -> Tuple[int, int]:
+        """
+        获取某页的字符范围
+
+        Args:
+            page: 页码（从 1 开始）
+
+        Returns:
+            (start, end): 起止偏移
+        """
+        if not 1 <= page <= self.page_count:
+            raise IndexError(f"页码超出范围: {page}/{self.page_count}")
+        return self.offsets[page - 1], self.offsets[page]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可序列化的字典"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PageIndex':
+        """从字典恢复"""
+        return cls(layout_key=data['layout_key'], digest=data['digest'],
+                   offsets=list(data['offsets']))
+
+
+class Paginator:
+    """
+    分页器
+
+    首页可以比后续页矮（首页上方要留给标题）
+    """
+
+    def __init__(self, layout_engine: LayoutEngine):
+        """
+        初始化分页器
+
+        Args:
+            layout_engine: 排版引擎
+        """
+        self.layout = layout_engine
+
+    def layout_key(self, font: ImageFont.FreeTypeFont, width: int, height: int,
+                   first_height: Optional[int] = None) -> str:
+        """
+        布局标识（字体、字号、区域、行距、换行模式）
+
+        Args:
+            font: 字体对象
+            width: 区域宽度
+            height: 区域高度
+            first_height: 首页区域高度（None 表示与其他页相同）
+
+        Returns:
+            str: 布局标识
+        """
+        font_key = LayoutEngine.font_key(font)
+        return (f"{font_key[0]}:{font_key[1]}:{font_key[2]}|{width}x{height}"
+                f"|first={first_height}|spacing={self.layout.line_spacing}"
+                f"|{self.layout.wrap_mode}")
+
+    def build_index(self, text: str, font: ImageFont.FreeTypeFont,
+                    width: int, height: int,
+                    first_height: Optional[int] = None) -> PageIndex:
+        """
+        排版全文并生成页索引
+
+        Args:
+            text: 全文
+            font: 字体对象
+            width: 区域宽度
+            height: 每页区域高度
+            first_height: 首页区域高度（None 表示与其他页相同）
+
+        Returns:
+            PageIndex: 页索引
+        """
+        spans = self.layout.wrap_spans(text, font, width)
+
+        lines_per_page = self.layout.calculate_max_lines(height, font)
+        first_lines = (self.layout.calculate_max_lines(first_height, font)
+                       if first_height is not None else lines_per_page)
+
+        offsets = [0]
+        line = first_lines
+        while line < len(spans):
+            offsets.append(spans[line].start)
+            line += lines_per_page
+        offsets.append(len(text))
+
+        index = PageIndex(self.layout_key(font, width, height, first_height),
+                          text_digest(text), offsets)
+        logger.debug("分页完成: %d 字符, %d 行, %d 页", len(text), len(spans), index.page_count)
+        return index
+
+    def get_index(self, article: Dict[str, Any], text: str,
+                  font: ImageFont.FreeTypeFont, width: int, height: int,
+                  first_height: Optional[int] = None) -> PageIndex:
+        """
+        获取文章的页索引（优先使用保存在文章中的索引，过期或缺失时重建并保存）
+
+        Args:
+            article: 文章数据字典（页索引保存在 article['page_index'] 中）
+            text: 要分页的文本
+            font: 字体对象
+            width: 区域宽度
+            height: 每页区域高度
+            first_height: 首页区域高度
+
+        Returns:
+            PageIndex: 页索引
+        """
+        key = self.layout_key(font, width, height, first_height)
+        stored = article.setdefault(PAGE_INDEX_FIELD, {})
+        data = stored.get(key)
+
+        digest = text_digest(text)
+        if data is not None and data.get('digest') == digest:
+            return PageIndex.from_dict(data)
+
+        index = self.build_index(text, font, width, height, first_height)
+        stored[key] = index.to_dict()
+        return index
+
+    def layout_page(self, text: str, index: PageIndex, page: int,
+                    font: ImageFont.FreeTypeFont, width: int) -> TextBlock:
+        """
+        排版某一页（只处理该页的文字）
+
+        Args:
+            text: 全文
+            index: 页索引
+            page: 页码（从 1 开始）
+            font: 字体对象
+            width: 区域宽度
+
+        Returns:
+            TextBlock: 该页的排版结果
+        """
+        start, end = index.page_range(page)
+        return self.layout.layout_block(text[start:end], font, width)
+
+
+def create_paginator(layout_engine: LayoutEngine) -> Paginator:
+    """
+    创建分页器（工厂函数）
+
+    Args:
+        layout_engine: 排版引擎
+
+    Returns:
+        Paginator: 分页器实例
+    """
+    return Paginator(layout_engine)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+刷新调度器（防残影刷新预算）
+为每次墨水屏更新选择刷新波形
+
+功能：
+- 按水平区域统计局部刷新（DU）次数
+- 记录距上次全刷新（GC）和完整清屏的时间
+- 为每次更新选择 DU / GC / 完整清屏
+- 保证在有限次数或有限分钟内必定执行全刷新
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 刷新波形
+WAVEFORM_NONE = "NONE"   # 画面未变化，跳过刷新
+WAVEFORM_DU = "DU"       # 快速局部刷新（约 0.3 秒，会累积残影）
+WAVEFORM_GC = "GC"       # 全刷新（约 0.9 秒 + 等待，清除大部分残影）
+WAVEFORM_FULL = "FULL"   # 完整清屏：先刷白再 GC（最慢，彻底清除残影）
+
+
+@dataclass
+class RefreshPlan:
+    """单次更新的刷新决策"""
+    waveform: str
+    changed_regions: List[int] = field(default_factory=list)
+    changed_ratio: float = 0.0
+    reason: str = ""
+
+
+class RefreshScheduler:
+    """
+    防残影刷新调度器
+
+    将屏幕划分为若干水平区域（按行），比较新旧帧缓冲区找出变化区域：
+    - 变化面积小且各区域 DU 次数未超预算 → DU
+    - 任一区域 DU 次数达到上限，或距上次全刷新超时 → GC
+    - 距上次完整清屏的 GC 次数或时间超限 → FULL
+    """
+
+    def __init__(self, width: int, height: int,
+                 region_rows: int = 6,
+                 du_max_changed_ratio: float = 0.5,
+                 max_partial_updates: int = 5,
+                 max_partial_minutes: float = 15,
+                 full_clear_every: int = 20,
+                 full_clear_minutes: float = 240,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        初始化刷新调度器
+
+        Args:
+            width: 屏幕宽度（像素，须为 8 的倍数）
+            height: 屏幕高度（像素）
+            region_rows: 水平区域数量
+            du_max_changed_ratio: 允许 DU 的最大变化面积比例（0~1）
+            max_partial_updates: 单个区域连续 DU 的最大次数
+            max_partial_minutes: 距上次全刷新的最长分钟数
+            full_clear_every: 每多少次 GC 执行一次完整清屏
+            full_clear_minutes: 距上次完整清屏的最长分钟数
+            clock: 单调时钟（测试时可注入）
+        """
+        self.width = width
+        self.height = height
+        self.row_bytes = width // 8
+        self.region_rows = max(1, min(region_rows, height))
+        self.du_max_changed_ratio = du_max_changed_ratio
+        self.max_partial_updates = max_partial_updates
+        self.max_partial_seconds = max_partial_minutes * 60
+        self.full_clear_every = full_clear_every
+        self.full_clear_seconds = full_clear_minutes * 60
+        self._clock = clock
+
+        # 区域边界（字节偏移）: [(start, end), ...]
+        self._regions = []
+        for i in range(self.region_rows):
+            y0 = height * i // self.region_rows
+            y1 = height * (i + 1) // self.region_rows
+            self._regions.append((y0 * self.row_bytes, y1 * self.row_bytes))
+
+        # 统计信息: {波形: 次数}
+        self.stats = {WAVEFORM_NONE: 0, WAVEFORM_DU: 0, WAVEFORM_GC: 0, WAVEFORM_FULL: 0}
+
+        self.reset()
+
+    def reset(self, frame: Optional[bytes] = None):
+        """
+        重置调度状态（屏幕刚完成初始化/清屏时调用）
+
+        Args:
+            frame: 当前屏幕内容（None 表示未知，下次更新强制 GC）
+        """
+        now = self._clock()
+        self._last_frame = bytes(frame) if frame is not None else None
+        self._partial_counts = [0] * self.region_rows
+        self._last_full_time = now
+        self._last_clear_time = now
+        self._gc_since_clear = 0
+
+    @property
+    def last_frame(self) -> Optional[bytes]:
+        """屏幕当前内容（None 表示未知）"""
+        return self._last_frame
+
+    def plan(self, frame: Optional[bytes], force: Optional[str] = None) -> RefreshPlan:
+        """
+        为新帧选择刷新波形（不修改状态）
+
+        Args:
+            frame: 打包后的 1-bpp 帧缓冲区（None 表示无法比较）
+            force: 强制使用的波形（可选）
+
+        Returns:
+            RefreshPlan: 刷新决策
+        """
+        changed = self._changed_regions(frame)
+        changed_rows = sum(self._region_height(i) for i in changed)
+        ratio = changed_rows / self.height if self.height else 1.0
+
+        if force:
+            return RefreshPlan(force, changed, ratio, "强制指定")
+
+        now = self._clock()
+
+        if self._last_frame is None or frame is None:
+            waveform, reason = WAVEFORM_GC, "无可比较的上一帧"
+        elif not changed:
+            return RefreshPlan(WAVEFORM_NONE, changed, 0.0, "画面未变化")
+        elif now - self._last_full_time >= self.max_partial_seconds:
+            waveform, reason = WAVEFORM_GC, "距上次全刷新超时"
+        elif any(self._partial_counts[i] >= self.max_partial_updates for i in changed):
+            waveform, reason = WAVEFORM_GC, "区域局部刷新次数达到上限"
+        elif ratio > self.du_max_changed_ratio:
+            waveform, reason = WAVEFORM_GC, "变化面积过大"
+        else:
+            return RefreshPlan(WAVEFORM_DU, changed, ratio, "局部变化")
+
+        # 需要全刷新时，检查是否升级为完整清屏
+        if (self._gc_since_clear + 1 >= self.full_clear_every or
+                now - self._last_clear_time >= self.full_clear_seconds):
+            return RefreshPlan(WAVEFORM_FULL, changed, ratio, f"{reason}，且清屏周期已到")
+
+        return RefreshPlan(waveform, changed, ratio, reason)
+
+    def record(self, plan: RefreshPlan, frame: Optional[bytes]):
+        """
+        记录已完成的刷新（仅在显示成功后调用）
+
+        Args:
+            plan: 已执行的刷新决策
+            frame: 已显示的帧缓冲区
+        """
+        now = self._clock()
+        self.stats[plan.waveform] = self.stats.get(plan.waveform, 0) + 1
+
+        if plan.waveform == WAVEFORM_NONE:
+            return
+
+        self._last_frame = bytes(frame) if frame is not None else None
+
+        if plan.waveform == WAVEFORM_DU:
+            for i in plan.changed_regions:
+                self._partial_counts[i] += 1
+            return
+
+        # GC / FULL 都会刷新整个屏幕，清零所有区域计数
+        self._partial_counts = [0] * self.region_rows
+        self._last_full_time = now
+
+        if plan.waveform == WAVEFORM_FULL:
+            self._gc_since_clear = 0
+            self._last_clear_time = now
+        else:
+            self._gc_since_clear += 1
+
+    def get_state(self) -> dict:
+        """获取调度状态（调试用）"""
+        now = self._clock()
+        return {
+            'partial_counts': list(self._partial_counts),
+            'seconds_since_full': now - self._last_full_time,
+            'seconds_since_clear': now - self._last_clear_time,
+            'gc_since_clear': self._gc_since_clear,
+            'stats': dict(self.stats),
+        }
+
+    # ========== 私有辅助方法 ==========
+
+    def _region_height(self, index: int) -> int:
+        start, end = self._regions[index]
+        return (end - start) // self.row_bytes
+
+    def _changed_regions(self, frame: Optional[bytes]) -> List[int]:
+        """比较新旧帧，返回发生变化的区域索引"""
+        if frame is None or self._last_frame is None or len(frame) != len(self._last_frame):
+            return list(range(self.region_rows))
+
+        old = self._last_frame
+        return [i for i, (start, end) in enumerate(self._regions)
+                if frame[start:end] != old[start:end]]
+
+
+def create_refresh_scheduler(config) -> Optional[RefreshScheduler]:
+    """
+    创建刷新调度器（工厂函数）
+
+    Args:
+        config: 配置对象
+
+    Returns:
+        RefreshScheduler: 调度器实例，配置中禁用时返回 None
+    """
+    refresh = config.refresh
+    if not refresh.enabled:
+        return None
+
+    return RefreshScheduler(
+        width=config.display.width,
+        height=config.display.height,
+        region_rows=refresh.region_rows,
+        du_max_changed_ratio=refresh.du_max_changed_ratio,
+        max_partial_updates=refresh.max_partial_updates,
+        max_partial_minutes=refresh.max_partial_minutes,
+        full_clear_every=refresh.full_clear_every,
+        full_clear_minutes=refresh.full_clear_minutes
+    )
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+预渲染流水线（render-ahead）
+屏幕刷新（BUSY 等待）期间，在后台线程中提前渲染并打包接下来的 K 篇文章
+
+功能：
+- 有界就绪队列：最多保留 depth 张已排队/已完成的帧
+- 切换到下一篇时直接取出打包帧，只剩 SPI 传输和刷新
+- 预渲染顺序变化时取消尚未开始的任务
+- 未命中时在调用线程中同步渲染（结果与直接渲染完全相同）
+
+用法:
+    ahead = create_render_ahead(config, renderer)
+    frame = ahead.get_frame(article, index, total)
+    ahead.schedule([(a, i + 1, total) for i, a in upcoming])
+    driver.submit_display(frame)
+"""
+
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.hotlog import get_hot_logger
+from utils.tracing import span
+
+from .renderer import ContentRenderer
+
+logger = logging.getLogger(__name__)
+hot_logger = get_hot_logger(__name__)
+
+# 预渲染任务: (文章, 索引, 总数)
+CardJob = Tuple[Dict[str, Any], int, int]
+
+
+class RenderAhead:
+    """
+    预渲染流水线
+
+    ContentRenderer 不是线程安全的，所有渲染（后台与同步）都在 _render_lock 下执行；
+    刷新期间驱动线程在 BUSY 等待中释放 GIL，后台渲染正好利用这段空闲。
+    """
+
+    def __init__(self, renderer: ContentRenderer, depth: int = 3):
+        """
+        初始化流水线（首次 schedule() 时启动后台线程）
+
+        Args:
+            renderer: 内容渲染器
+            depth: 就绪队列容量（预渲染的文章数，0 表示禁用预渲染）
+        """
+        self.renderer = renderer
+        self.depth = max(depth, 0)
+
+        self._render_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._ready: 'OrderedDict[bytes, Future]' = OrderedDict()  # 指纹 -> 帧
+        self._jobs: deque = deque()   # (指纹, 任务, Future)
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._stats = {'hits': 0, 'waits': 0, 'misses': 0, 'rendered': 0, 'cancelled': 0}
+
+    def schedule(self, upcoming: Iterable[CardJob]):
+        """
+        按顺序安排接下来要显示的文章（只取前 depth 篇）
+
+        已就绪或已排队的帧保留，不再需要的帧丢弃，尚未开始的任务取消。
+
+        Args:
+            upcoming: (文章, 索引, 总数) 序列，按显示顺序
+        """
+        if self.depth == 0:
+            return
+
+        wanted = []
+        for article, index, total in upcoming:
+            if len(wanted) >= self.depth:
+                break
+            wanted.append((self._key(article, index, total), (article, index, total)))
+
+        with self._cond:
+            if self._closed:
+                return
+
+            keys = {key for key, _ in wanted}
+            for key in [k for k in self._ready if k not in keys]:
+                if self._ready.pop(key).cancel():
+                    self._stats['cancelled'] += 1
+
+            for key, job in wanted:
+                if key in self._ready:
+                    self._ready.move_to_end(key)
+                    continue
+                future = Future()
+                self._ready[key] = future
+                self._jobs.append((key, job, future))
+
+            self._ensure_worker()
+            self._cond.notify()
+
+    def get_frame(self, article: Dict[str, Any], index: int = 1, total: int = 1) -> bytes:
+        """
+        获取文章的打包帧（优先使用预渲染结果）
+
+        Args:
+            article: 文章数据字典
+            index: 当前文章索引
+            total: 文章总数
+
+        Returns:
+            bytes: 打包帧
+        """
+        key = self._key(article, index, total)
+
+        with self._cond:
+            future = self._ready.pop(key, None)
+
+        if future is not None:
+            if future.done() and not future.cancelled():
+                self._stats['hits'] += 1
+                return future.result()
+
+            # 尚未开始的任务改为同步渲染；正在渲染的等待其完成
+            if not future.cancel():
+                self._stats['waits'] += 1
+                with span("render.ahead_wait"):
+                    try:
+                        return future.result()
+                    except CancelledError:
+                        pass
+
+        self._stats['misses'] += 1
+        return self._render(article, index, total)
+
+    def _key(self, article: Dict[str, Any], index: int, total: int) -> bytes:
+        with self._render_lock:
+            return self.renderer.card_fingerprint(article, index, total)
+
+    def _render(self, article: Dict[str, Any], index: int, total: int) -> bytes:
+        with self._render_lock:
+            return self.renderer.render_news_card_frame(article, index, total)
+
+    def _ensure_worker(self):
+        """启动后台线程（调用方须持有 _cond）"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="RenderAhead", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        """后台渲染线程"""
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key, job, future = self._jobs.popleft()
+
+            # 已被取消（不再需要或已改为同步渲染）的任务直接跳过
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                with span("render.ahead"):
+                    frame = self._render(*job)
+            except Exception as e:
+                # 同一错误可能每张卡片都出现，限速避免刷屏
+                hot_logger.error("预渲染失败: %s", e, per_second=1)
+                future.set_exception(e)
+            else:
+                self._stats['rendered'] += 1
+                future.set_result(frame)
+
+    def apply_config(self, config, changes: Dict[str, Dict[str, tuple]]) -> List[str]:
+        """
+        应用热加载后的配置（渲染器与预渲染深度）
+
+        热加载回调在文件监视线程中执行：渲染器的重配置在 _render_lock 下进行，
+        不会与后台渲染交错；渲染器有变化时丢弃已排队和已完成的预渲染帧。
+        使用预渲染时应订阅本方法，而不是直接订阅 renderer.apply_config。
+
+        Args:
+            config: 新的 Config 配置对象
+            changes: diff_config() 的结果
+
+        Returns:
+            List[str]: 渲染器重建的部分（同 ContentRenderer.apply_config）
+        """
+        with self._render_lock:
+            rebuilt = self.renderer.apply_config(config, changes)
+
+        if rebuilt:
+            with self._cond:
+                for future in self._ready.values():
+                    if future.cancel():
+                        self._stats['cancelled'] += 1
+                self._ready.clear()
+                self._jobs.clear()
+
+        if 'render_ahead_depth' in changes.get('display', {}):
+            self.depth = max(config.display.render_ahead_depth, 0)
+        return rebuilt
+
+    def get_stats(self) -> dict:
+        """获取流水线统计信息"""
+        with self._cond:
+            ready = sum(1 for f in self._ready.values() if f.done())
+            return dict(self._stats, depth=self.depth, queued=len(self._ready), ready=ready)
+
+    def close(self, wait: bool = True):
+        """
+        停止后台线程（未开始的任务全部取消）
+
+        Args:
+            wait: 是否等待正在进行的渲染结束
+        """
+        with self._cond:
+            self._closed = True
+            for future in self._ready.values():
+                future.cancel()
+            self._ready.clear()
+            self._jobs.clear()
+            self._cond.notify_all()
+            worker = self._worker
+
+        if wait and worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def create_render_ahead(config, renderer: ContentRenderer) -> RenderAhead:
+    """
+    根据配置创建预渲染流水线（工厂函数）
+
+    Args:
+        config: Config 配置对象
+        renderer: 内容渲染器
+
+    Returns:
+        RenderAhead: 预渲染流水线实例
+    """
+    return RenderAhead(renderer, depth=config.display.render_ahead_depth)
@@ -8,17 +8,118 @@
 - 智能布局计算
 - 自动空间分配
 - 支持多种内容类型
+- 长文章分页阅读
+- 仅排版不绘制的预演模式（dry-run），用于调度决策
+- 按内容指纹缓存渲染结果（打包帧）
+- 静态页面框架模板（页眉、页脚只绘制一次）
+- 可选直接渲染到打包帧缓冲区（不创建 PIL 图像）
+- 标题列表页（一屏多条标题，只排版可见行）
+- 文章配图缩略图（只从缓存合成，渲染时不解码、不联网）
 """
 
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont
 
+from utils.hotlog import HOT_DEBUG, get_hot_logger
+from utils.tracing import span, traced
+
+from .cache import LRUCache
+from .chrome import ChromeTemplate
 from .fonts import FontManager
-from .layout_engine import LayoutEngine
+from .framebuffer import FrameBuffer, GlyphCache, pack_image
+from .layout_engine import LayoutEngine, TextBlock
+from .list_view import ListLayout, ListPage
+from .pagination import PageIndex, Paginator
+from .thumbnails import Thumbnail, ThumbnailCache, create_thumbnail_cache
 
 logger = logging.getLogger(__name__)
+hot_logger = get_hot_logger(__name__)
+
+# 打包帧渲染后端
+RENDER_BACKEND_PIL = "pil"        # 用 PIL 绘制图像后打包
+RENDER_BACKEND_PACKED = "packed"  # 字形位图直接合成到打包帧缓冲区
+
+# 参与卡片渲染的文章字段（用于内容指纹）
+_CARD_FIELDS = ('title', 'summary', 'source', 'published', 'custom_footer')
+
+# 缩略图下方至少保留给摘要的高度
+_MIN_SUMMARY_HEIGHT = 40
+
+# 配置热加载时按变化字段选择需要重建的部分（display 节）
+_FONT_FIELDS = ('font_file', 'font_file_fallback')
+_LAYOUT_FIELDS = ('width', 'height', 'margin', 'title_height', 'footer_height',
+                  'summary_auto_size', 'font_size_summary_min', 'font_size_summary_max',
+                  'fit_time_budget_ms', 'list_title_lines', 'thumbnail_height')
+_FRAME_CACHE_FIELDS = ('render_cache_entries', 'render_cache_max_kb')
+_THUMBNAIL_FIELDS = ('thumbnails_enabled', 'thumbnail_dither', 'thumbnail_cache_dir')
+
+
+@dataclass
+class RegionLayout:
+    """卡片中一个区域的排版结果"""
+    name: str
+    box: Tuple[int, int, int, int]  # (x0, y0, x1, y1)
+    line_count: int = 0
+    overflow: bool = False          # 内容被截断
+    font_size: Optional[int] = None
+    # 绘制所需数据: (x, y, 文本块)
+    items: List[Tuple[int, int, TextBlock]] = field(default_factory=list, repr=False)
+    font: Optional[ImageFont.FreeTypeFont] = field(default=None, repr=False)
+    fill: int = 0
+    image: Optional[Thumbnail] = field(default=None, repr=False)  # 区域内的缩略图
+
+
+@dataclass
+class CardLayout:
+    """新闻卡片的排版结果（dry-run 输出）"""
+    header: RegionLayout
+    title: RegionLayout
+    summary: RegionLayout
+    footer: RegionLayout
+    thumbnail: Optional[RegionLayout] = None
+
+    @property
+    def regions(self) -> List[RegionLayout]:
+        """按绘制顺序排列的区域"""
+        if self.thumbnail is not None:
+            return [self.header, self.title, self.thumbnail, self.summary, self.footer]
+        return [self.header, self.title, self.summary, self.footer]
+
+    @property
+    def overflow(self) -> bool:
+        """标题或摘要是否被截断"""
+        return self.title.overflow or self.summary.overflow
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（区域框、行数、截断标记）"""
+        return {
+            region.name: {
+                'box': region.box,
+                'line_count': region.line_count,
+                'overflow': region.overflow,
+                'font_size': region.font_size,
+            }
+            for region in self.regions
+        }
+
+
+class _ListRowSource:
+    """文章列表的 (标题, 元数据) 惰性视图：只有可见行才计算文字"""
+
+    def __init__(self, articles: List[Dict[str, Any]]):
+        self.articles = articles
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def __getitem__(self, i: int) -> Tuple[str, str]:
+        article = self.articles[i]
+        return ContentRenderer._get_title(article), ContentRenderer._meta_text(article)
 
 
 class ContentRenderer:
@@ -31,7 +132,15 @@ class ContentRenderer:
 
     def __init__(self, font_manager: FontManager, layout_engine: LayoutEngine,
                  width: int, height: int, margin: int = 6,
-                 title_height: int = 35, footer_height: int = 20):
+                 title_height: int = 35, footer_height: int = 20,
+                 summary_size_range: Optional[Tuple[int, int]] = None,
+                 fit_time_budget: float = 0.03,
+                 frame_cache_entries: int = 128,
+                 frame_cache_bytes: Optional[int] = 2 * 1024 * 1024,
+                 render_backend: str = RENDER_BACKEND_PIL,
+                 list_title_lines: int = 2,
+                 thumbnails: Optional[ThumbnailCache] = None,
+                 thumbnail_height: int = 96):
         """
         初始化渲染器
 
@@ -43,6 +152,14 @@ class ContentRenderer:
             margin: 页边距
             title_height: 标题区域高度
             footer_height: 底部区域高度
+            summary_size_range: 摘要自适应字号范围 (最小, 最大)，None 表示固定字号
+            fit_time_budget: 每张卡片用于字号查找的时间预算（秒）
+            frame_cache_entries: 渲染结果缓存的最大帧数（0 表示禁用）
+            frame_cache_bytes: 渲染结果缓存的内存上限（字节）
+            render_backend: 打包帧渲染后端（'pil' 或 'packed'）
+            list_title_lines: 列表页每条标题最多显示的行数
+            thumbnails: 缩略图缓存（None 表示不显示配图）
+            thumbnail_height: 缩略图高度（宽度为内容宽度）
         """
         self.fonts = font_manager
         self.layout = layout_engine
@@ -51,11 +168,36 @@ class ContentRenderer:
         self.margin = margin
         self.title_height = title_height
         self.footer_height = footer_height
+        self.summary_size_range = summary_size_range
+        self.fit_time_budget = fit_time_budget
+        self.paginator = Paginator(layout_engine)
+
+        # 渲染结果缓存: {内容指纹: 打包帧}
+        self._frame_cache = LRUCache(max_entries=frame_cache_entries, max_bytes=frame_cache_bytes)
+        self._profile_digest = None
+
+        # 静态页面框架模板（首次渲染时创建）
+        self._chrome = None
+
+        # 打包帧渲染后端与字形位图缓存
+        if render_backend not in (RENDER_BACKEND_PIL, RENDER_BACKEND_PACKED):
+            logger.warning("未知的渲染后端: %s，使用 %s", render_backend, RENDER_BACKEND_PIL)
+            render_backend = RENDER_BACKEND_PIL
+        self.render_backend = render_backend
+        self._glyphs = GlyphCache()
+
+        # 标题列表排版器（首次使用时创建）
+        self.list_title_lines = list_title_lines
+        self._list_layout = None
 
         # 计算内容区域宽度
         self.content_width = width - (margin * 2)
 
-        logger.debug(f"渲染器初始化: {width}×{height}, 内容宽度: {self.content_width}px")
+        # 文章配图缩略图（只查缓存，生成由 prepare_thumbnail() 在渲染路径外完成）
+        self.thumbnails = thumbnails
+        self.thumbnail_size = (self.content_width, thumbnail_height)
+
+        logger.debug("渲染器初始化: %d×%d, 内容宽度: %dpx", width, height, self.content_width)
 
     def render_news_card(self, article: Dict[str, Any],
                          index: int = 1, total: int = 1) -> Image.Image:
@@ -88,24 +230,442 @@ class ContentRenderer:
         Returns:
             Image.Image: 渲染后的图像
         """
-        # 1. 创建画布（1位模式，1=白，0=黑）
-        image = Image.new('1', (self.width, self.height), 255)
+        # 1. 排版（不绘制）
+        card = self.layout_news_card(article, index, total)
+
+        # 2. 从框架模板创建画布（1位模式，1=白，0=黑；已含页眉黑底和页脚分割线）
+        chrome = self._get_chrome()
+        image = chrome.new_canvas()
         draw = ImageDraw.Draw(image)
 
-        # 2. 绘制 Header（黑底白字）
-        self._draw_header(draw, index, total)
+        # 3. 页眉文字（由缓存位图拼接）
+        with span("render.draw_header"):
+            chrome.draw_header(image, index, total, self._header_text_y(card.header))
+
+        # 4. 绘制标题、缩略图和摘要
+        with span("render.draw_title"):
+            self._paint_region(draw, card.title)
+        if card.thumbnail is not None:
+            with span("render.draw_thumbnail"):
+                image.paste(card.thumbnail.image.to_image(), card.thumbnail.box[:2])
+        with span("render.draw_summary"):
+            self._paint_region(draw, card.summary)
+
+        # 5. 页脚文字
+        with span("render.draw_footer"):
+            self._paint_region(draw, card.footer)
+
+        return image
+
+    def render_news_card_frame(self, article: Dict[str, Any],
+                               index: int = 1, total: int = 1) -> bytes:
+        """
+        渲染新闻卡片并打包为 1-bpp 帧（可直接交给 EpaperDriver 显示）
+
+        以内容指纹为键缓存：文章字段、索引、显示配置和字体文件都未变化时直接返回缓存的帧，
+        不做任何排版和绘制。
+
+        Args:
+            article: 文章数据字典
+            index: 当前文章索引
+            total: 文章总数
+
+        Returns:
+            bytes: 打包帧
+        """
+        key = self.card_fingerprint(article, index, total)
+        frame = self._frame_cache.get(key)
+        if frame is None:
+            if self.render_backend == RENDER_BACKEND_PACKED:
+                frame = self._render_card_packed(article, index, total)
+            else:
+                image = self.render_news_card(article, index, total)
+                with span("render.pack"):
+                    frame = pack_image(image)
+            self._frame_cache.put(key, frame, size=len(frame))
+        return frame
+
+    def _render_card_packed(self, article: Dict[str, Any], index: int, total: int) -> bytes:
+        """
+        直接渲染到打包帧缓冲区（不创建 PIL 图像，字形来自位图缓存）
+
+        Args:
+            article: 文章数据字典
+            index: 当前文章索引
+            total: 文章总数
+
+        Returns:
+            bytes: 打包帧
+        """
+        card = self.layout_news_card(article, index, total)
+
+        chrome = self._get_chrome()
+        fb = chrome.new_frame()
+        with span("render.draw_header"):
+            chrome.draw_header_frame(fb, self._glyphs, index, total, self._header_text_y(card.header))
+
+        for region in card.regions[1:]:
+            if HOT_DEBUG:
+                hot_logger.debug("绘制区域: %s %s", region.name, region.box, per_second=5)
+            with span("render.draw_" + region.name):
+                self._paint_region_frame(fb, region)
+
+        with span("render.pack"):
+            return fb.to_bytes()
+
+    def card_fingerprint(self, article: Dict[str, Any],
+                         index: int = 1, total: int = 1) -> bytes:
+        """
+        新闻卡片的内容指纹
+
+        Args:
+            article: 文章数据字典
+            index: 当前文章索引
+            total: 文章总数
+
+        Returns:
+            bytes: 16 字节摘要
+        """
+        digest = hashlib.blake2b(self._get_profile_digest(), digest_size=16)
+        for name in _CARD_FIELDS:
+            # 区分缺少字段与值为 None（页脚按 custom_footer 是否存在选择文字）
+            digest.update(b'1' if name in article else b'0')
+            digest.update(repr(article.get(name)).encode('utf-8'))
+            digest.update(b'\0')
+
+        # 没有摘要时使用正文
+        if not article.get('summary'):
+            digest.update(repr(article.get('content')).encode('utf-8'))
+
+        # 缩略图生成后卡片内容随之变化
+        thumb = self._get_thumbnail(article)
+        if thumb is not None:
+            digest.update(thumb.key.encode('ascii'))
+
+        digest.update(f"{index}/{total}".encode('ascii'))
+        return digest.digest()
+
+    def _get_profile_digest(self) -> bytes:
+        """显示配置与字体文件的指纹（首次使用时计算）"""
+        if self._profile_digest is None:
+            profile = (
+                self.width, self.height, self.margin, self.title_height, self.footer_height,
+                self.summary_size_range, self.fit_time_budget, self.thumbnail_size,
+                self.layout.line_spacing, self.layout.wrap_mode, self.layout.break_long_words,
+                self.fonts.get_identity(),
+            )
+            self._profile_digest = hashlib.blake2b(repr(profile).encode('utf-8'),
+                                                   digest_size=16).digest()
+        return self._profile_digest
+
+    def clear_cache(self):
+        """清空渲染结果缓存（显示配置或字体变化后调用）"""
+        self._frame_cache.clear()
+        self._profile_digest = None
+        self._chrome = None
+        self._glyphs = GlyphCache()
+        self._list_layout = None
+
+    def apply_config(self, config, changes: Dict[str, Dict[str, tuple]]) -> List[str]:
+        """
+        应用热加载后的配置，只重建受影响的部分
+
+        - 字体文件变化：切换字体并清空所有与字体对象相关的缓存
+        - 尺寸、边距等排版参数变化：更新参数，清空页面框架、列表行和渲染结果缓存，
+          保留字形位图和排版引擎的换行缓存
+        - 其余字段（缓存容量、缩略图、渲染后端）只替换对应组件
 
-        # 3. 绘制内容区域
-        cursor_y = self._draw_title(draw, article, self.title_height + self.margin + 5)
+        本方法不加锁，调用时不能有其他线程在使用本渲染器；
+        与 RenderAhead 共用时应通过 RenderAhead.apply_config() 调用（在渲染锁下执行）
 
-        # 4. 绘制摘要
-        self._draw_summary(draw, article, cursor_y + 10)
+        Args:
+            config: 新的 Config 配置对象
+            changes: diff_config() 的结果
+
+        Returns:
+            List[str]: 重建的部分（'fonts' / 'layout' / 'frame_cache' / 'thumbnails' / 'backend'）
+        """
+        changed = changes.get('display', {})
+        display = config.display
+        rebuilt = []
+
+        if any(name in changed for name in _FONT_FIELDS):
+            if self.fonts.reconfigure(display.font_file, display.font_file_fallback):
+                self.clear_cache()
+                rebuilt.append('fonts')
+
+        if any(name in changed for name in _LAYOUT_FIELDS):
+            self.width = display.width
+            self.height = display.height
+            self.margin = display.margin
+            self.title_height = display.title_height
+            self.footer_height = display.footer_height
+            self.content_width = display.width - display.margin * 2
+            self.summary_size_range = (
+                (display.font_size_summary_min, display.font_size_summary_max)
+                if display.summary_auto_size else None
+            )
+            self.fit_time_budget = display.fit_time_budget_ms / 1000
+            self.list_title_lines = display.list_title_lines
+            self.thumbnail_size = (self.content_width, display.thumbnail_height)
+
+            self._frame_cache.clear()
+            self._profile_digest = None
+            self._chrome = None
+            self._list_layout = None
+            rebuilt.append('layout')
+
+        if any(name in changed for name in _FRAME_CACHE_FIELDS):
+            self._frame_cache = LRUCache(max_entries=display.render_cache_entries,
+                                         max_bytes=display.render_cache_max_kb * 1024)
+            rebuilt.append('frame_cache')
+
+        if any(name in changed for name in _THUMBNAIL_FIELDS):
+            self.thumbnails = create_thumbnail_cache(config)
+            rebuilt.append('thumbnails')
+
+        # 两种后端输出完全相同，已缓存的帧仍然有效
+        if 'render_backend' in changed:
+            if display.render_backend in (RENDER_BACKEND_PIL, RENDER_BACKEND_PACKED):
+                self.render_backend = display.render_backend
+                rebuilt.append('backend')
+            else:
+                logger.warning("未知的渲染后端: %s，保持 %s", display.render_backend, self.render_backend)
+
+        if rebuilt:
+            logger.info("渲染器已按新配置更新: %s", ', '.join(rebuilt))
+        return rebuilt
+
+    def get_cache_info(self) -> dict:
+        """获取渲染结果缓存与排版缓存的统计信息（命中率等）"""
+        return {
+            'frames': self._frame_cache.get_stats(),
+            'layout': self.layout.get_cache_info(),
+            'chrome': self._chrome.get_stats() if self._chrome else None,
+            'glyphs': len(self._glyphs),
+            'list_rows': self._list_layout.get_cache_info() if self._list_layout else None,
+        }
+
+    def _get_chrome(self) -> ChromeTemplate:
+        """获取静态页面框架模板（按当前显示配置创建一次）"""
+        if self._chrome is None:
+            self._chrome = ChromeTemplate(
+                self.width, self.height, self.margin, self.title_height, self.footer_height,
+                header_font=self.fonts.get_font_by_name('headline', 16)
+            )
+        return self._chrome
+
+    def layout_news_card(self, article: Dict[str, Any],
+                         index: int = 1, total: int = 1) -> CardLayout:
+        """
+        新闻卡片预演（dry-run）：只排版，不创建图像也不绘制
 
-        # 5. 绘制 Footer
-        self._draw_footer(draw, article)
+        用于在渲染前判断文章能否放入一张卡片、是否需要缩小字号或分页。
+
+        Args:
+            article: 文章数据字典（同 render_news_card）
+            index: 当前文章索引
+            total: 文章总数
+
+        Returns:
+            CardLayout: 各区域的框、行数和截断标记
+        """
+        # 字号查找的截止时间（从卡片开始排版计）
+        deadline = time.perf_counter() + self.fit_time_budget
+
+        with span("render.layout"):
+            header = self._layout_header(index, total)
+            title = self._layout_title(article, self._content_top())
+            thumbnail = self._layout_thumbnail(article, title.box[3] + 6)
+            summary_y = thumbnail.box[3] + 6 if thumbnail else title.box[3] + 10
+            summary = self._layout_summary(article, summary_y, deadline)
+            footer = self._layout_footer(article)
+
+        if HOT_DEBUG:
+            hot_logger.debug("卡片排版: 标题 %d 行, 摘要 %spx %d 行%s", title.line_count,
+                             summary.font_size, summary.line_count,
+                             " (截断)" if summary.overflow else "", per_second=2)
+
+        return CardLayout(header=header, title=title, summary=summary, footer=footer,
+                          thumbnail=thumbnail)
+
+    def prepare_thumbnail(self, article: Dict[str, Any]) -> Optional[Thumbnail]:
+        """
+        生成文章配图的缩略图（下载、解码、抖动并缓存；在渲染路径外调用）
+
+        Args:
+            article: 文章数据字典（image_url 字段为配图地址）
+
+        Returns:
+            Thumbnail: 缩略图，未启用、无配图或生成失败时返回 None
+        """
+        url = article.get('image_url')
+        if self.thumbnails is None or not url:
+            return None
+        return self.thumbnails.fetch(url, self.thumbnail_size)
+
+    def _get_thumbnail(self, article: Dict[str, Any]) -> Optional[Thumbnail]:
+        """查找已缓存的缩略图（不解码、不联网）"""
+        url = article.get('image_url')
+        if self.thumbnails is None or not url:
+            return None
+        return self.thumbnails.get(url, self.thumbnail_size)
+
+    def _layout_thumbnail(self, article: Dict[str, Any],
+                          start_y: int) -> Optional[RegionLayout]:
+        """排版缩略图（未缓存或放不下时不显示）"""
+        thumb = self._get_thumbnail(article)
+        if thumb is None:
+            return None
+
+        bottom = start_y + thumb.height
+        if bottom + _MIN_SUMMARY_HEIGHT > self._content_bottom():
+            return None
+
+        return RegionLayout('thumbnail', (self.margin, start_y, self.margin + thumb.width, bottom),
+                            image=thumb)
+
+    def paginate(self, article: Dict[str, Any]) -> PageIndex:
+        """
+        获取文章正文的页索引（首次调用时全文排版一次，索引保存在文章字典中）
+
+        Args:
+            article: 文章数据字典
+
+        Returns:
+            PageIndex: 页索引
+        """
+        first_top = self._layout_title(article, self._content_top()).box[3] + 10
+
+        return self.paginator.get_index(
+            article, self._get_body(article), self.fonts.get_font(15), self.content_width,
+            self._content_bottom() - self._content_top(),
+            first_height=self._content_bottom() - first_top
+        )
+
+    def render_article_page(self, article: Dict[str, Any], page: int = 1,
+                            index: int = 1, total: int = 1) -> Image.Image:
+        """
+        渲染长文章的某一页
+
+        首页与新闻卡片相同（标题 + 正文），后续页全部用于正文，页脚显示页码。
+        只排版当前页的文字，跳转到任意页的开销与页码无关。
+
+        Args:
+            article: 文章数据字典（优先使用 content 字段，其次 summary）
+            page: 页码（从 1 开始，超出范围时取最近的有效页）
+            index: 当前文章索引
+            total: 文章总数
+
+        Returns:
+            Image.Image: 渲染后的图像
+        """
+        page_index = self.paginate(article)
+        page_count = page_index.page_count
+        if not 1 <= page <= page_count:
+            logger.warning("页码超出范围: %s/%s", page, page_count)
+            page = min(max(page, 1), page_count)
+
+        chrome = self._get_chrome()
+        image = chrome.new_canvas()
+        draw = ImageDraw.Draw(image)
+
+        chrome.draw_header(image, index, total, self._header_text_y(self._layout_header(index, total)))
+
+        cursor_y = self._content_top()
+        if page == 1:
+            cursor_y = self._draw_title(draw, article, cursor_y) + 10
+
+        font = self.fonts.get_font(15)
+        block = self.paginator.layout_page(self._get_body(article), page_index, page,
+                                           font, self.content_width)
+        self._draw_block(draw, block, font, self.margin, cursor_y)
+
+        self._paint_region(draw, self._layout_footer(article, page_label=f"{page}/{page_count}"))
 
         return image
 
+    def layout_list_page(self, articles: List[Dict[str, Any]], offset: int = 0) -> ListPage:
+        """
+        标题列表页排版：从 offset 开始排满一页，只排版可见行
+
+        Args:
+            articles: 文章列表
+            offset: 第一行的文章下标（从 0 开始）
+
+        Returns:
+            ListPage: 可见行的位置与排版结果，next_offset 为下一页的起始下标
+        """
+        with span("render.layout_list"):
+            return self._get_list_layout().layout_page(
+                _ListRowSource(articles), offset, self._content_top(), self._content_bottom())
+
+    def list_previous_offset(self, articles: List[Dict[str, Any]], offset: int) -> int:
+        """
+        标题列表向前翻一页时的起始下标
+
+        Args:
+            articles: 文章列表
+            offset: 当前页第一行的文章下标
+
+        Returns:
+            int: 上一页第一行的文章下标
+        """
+        return self._get_list_layout().previous_offset(
+            _ListRowSource(articles), offset, self._content_bottom() - self._content_top())
+
+    def render_list_page(self, articles: List[Dict[str, Any]], offset: int = 0) -> Image.Image:
+        """
+        渲染标题列表页（一屏多条标题，每条截断到固定行数）
+
+        Args:
+            articles: 文章列表
+            offset: 第一行的文章下标（从 0 开始）
+
+        Returns:
+            Image.Image: 渲染后的图像
+        """
+        page = self.layout_list_page(articles, offset)
+
+        chrome = self._get_chrome()
+        image = chrome.new_canvas()
+        draw = ImageDraw.Draw(image)
+
+        # 页眉: 当前可见范围
+        if page.rows:
+            header_text = f"AI-RSS | {page.offset + 1}-{page.next_offset}/{page.total}"
+        else:
+            header_text = "AI-RSS"
+        with span("render.draw_header"):
+            self._paint_region(draw, self._layout_header(title_text=header_text))
+
+        # 各行之间用细线分隔
+        with span("render.draw_list"):
+            for n, (_, y, row) in enumerate(page.rows):
+                for dx, dy, block, font in row.items:
+                    self._draw_block(draw, block, font, self.margin + dx, y + dy)
+                if n < len(page.rows) - 1:
+                    line_y = y + row.height - 1
+                    draw.line([(self.margin, line_y), (self.width - self.margin, line_y)], fill=0)
+
+        footer_text = f"还有 {page.remaining} 条" if page.has_more else "没有更多了"
+        with span("render.draw_footer"):
+            self._paint_region(draw, self._layout_footer({'custom_footer': footer_text}))
+
+        return image
+
+    def _get_list_layout(self) -> ListLayout:
+        """获取标题列表排版器（按当前字体创建一次）"""
+        if self._list_layout is None:
+            self._list_layout = ListLayout(
+                self.layout,
+                title_font=self.fonts.get_font_by_name('headline', 16),
+                meta_font=self.fonts.get_font_by_name('meta', 9),
+                width=self.content_width,
+                title_lines=self.list_title_lines,
+            )
+        return self._list_layout
+
     def render_simple_page(self, title: str, content: str,
                           footer: Optional[str] = None) -> Image.Image:
         """
@@ -126,15 +686,13 @@ class ContentRenderer:
         self._draw_header(draw, title_text=title)
 
         # 内容
-        cursor_y = self.title_height + self.margin + 5
+        cursor_y = self._content_top()
         font = self.fonts.get_font(15)
 
-        lines = self.layout.wrap_text(content, font, self.content_width)
-        for line in lines:
-            if cursor_y > self.height - self.footer_height - 20:
-                break
-            draw.text((self.margin, cursor_y), line, font=font, fill=0)
-            cursor_y += int(self.layout._get_font_height(font) * self.layout.line_spacing)
+        if content:
+            block = self.layout.layout_block(content, font, self.content_width)
+            self._draw_block(draw, block, font, self.margin, cursor_y,
+                             max_y=self.height - self.footer_height - 20)
 
         # Footer
         if footer:
@@ -142,6 +700,7 @@ class ContentRenderer:
 
         return image
 
+    @traced("render.draw_header")
     def _draw_header(self, draw: ImageDraw.Draw,
                     index: int = 0, total: int = 0,
                     title_text: Optional[str] = None) -> int:
@@ -157,9 +716,12 @@ class ContentRenderer:
         Returns:
             int: 页眉高度
         """
-        # 黑色背景
-        draw.rectangle([(0, 0), (self.width, self.title_height)], fill=0)
+        self._paint_header(draw, self._layout_header(index, total, title_text))
+        return self.title_height
 
+    def _layout_header(self, index: int = 0, total: int = 0,
+                       title_text: Optional[str] = None) -> RegionLayout:
+        """排版页眉（单行居中）"""
         # 白色文字
         font = self.fonts.get_font_by_name('headline', 16)
 
@@ -168,16 +730,23 @@ class ContentRenderer:
         else:
             header_text = f"AI-RSS | {index}/{total}" if total > 0 else "AI-RSS"
 
-        # 垂直居中
-        text_width = self.fonts.get_text_width(header_text, font)
-        text_height = self.fonts.get_text_height(font)
-        text_x = (self.width - text_width) // 2
-        text_y = (self.title_height - text_height) // 2
+        # 单行居中（超宽时截断）
+        block = self.layout.layout_block(header_text, font, self.width, max_lines=1)
+        text_x = int((self.width - block.width) // 2)
+        text_y = (self.title_height - block.line_height) // 2
 
-        draw.text((text_x, text_y), header_text, font=font, fill=255)
+        return RegionLayout('header', (0, 0, self.width, self.title_height),
+                            line_count=len(block.spans), overflow=block.truncated,
+                            font_size=getattr(font, 'size', None),
+                            items=[(text_x, text_y, block)], font=font, fill=255)
 
-        return self.title_height
+    def _paint_header(self, draw: ImageDraw.Draw, region: RegionLayout):
+        """绘制页眉（黑底白字）"""
+        # 黑色背景
+        draw.rectangle([(0, 0), (self.width, self.title_height)], fill=0)
+        self._paint_region(draw, region)
 
+    @traced("render.draw_title")
     def _draw_title(self, draw: ImageDraw.Draw,
                    article: Dict[str, Any], start_y: int) -> int:
         """
@@ -191,33 +760,36 @@ class ContentRenderer:
         Returns:
             int: 绘制后的 Y 坐标
         """
-        title = article.get('title', '无标题')
-        if not title:
-            title = '无标题'
+        region = self._layout_title(article, start_y)
+        self._paint_region(draw, region)
+        return region.box[3]
+
+    def _layout_title(self, article: Dict[str, Any], start_y: int) -> RegionLayout:
+        """排版文章标题（最多3行，截断时另起一行省略号）"""
+        title = self._get_title(article)
 
         font = self.fonts.get_font_by_name('title', 18)
 
         # 自动换行，最多3行
-        lines = self.layout.wrap_text(title, font, self.content_width)
-        lines = lines[:3]  # 限制最多3行
-
-        cursor_y = start_y
-        line_height = self.fonts.get_text_height(font)
-
-        for line in lines:
-            draw.text((self.margin, cursor_y), line, font=font, fill=0)
-            cursor_y += int(line_height * self.layout.line_spacing)
+        block = self.layout.layout_block(title, font, self.content_width,
+                                         max_lines=3, add_ellipsis=False)
+        items = [(self.margin, start_y, block)]
+        cursor_y = start_y + block.advance
 
         # 如果标题被截断，添加省略提示
-        if len(lines) == 3 and len(self.layout.wrap_text(title, font, self.content_width)) > 3:
-            # 绘制省略号
-            draw.text((self.margin, cursor_y), "...", font=font, fill=0)
-            cursor_y += int(line_height * self.layout.line_spacing)
+        if block.truncated:
+            ellipsis = self.layout.layout_block("...", font, self.content_width)
+            items.append((self.margin, cursor_y, ellipsis))
+            cursor_y += block.line_pitch
 
-        return cursor_y
+        return RegionLayout('title', (self.margin, start_y, self.width - self.margin, cursor_y),
+                            line_count=len(block.spans), overflow=block.truncated,
+                            font_size=getattr(font, 'size', None), items=items, font=font)
 
+    @traced("render.draw_summary")
     def _draw_summary(self, draw: ImageDraw.Draw,
-                     article: Dict[str, Any], start_y: int) -> int:
+                     article: Dict[str, Any], start_y: int,
+                     deadline: Optional[float] = None) -> int:
         """
         绘制文章摘要
 
@@ -225,10 +797,18 @@ class ContentRenderer:
             draw: ImageDraw 对象
             article: 文章数据
             start_y: 起始 Y 坐标
+            deadline: 自适应字号查找的截止时间（time.perf_counter() 时刻）
 
         Returns:
             int: 绘制后的 Y 坐标
         """
+        region = self._layout_summary(article, start_y, deadline)
+        self._paint_region(draw, region)
+        return region.box[3]
+
+    def _layout_summary(self, article: Dict[str, Any], start_y: int,
+                        deadline: Optional[float] = None) -> RegionLayout:
+        """排版文章摘要（截断到可用高度，可选自适应字号）"""
         summary = article.get('summary', '')
         if not summary:
             # 如果没有摘要，尝试用其他字段
@@ -236,44 +816,50 @@ class ContentRenderer:
             if not summary:
                 summary = '暂无摘要'
 
-        font = self.fonts.get_font(15)
-
         # 计算可用空间
-        available_height = self.height - start_y - self.footer_height - self.margin
-        max_lines = self.layout.calculate_max_lines(available_height, font)
-
-        # 截断文本以适应空间
-        truncated_text = self.layout.truncate_text(
-            summary, font, self.content_width, max_lines, add_ellipsis=True
-        )
-
-        # 绘制多行文本
-        lines = truncated_text.split('\n')
-        cursor_y = start_y
-        line_height = self.fonts.get_text_height(font)
+        available_height = self._content_bottom() - start_y
+
+        if self.summary_size_range:
+            # 自适应字号：能完整放下的最大字号，超时或放不下时截断
+            min_size, max_size = self.summary_size_range
+            size, block = self.layout.fit_best_size(
+                summary, (self.content_width, available_height), min_size, max_size,
+                self.fonts.get_font, deadline=deadline
+            )
+            font = self.fonts.get_font(size)
+        else:
+            font = self.fonts.get_font(15)
+            max_lines = self.layout.calculate_max_lines(available_height, font)
 
-        for line in lines:
-            draw.text((self.margin, cursor_y), line, font=font, fill=0)
-            cursor_y += int(line_height * self.layout.line_spacing)
+            # 截断文本以适应空间（行区间直接引用原文，无需拼接再拆分）
+            block = self.layout.layout_block(
+                summary, font, self.content_width, max_lines, add_ellipsis=True
+            )
 
-        return cursor_y
+        return RegionLayout('summary',
+                            (self.margin, start_y, self.width - self.margin, start_y + block.advance),
+                            line_count=len(block.spans), overflow=block.truncated,
+                            font_size=getattr(font, 'size', None),
+                            items=[(self.margin, start_y, block)], font=font)
 
+    @traced("render.draw_footer")
     def _draw_footer(self, draw: ImageDraw.Draw,
-                    article: Dict[str, Any]) -> None:
+                    article: Dict[str, Any],
+                    page_label: Optional[str] = None) -> None:
         """
         绘制页脚（分割线 + 元数据）
 
         Args:
             draw: ImageDraw 对象
             article: 文章数据
+            page_label: 页码文字（右对齐，可选）
         """
-        footer_y = self.height - self.footer_height
+        self._paint_footer(draw, self._layout_footer(article, page_label))
 
-        # 分割线
-        draw.line([
-            (self.margin, footer_y),
-            (self.width - self.margin, footer_y)
-        ], fill=0, width=1)
+    def _layout_footer(self, article: Dict[str, Any],
+                       page_label: Optional[str] = None) -> RegionLayout:
+        """排版页脚（元数据左对齐，页码右对齐）"""
+        footer_y = self.height - self.footer_height
 
         # 元数据文字
         font = self.fonts.get_font_by_name('meta', 9)
@@ -282,26 +868,126 @@ class ContentRenderer:
         if 'custom_footer' in article:
             footer_text = article['custom_footer']
         else:
-            source = article.get('source', '未知来源')
-            published = article.get('published', '')
-
-            # 格式化日期
-            if published:
-                try:
-                    dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                    date_str = dt.strftime('%m-%d %H:%M')
-                except:
-                    date_str = str(published)[:16]  # 截取前16个字符
-            else:
-                date_str = ''
+            footer_text = self._meta_text(article)
+
+        # 页码右对齐，元数据占用剩余宽度
+        items = []
+        overflow = False
+        text_width = self.content_width
+        if page_label:
+            label_block = self.layout.layout_block(page_label, font, self.content_width, max_lines=1)
+            label_x = int(self.width - self.margin - label_block.width)
+            items.append((label_x, footer_y + 4, label_block))
+            text_width = max(label_x - self.margin - 4, 0)
+
+        # 左对齐（单行，超宽时截断）
+        if footer_text and text_width > 0:
+            block = self.layout.layout_block(footer_text, font, text_width, max_lines=1)
+            items.append((self.margin, footer_y + 4, block))
+            overflow = block.truncated
+
+        return RegionLayout('footer', (self.margin, footer_y, self.width - self.margin, self.height),
+                            line_count=1 if items else 0, overflow=overflow,
+                            font_size=getattr(font, 'size', None), items=items, font=font)
+
+    def _paint_footer(self, draw: ImageDraw.Draw, region: RegionLayout):
+        """绘制页脚（分割线 + 文字）"""
+        footer_y = region.box[1]
+
+        # 分割线
+        draw.line([
+            (self.margin, footer_y),
+            (self.width - self.margin, footer_y)
+        ], fill=0, width=1)
+
+        self._paint_region(draw, region)
+
+    def _paint_region(self, draw: ImageDraw.Draw, region: RegionLayout):
+        """绘制区域内的文本块"""
+        for x, y, block in region.items:
+            self._draw_block(draw, block, region.font, x, y, fill=region.fill)
+
+    def _paint_region_frame(self, fb: FrameBuffer, region: RegionLayout):
+        """在打包帧缓冲区上绘制区域内的文本块和缩略图"""
+        if region.image is not None:
+            fb.blit(region.image.ink_rows(), region.image.width, region.box[0], region.box[1])
+        for x, y, block in region.items:
+            cursor_y = y
+            for span in block.spans:
+                self._glyphs.draw_text(fb, span.text_of(block.text), region.font,
+                                       x, cursor_y, fill=region.fill)
+                cursor_y += block.line_pitch
+
+    @staticmethod
+    def _header_text_y(region: RegionLayout) -> int:
+        """页眉文字顶部 Y 坐标"""
+        return region.items[0][1]
+
+    def _content_top(self) -> int:
+        """正文区域顶部（页眉下方）"""
+        return self.title_height + self.margin + 5
+
+    def _content_bottom(self) -> int:
+        """正文区域底部（页脚上方）"""
+        return self.height - self.footer_height - self.margin
+
+    @staticmethod
+    def _meta_text(article: Dict[str, Any]) -> str:
+        """元数据文字（来源 • 发布时间）"""
+        source = article.get('source', '未知来源')
+        published = article.get('published', '')
+
+        # 格式化日期
+        if published:
+            try:
+                dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                date_str = dt.strftime('%m-%d %H:%M')
+            except:
+                date_str = str(published)[:16]  # 截取前16个字符
+        else:
+            date_str = ''
+
+        meta = f"{source}"
+        if date_str:
+            meta += f" • {date_str}"
+        return meta
+
+    @staticmethod
+    def _get_title(article: Dict[str, Any]) -> str:
+        """文章标题（缺失时为"无标题"）"""
+        return article.get('title') or '无标题'
+
+    @staticmethod
+    def _get_body(article: Dict[str, Any]) -> str:
+        """分页用的正文（优先全文，其次摘要）"""
+        return article.get('content') or article.get('summary') or '暂无摘要'
+
+    def _draw_block(self, draw: ImageDraw.Draw, block: TextBlock,
+                    font: ImageFont.FreeTypeFont, x: int, y: int, fill: int = 0,
+                    max_y: Optional[int] = None) -> int:
+        """
+        逐行绘制排版好的文本块
+
+        Args:
+            draw: ImageDraw 对象
+            block: 排版结果
+            font: 排版时使用的字体
+            x: 左边界
+            y: 文本块顶部
+            fill: 颜色（0=黑，255=白）
+            max_y: 行顶部超过此坐标时停止绘制（None 表示不限制）
 
-            footer_text = f"{source}"
-            if date_str:
-                footer_text += f" • {date_str}"
+        Returns:
+            int: 绘制后的 Y 坐标
+        """
+        cursor_y = y
+        for span in block.spans:
+            if max_y is not None and cursor_y > max_y:
+                break
+            draw.text((x, cursor_y), span.text_of(block.text), font=font, fill=fill)
+            cursor_y += block.line_pitch
 
-        # 左对齐
-        text_y = footer_y + 4
-        draw.text((self.margin, text_y), footer_text, font=font, fill=0)
+        return cursor_y
 
 
 def create_renderer(config, font_manager: FontManager,
@@ -324,5 +1010,16 @@ def create_renderer(config, font_manager: FontManager,
         height=config.display.height,
         margin=config.display.margin,
         title_height=config.display.title_height,
-        footer_height=config.display.footer_height
+        footer_height=config.display.footer_height,
+        summary_size_range=(
+            (config.display.font_size_summary_min, config.display.font_size_summary_max)
+            if config.display.summary_auto_size else None
+        ),
+        fit_time_budget=config.display.fit_time_budget_ms / 1000,
+        frame_cache_entries=config.display.render_cache_entries,
+        frame_cache_bytes=config.display.render_cache_max_kb * 1024,
+        render_backend=config.display.render_backend,
+        list_title_lines=config.display.list_title_lines,
+        thumbnails=create_thumbnail_cache(config),
+        thumbnail_height=config.display.thumbnail_height
     )
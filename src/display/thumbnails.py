@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+缩略图处理
+将文章配图解码、缩放并抖动为 1 位图，按 URL 摘要和尺寸缓存为打包位图
+
+功能：
+- JPEG draft 模式：解码时直接按 1/2、1/4、1/8 缩小，不解码全尺寸图像
+- 有序抖动（Bayer 8×8，整幅图像一次比较）或 Floyd-Steinberg 误差扩散（Pillow 内置）
+- 内存 LRU + 磁盘缓存（打包位图），渲染时只做查找和粘贴，不解码、不联网
+"""
+
+import functools
+import hashlib
+import io
+import logging
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from PIL import Image, ImageChops, ImageOps
+
+from .cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# 抖动方式
+DITHER_ORDERED = "ordered"      # Bayer 有序抖动（快，刷新时画面稳定）
+DITHER_FLOYD = "floyd"          # Floyd-Steinberg 误差扩散（细节更好）
+DITHER_THRESHOLD = "threshold"  # 固定阈值（线稿、图标）
+
+# 8×8 Bayer 矩阵
+_BAYER_8 = [
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21],
+]
+
+
+def url_key(url: str) -> str:
+    """图片 URL 的摘要（缓存文件名）"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=8)
+def _threshold_map(size: Tuple[int, int]) -> Image.Image:
+    """平铺到指定尺寸的 Bayer 阈值图（'L' 模式，按尺寸缓存）"""
+    tile = Image.new('L', (8, 8))
+    tile.putdata([(v * 4 + 2) for row in _BAYER_8 for v in row])
+
+    width, height = size
+    threshold = Image.new('L', size)
+    for y in range(0, height, 8):
+        for x in range(0, width, 8):
+            threshold.paste(tile, (x, y))
+    return threshold
+
+
+def dither_image(gray: Image.Image, method: str = DITHER_ORDERED) -> Image.Image:
+    """
+    将灰度图抖动为 1 位图
+
+    Args:
+        gray: 'L' 模式图像
+        method: 抖动方式（ordered / floyd / threshold）
+
+    Returns:
+        Image.Image: '1' 模式图像（1=白）
+    """
+    if method == DITHER_FLOYD:
+        return gray.convert('1', dither=Image.Dither.FLOYDSTEINBERG)
+
+    if method == DITHER_ORDERED:
+        # 灰度高于阈值的像素为白：subtract 在 0 处截断，结果非 0 即为白
+        above = ImageChops.subtract(gray, _threshold_map(gray.size))
+        return above.point(lambda v: 255 if v else 0, mode='1')
+
+    return gray.point(lambda v: 255 if v >= 128 else 0, mode='1')
+
+
+def decode_thumbnail(source: Union[bytes, str, Path], size: Tuple[int, int],
+                     dither: str = DITHER_ORDERED) -> Image.Image:
+    """
+    解码并生成 1 位缩略图（等比缩放后居中裁剪到 size）
+
+    Args:
+        source: 图片内容或文件路径
+        size: 目标尺寸 (宽, 高)
+        dither: 抖动方式
+
+    Returns:
+        Image.Image: '1' 模式缩略图
+    """
+    fp = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    with Image.open(fp) as image:
+        # JPEG: 解码器直接输出不小于目标尺寸的缩小图（灰度）
+        scale = max(size[0] / image.width, size[1] / image.height)
+        image.draft('L', (int(image.width * scale) + 1, int(image.height * scale) + 1))
+        gray = ImageOps.fit(image.convert('L'), size, Image.Resampling.BILINEAR)
+
+    return dither_image(gray, dither)
+
+
+class Thumbnail:
+    """打包缩略图（'1' 模式字节，1=白）"""
+
+    __slots__ = ('width', 'height', 'data', 'key', '_ink_rows')
+
+    def __init__(self, width: int, height: int, data: bytes, key: str):
+        self.width = width
+        self.height = height
+        self.data = data
+        self.key = key
+        self._ink_rows = None
+
+    @classmethod
+    def from_image(cls, image: Image.Image, key: str) -> 'Thumbnail':
+        """从 '1' 模式图像创建"""
+        return cls(image.width, image.height, image.tobytes(), key)
+
+    def to_image(self) -> Image.Image:
+        """还原为 '1' 模式图像（用于 PIL 画布粘贴）"""
+        return Image.frombytes('1', (self.width, self.height), self.data)
+
+    def ink_rows(self) -> List[int]:
+        """每行一个整数、1 为黑色的位图（用于 FrameBuffer.blit）"""
+        if self._ink_rows is None:
+            stride = (self.width + 7) // 8
+            pad = stride * 8 - self.width
+            full = (1 << self.width) - 1
+            self._ink_rows = [
+                ~(int.from_bytes(self.data[i:i + stride], 'big') >> pad) & full
+                for i in range(0, stride * self.height, stride)
+            ]
+        return self._ink_rows
+
+
+class ThumbnailCache:
+    """
+    缩略图缓存
+
+    get() 只查内存和磁盘，不解码也不联网，可以在渲染路径上调用；
+    磁盘上没有的键记入未命中缓存，miss_ttl 秒内（或 put() 之前）不再读磁盘；
+    fetch() / put() 在后台任务中生成缩略图
+    """
+
+    def __init__(self, cache_dir: str = "data/cache/thumbnails",
+                 dither: str = DITHER_ORDERED, max_entries: int = 64,
+                 max_bytes: Optional[int] = 512 * 1024, timeout: float = 10,
+                 max_image_bytes: int = 4 * 1024 * 1024, miss_ttl: float = 60):
+        """
+        初始化缩略图缓存
+
+        Args:
+            cache_dir: 磁盘缓存目录
+            dither: 抖动方式
+            max_entries: 内存缓存条目数
+            max_bytes: 内存缓存上限（字节）
+            timeout: 下载超时（秒）
+            max_image_bytes: 下载图片的大小上限（字节），超过时放弃
+            miss_ttl: 未命中记录的有效期（秒，其他进程生成的缩略图在此之后可见）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.dither = dither
+        self.timeout = timeout
+        self.max_image_bytes = max_image_bytes
+        self.miss_ttl = miss_ttl
+        self._memory = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+        self._missing = LRUCache(max_entries=1024)   # 键 -> 记录时间
+
+    def _key(self, url: str, size: Tuple[int, int]) -> str:
+        return f"{url_key(url)}_{size[0]}x{size[1]}_{self.dither}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.bin"
+
+    def get(self, url: str, size: Tuple[int, int]) -> Optional[Thumbnail]:
+        """
+        查找已生成的缩略图
+
+        Args:
+            url: 图片 URL
+            size: 尺寸 (宽, 高)
+
+        Returns:
+            Thumbnail: 缩略图，尚未生成时返回 None
+        """
+        key = self._key(url, size)
+        thumb = self._memory.get(key)
+        if thumb is not None:
+            return thumb
+
+        missed_at = self._missing.get(key)
+        if missed_at is not None and time.monotonic() - missed_at < self.miss_ttl:
+            return None
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self._missing.put(key, time.monotonic())
+            return None
+        self._missing.discard(key)
+
+        if len(data) != (size[0] + 7) // 8 * size[1]:
+            logger.warning(f"缩略图缓存文件损坏，已忽略: {path}")
+            return None
+
+        thumb = Thumbnail(size[0], size[1], data, key)
+        self._memory.put(key, thumb, size=len(data))
+        return thumb
+
+    def put(self, url: str, source: Union[bytes, str, Path],
+            size: Tuple[int, int]) -> Thumbnail:
+        """
+        生成缩略图并写入缓存
+
+        Args:
+            url: 图片 URL（缓存键）
+            source: 图片内容或文件路径
+            size: 尺寸 (宽, 高)
+
+        Returns:
+            Thumbnail: 缩略图
+        """
+        key = self._key(url, size)
+        thumb = Thumbnail.from_image(decode_thumbnail(source, size, self.dither), key)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._path(key).write_bytes(thumb.data)
+        except OSError as e:
+            logger.warning(f"缩略图缓存写入失败: {e}")
+
+        self._missing.discard(key)
+        self._memory.put(key, thumb, size=len(thumb.data))
+        return thumb
+
+    def fetch(self, url: str, size: Tuple[int, int]) -> Optional[Thumbnail]:
+        """
+        获取缩略图（未缓存时下载并生成）
+
+        Args:
+            url: 图片 URL
+            size: 尺寸 (宽, 高)
+
+        Returns:
+            Thumbnail: 缩略图，下载或解码失败时返回 None
+        """
+        thumb = self.get(url, size)
+        if thumb is not None:
+            return thumb
+
+        try:
+            return self.put(url, self._download(url), size)
+        except ImportError:
+            logger.warning("未安装 requests，无法下载图片")
+        except Exception as e:
+            logger.warning(f"缩略图生成失败: {url} - {e}")
+        return None
+
+    def _download(self, url: str) -> bytes:
+        """
+        流式下载图片（超过 max_image_bytes 时中止）
+
+        Raises:
+            ValueError: 图片超过大小上限
+        """
+        import requests
+
+        with requests.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            length = response.headers.get('Content-Length')
+            if length is not None and length.isdigit() and int(length) > self.max_image_bytes:
+                raise ValueError(f"图片过大: {int(length)} 字节 (上限 {self.max_image_bytes})")
+
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                total += len(chunk)
+                if total > self.max_image_bytes:
+                    raise ValueError(f"图片过大: 超过 {self.max_image_bytes} 字节")
+                chunks.append(chunk)
+        return b''.join(chunks)
+
+    def get_stats(self) -> dict:
+        """获取内存缓存统计"""
+        return self._memory.get_stats()
+
+
+def create_thumbnail_cache(config) -> Optional[ThumbnailCache]:
+    """
+    根据配置创建缩略图缓存（工厂函数）
+
+    Args:
+        config: Config 配置对象
+
+    Returns:
+        ThumbnailCache: 缩略图缓存，未启用时返回 None
+    """
+    if not config.display.thumbnails_enabled:
+        return None
+    return ThumbnailCache(cache_dir=config.display.thumbnail_cache_dir,
+                          dither=config.display.thumbnail_dither,
+                          timeout=config.network.timeout_seconds)
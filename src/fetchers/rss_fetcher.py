@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+RSS 抓取器
+基于 asyncio 并发下载多个订阅源，解析在事件循环之外的线程池（或进程池）中进行
+
+功能：
+- 全局并发上限与每个主机的连接数上限
+- 每次请求超时、失败重试与重试间隔（来自 NetworkConfig）
+- 下载后端：安装了 aiohttp 时使用 aiohttp，否则用 requests 在线程池中下载
+- 解析结果转为 Article，按发布时间排序、去重后截取 max_articles_per_fetch 篇
+
+用法:
+    fetcher = create_rss_fetcher(config)
+    articles = fetcher.fetch_articles(config.services.feeds)   # 同步调用
+    results = await fetcher.fetch_all(urls)                    # 已在事件循环中时
+"""
+
+import asyncio
+import html
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import feedparser
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 是可选依赖，缺失时用 requests 在线程池中下载
+    aiohttp = None
+
+from models.rss_models import Article, FeedResult
+
+logger = logging.getLogger(__name__)
+
+# 下载后端
+BACKEND_AIOHTTP = "aiohttp"
+BACKEND_REQUESTS = "requests"
+
+DEFAULT_USER_AGENT = "AI-RSS-Client/1.0"
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _plain_text(value: Optional[str]) -> str:
+    """去除 HTML 标签与实体，合并空白"""
+    if not value:
+        return ""
+    return _SPACE_RE.sub(' ', html.unescape(_TAG_RE.sub(' ', value))).strip()
+
+
+def _entry_image(entry) -> Optional[str]:
+    """条目配图地址（media:thumbnail、media:content 或图片附件）"""
+    for thumb in entry.get('media_thumbnail') or ():
+        if thumb.get('url'):
+            return thumb['url']
+    for media in entry.get('media_content') or ():
+        if media.get('url') and (media.get('medium') == 'image'
+                                 or media.get('type', '').startswith('image/')):
+            return media['url']
+    for enclosure in entry.get('enclosures') or ():
+        if enclosure.get('href') and enclosure.get('type', '').startswith('image/'):
+            return enclosure['href']
+    return None
+
+
+def _entry_published(entry) -> str:
+    """发布时间（UTC ISO 8601），缺失时为空"""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', parsed) if parsed else ""
+
+
+def parse_feed(url: str, content: bytes, max_articles: int = 0) -> Tuple[str, List[Article]]:
+    """
+    解析订阅源内容（在线程池或进程池中执行，须为模块级函数）
+
+    Args:
+        url: 订阅源地址
+        content: 响应内容
+        max_articles: 每个订阅源最多保留的条目数（0 表示不限）
+
+    Returns:
+        (title, articles): 订阅源标题与文章列表
+
+    Raises:
+        ValueError: 内容不是可识别的 RSS/Atom
+    """
+    parsed = feedparser.parse(content)
+    title = _plain_text(parsed.feed.get('title'))
+    if parsed.bozo and not parsed.entries and not title:
+        raise ValueError(f"无法识别的订阅源内容: {parsed.get('bozo_exception')}")
+
+    entries = parsed.entries[:max_articles] if max_articles > 0 else parsed.entries
+    articles = [
+        Article(
+            title=_plain_text(entry.get('title')) or "(无标题)",
+            summary=_plain_text(entry.get('summary')),
+            link=entry.get('link', ''),
+            source=title,
+            published=_entry_published(entry),
+            image_url=_entry_image(entry),
+            feed_url=url,
+        )
+        for entry in entries
+    ]
+    return title, articles
+
+
+def collect_articles(results: Iterable[FeedResult], limit: int = 0) -> List[Article]:
+    """
+    合并各订阅源的文章：去重、按发布时间从新到旧排序（无时间的排在最后）
+
+    Args:
+        results: 抓取结果
+        limit: 最多返回的篇数（0 表示不限）
+
+    Returns:
+        List[Article]: 文章列表
+    """
+    seen = set()
+    articles = []
+    for result in results:
+        for article in result.articles:
+            if article.key not in seen:
+                seen.add(article.key)
+                articles.append(article)
+
+    # ISO 8601 UTC 字符串可直接按字典序比较
+    articles.sort(key=lambda a: a.published, reverse=True)
+    return articles[:limit] if limit > 0 else articles
+
+
+class AsyncRSSFetcher:
+    """
+    并发 RSS 抓取器
+
+    fetch_all() 可在已有事件循环中等待；fetch() / fetch_articles() 为同步包装（内部 asyncio.run）
+    """
+
+    def __init__(self, timeout: float = 10, retries: int = 3, retry_delay: float = 5,
+                 max_concurrency: int = 16, per_host_limit: int = 4, max_articles: int = 50,
+                 parse_workers: int = 2, parse_in_processes: bool = False,
+                 user_agent: str = DEFAULT_USER_AGENT, use_aiohttp: Optional[bool] = None):
+        """
+        初始化抓取器
+
+        Args:
+            timeout: 每次请求超时（秒）
+            retries: 失败后重试次数（连接错误、超时、5xx 与 429）
+            retry_delay: 重试间隔（秒，等待期间不占用并发名额）
+            max_concurrency: 全局同时进行的请求数上限
+            per_host_limit: 每个主机同时进行的请求数上限
+            max_articles: 每次抓取最多返回的文章数（每个订阅源也最多解析这么多条，0 表示不限）
+            parse_workers: 解析线程（进程）数
+            parse_in_processes: 是否在进程池中解析（多核设备上可并行，首次使用有启动开销）
+            user_agent: 请求头 User-Agent
+            use_aiohttp: 是否使用 aiohttp（None 表示已安装时使用）
+        """
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.retry_delay = retry_delay
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.max_articles = max_articles
+        self.parse_workers = max(1, parse_workers)
+        self.parse_in_processes = parse_in_processes
+        self.headers = {'User-Agent': user_agent}
+
+        if use_aiohttp and aiohttp is None:
+            logger.warning("未安装 aiohttp，使用 requests 线程池下载")
+        self.backend = BACKEND_AIOHTTP if (use_aiohttp is not False and aiohttp is not None) \
+            else BACKEND_REQUESTS
+
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._parse_executor: Optional[Executor] = None
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._stats = {'runs': 0, 'feeds': 0, 'failed': 0, 'retries': 0,
+                       'bytes': 0, 'articles': 0, 'last_elapsed': 0.0}
+
+    def fetch(self, urls: Iterable[str]) -> List[FeedResult]:
+        """
+        同步抓取（不能在运行中的事件循环里调用，此时请 await fetch_all()）
+
+        Args:
+            urls: 订阅源地址
+
+        Returns:
+            List[FeedResult]: 与 urls 顺序一致的抓取结果
+        """
+        return asyncio.run(self.fetch_all(urls))
+
+    def fetch_articles(self, urls: Iterable[str]) -> List[Article]:
+        """
+        同步抓取并合并文章（去重、按时间排序、截取 max_articles 篇）
+
+        Args:
+            urls: 订阅源地址
+
+        Returns:
+            List[Article]: 文章列表
+        """
+        return collect_articles(self.fetch(urls), self.max_articles)
+
+    async def fetch_all(self, urls: Iterable[str]) -> List[FeedResult]:
+        """
+        并发抓取全部订阅源
+
+        Args:
+            urls: 订阅源地址
+
+        Returns:
+            List[FeedResult]: 与 urls 顺序一致的抓取结果（失败的订阅源 error 非空）
+        """
+        urls = list(urls)
+        start = time.perf_counter()
+        limit = asyncio.Semaphore(self.max_concurrency)
+        hosts: Dict[str, asyncio.Semaphore] = {}
+
+        session = None
+        if self.backend == BACKEND_AIOHTTP:
+            # 并发限制由信号量统一控制，连接池上限与之一致
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency,
+                                             limit_per_host=self.per_host_limit)
+            session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        try:
+            results = await asyncio.gather(*(self._fetch_one(url, limit, hosts, session)
+                                             for url in urls))
+        finally:
+            if session is not None:
+                await session.close()
+
+        elapsed = time.perf_counter() - start
+        failed = sum(not r.ok for r in results)
+        self._stats['runs'] += 1
+        self._stats['feeds'] += len(results)
+        self._stats['failed'] += failed
+        self._stats['retries'] += sum(max(0, r.attempts - 1) for r in results)
+        self._stats['bytes'] += sum(r.size for r in results)
+        self._stats['articles'] += sum(len(r.articles) for r in results)
+        self._stats['last_elapsed'] = elapsed
+        logger.info("订阅源抓取完成: %d 个, 失败 %d 个, 用时 %.2fs (%s)",
+                    len(results), failed, elapsed, self.backend)
+        return results
+
+    async def _fetch_one(self, url: str, limit: asyncio.Semaphore,
+                         hosts: Dict[str, asyncio.Semaphore], session) -> FeedResult:
+        """抓取并解析单个订阅源（含重试）"""
+        start = time.perf_counter()
+        result = FeedResult(url)
+        host = urlsplit(url).netloc
+        host_limit = hosts.get(host)
+        if host_limit is None:
+            host_limit = hosts[host] = asyncio.Semaphore(self.per_host_limit)
+
+        error = None
+        for attempt in range(self.retries + 1):
+            result.attempts = attempt + 1
+            error = None
+            try:
+                # 先占主机名额再占全局名额，避免等待同一主机的请求占满全局并发
+                async with host_limit, limit:
+                    status, content = await asyncio.wait_for(self._download(url, session),
+                                                             self.timeout)
+            except asyncio.TimeoutError:
+                error = f"超时 ({self.timeout}s)"
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                result.status = status
+                if 200 <= status < 300:
+                    result.size = len(content)
+                    try:
+                        result.title, result.articles = await self._parse(url, content)
+                    except Exception as e:
+                        error = f"解析失败: {e}"
+                    break
+                error = f"HTTP {status}"
+                if status < 500 and status != 429:
+                    break
+
+            if attempt < self.retries:
+                await asyncio.sleep(self.retry_delay)
+
+        result.error = error
+        result.elapsed = time.perf_counter() - start
+        if error is not None:
+            logger.warning("订阅源抓取失败: %s (%s, 尝试 %d 次)", url, error, result.attempts)
+        return result
+
+    async def _download(self, url: str, session) -> Tuple[int, bytes]:
+        """下载订阅源，返回 (状态码, 内容)"""
+        if session is not None:
+            async with session.get(url) as response:
+                return response.status, await response.read()
+
+        # requests 在线程池中执行；超时后线程仍会等到 requests 自身的超时才释放
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_executor(), self._download_sync, url)
+
+    def _download_sync(self, url: str) -> Tuple[int, bytes]:
+        """requests 下载（每个线程复用自己的会话以保持连接）"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self.headers)
+            with self._sessions_lock:
+                self._sessions.append(session)
+        response = session.get(url, timeout=self.timeout)
+        return response.status_code, response.content
+
+    async def _parse(self, url: str, content: bytes) -> Tuple[str, List[Article]]:
+        """在事件循环之外解析"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_parse_executor(), parse_feed,
+                                          url, content, self.max_articles)
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                   thread_name_prefix="rss-download")
+        return self._io_executor
+
+    def _get_parse_executor(self) -> Executor:
+        if self._parse_executor is None:
+            if self.parse_in_processes:
+                self._parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+            else:
+                self._parse_executor = ThreadPoolExecutor(max_workers=self.parse_workers,
+                                                          thread_name_prefix="rss-parse")
+        return self._parse_executor
+
+    def get_stats(self) -> dict:
+        """
+        获取抓取统计信息
+
+        Returns:
+            dict: runs、feeds、failed、retries、bytes、articles、last_elapsed、backend
+        """
+        return dict(self._stats, backend=self.backend)
+
+    def close(self):
+        """关闭线程池（进程池）与 HTTP 会话"""
+        for executor in (self._io_executor, self._parse_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._io_executor = None
+        self._parse_executor = None
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def create_rss_fetcher(config) -> AsyncRSSFetcher:
+    """
+    创建 RSS 抓取器（工厂函数）
+
+    Args:
+        config: Config 配置对象（使用 network 与 services 配置）
+
+    Returns:
+        AsyncRSSFetcher: 抓取器实例
+    """
+    network = config.network
+    return AsyncRSSFetcher(
+        timeout=network.timeout_seconds,
+        retries=network.retries,
+        retry_delay=network.retry_delay,
+        max_concurrency=network.max_concurrency,
+        per_host_limit=network.per_host_limit,
+        max_articles=config.services.max_articles_per_fetch,
+        user_agent=network.user_agent,
+    )
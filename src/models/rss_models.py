@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+RSS 数据模型
+抓取器输出的文章与单个订阅源的抓取结果
+
+文章可通过 to_dict() 转为渲染器使用的字典（title / summary / source / published / image_url）
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Article:
+    """一篇文章（来自订阅源的一个条目）"""
+    title: str
+    summary: str = ""
+    link: str = ""
+    source: str = ""
+    published: str = ""                # ISO 8601（UTC，如 2025-12-26T08:00:00Z），未知时为空
+    image_url: Optional[str] = None
+    feed_url: str = ""
+
+    @property
+    def key(self) -> str:
+        """去重键（优先使用链接）"""
+        return self.link or f"{self.feed_url}#{self.title}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转为渲染器使用的文章字典（省略空的配图地址）"""
+        data = asdict(self)
+        if not self.image_url:
+            del data['image_url']
+        return data
+
+
+@dataclass
+class FeedResult:
+    """单个订阅源的抓取结果"""
+    url: str
+    articles: List[Article] = field(default_factory=list)
+    title: str = ""
+    status: Optional[int] = None       # HTTP 状态码（连接失败或超时时为 None）
+    error: Optional[str] = None
+    attempts: int = 0
+    size: int = 0                      # 响应字节数
+    elapsed: float = 0.0               # 从开始到完成（含重试等待）的秒数
+
+    @property
+    def ok(self) -> bool:
+        """是否抓取并解析成功"""
+        return self.error is None
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+配置热加载
+监视 config.yml，变化后重新加载并与当前配置比较，只通知受影响的组件
+
+功能：
+- 文件监视（inotify，不可用时轮询）
+- 新配置解析或校验失败时保留当前配置
+- 订阅者按配置节过滤，只在相关节变化时收到 (新配置, 变化) 回调
+
+用法:
+    reloader = create_config_reloader(config)
+    reloader.subscribe(render_ahead.apply_config, sections=('display',))  # 在渲染锁下重配置渲染器
+    reloader.subscribe(driver.apply_config, sections=('refresh',))
+    reloader.subscribe(lambda cfg, _: configure_tracing(cfg.tracing), sections=('tracing',))
+    reloader.start()
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import Config, diff_config
+
+from .file_watcher import FileWatcher
+
+logger = logging.getLogger(__name__)
+
+# 订阅回调: (新配置, {配置节: {字段: (旧值, 新值)}})
+ReloadCallback = Callable[[Config, Dict[str, Dict[str, tuple]]], None]
+
+
+class ConfigReloader:
+    """
+    配置热加载器
+
+    回调在监视线程中执行（手动调用 reload() 时在调用线程中执行），
+    订阅的组件须自行与其工作线程同步（如 RenderAhead.apply_config 持有渲染锁）
+    """
+
+    def __init__(self, config: Config, interval: float = 1.0, debounce: float = 0.2,
+                 use_inotify: bool = True):
+        """
+        初始化热加载器（start() 后开始监视）
+
+        Args:
+            config: 当前配置
+            interval: 轮询间隔（秒，inotify 不可用时）
+            debounce: 去抖时间（秒）
+            use_inotify: 是否优先使用 inotify
+        """
+        self.config = config
+        self._subscribers: List[Tuple[ReloadCallback, Optional[frozenset]]] = []
+        self._lock = threading.Lock()
+        self._watcher = FileWatcher(config.config_path, self.reload, interval=interval,
+                                    debounce=debounce, use_inotify=use_inotify)
+        self._stats = {'reloads': 0, 'unchanged': 0, 'failures': 0}
+
+    @property
+    def backend(self) -> Optional[str]:
+        """文件监视方式（'inotify' / 'polling'，未启动时为 None）"""
+        return self._watcher.backend
+
+    def subscribe(self, callback: ReloadCallback, sections: Optional[Iterable[str]] = None):
+        """
+        订阅配置变化
+
+        Args:
+            callback: 回调 (新配置, 变化)
+            sections: 关注的配置节（None 表示任意变化）
+        """
+        self._subscribers.append((callback, frozenset(sections) if sections else None))
+
+    def reload(self) -> Dict[str, Dict[str, tuple]]:
+        """
+        重新加载配置并通知订阅者
+
+        Returns:
+            dict: 配置变化（无变化或加载失败时为空）
+        """
+        with self._lock:
+            old = self.config
+            try:
+                new = Config(old.config_path, old.cache_dir)
+            except Exception as e:
+                self._stats['failures'] += 1
+                logger.error(f"配置重新加载失败，继续使用当前配置: {e}")
+                return {}
+
+            changes = diff_config(old, new)
+            if not changes:
+                self._stats['unchanged'] += 1
+                return {}
+
+            self.config = new
+            self._stats['reloads'] += 1
+            summary = ', '.join(f"{name}.{key}" for name, fields in changes.items() for key in fields)
+            logger.info(f"配置已重新加载: {summary}")
+
+            for callback, sections in self._subscribers:
+                if sections is not None and sections.isdisjoint(changes):
+                    continue
+                try:
+                    callback(new, changes)
+                except Exception as e:
+                    logger.error(f"配置变化处理失败 ({getattr(callback, '__qualname__', callback)}): {e}")
+
+            return changes
+
+    def start(self):
+        """开始监视配置文件"""
+        self._watcher.start()
+        logger.info(f"配置热加载已启用 ({self.backend}): {self.config.config_path}")
+
+    def stop(self):
+        """停止监视"""
+        self._watcher.stop()
+
+    def get_stats(self) -> dict:
+        """获取热加载统计信息"""
+        return dict(self._stats, backend=self.backend, events=self._watcher.events)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+
+def create_config_reloader(config: Config, interval: float = 1.0) -> ConfigReloader:
+    """
+    创建配置热加载器（工厂函数）
+
+    Args:
+        config: 当前配置
+        interval: 轮询间隔（秒，inotify 不可用时）
+
+    Returns:
+        ConfigReloader: 热加载器实例
+    """
+    return ConfigReloader(config, interval=interval)
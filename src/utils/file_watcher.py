@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+文件变化监视
+优先使用 inotify（通过 ctypes 调用 libc，无需额外依赖），不可用时回退到定时 stat 轮询
+
+功能：
+- 监视文件所在目录，编辑器“写临时文件再重命名”的保存方式同样能检测到
+- 去抖：短时间内的多次写入只触发一次回调
+- 后台守护线程，stop() 立即返回（inotify 模式通过管道唤醒）
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 监视方式
+BACKEND_INOTIFY = "inotify"
+BACKEND_POLLING = "polling"
+
+# inotify 事件（linux/inotify.h）
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def _load_inotify():
+    """加载 libc 中的 inotify 函数（不支持时返回 None）"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """
+    单个文件的变化监视器
+
+    回调在监视线程中执行，不带参数
+    """
+
+    def __init__(self, path: str, callback: Callable[[], None],
+                 interval: float = 1.0, debounce: float = 0.2, use_inotify: bool = True):
+        """
+        初始化监视器（start() 后开始监视）
+
+        Args:
+            path: 文件路径
+            callback: 文件变化时的回调
+            interval: 轮询间隔（秒，仅轮询模式）
+            debounce: 去抖时间（秒），最后一次变化后静默这么久才触发回调
+            use_inotify: 是否优先使用 inotify
+        """
+        self.path = Path(path).absolute()
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+
+        self.backend: Optional[str] = None
+        self.events = 0  # 已触发的回调次数
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._inotify_fd: Optional[int] = None
+        self._wake_pipe: Optional[Tuple[int, int]] = None
+
+    def start(self):
+        """启动监视线程"""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        if self.use_inotify and self._open_inotify():
+            self.backend = BACKEND_INOTIFY
+            target = self._run_inotify
+        else:
+            self.backend = BACKEND_POLLING
+            target = self._run_polling
+
+        self._thread = threading.Thread(target=target, name="FileWatcher", daemon=True)
+        self._thread.start()
+        logger.debug(f"开始监视文件 ({self.backend}): {self.path}")
+
+    def stop(self):
+        """停止监视线程"""
+        self._stop.set()
+        if self._wake_pipe is not None:
+            os.write(self._wake_pipe[1], b'\0')
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._close_inotify()
+
+    def _open_inotify(self) -> bool:
+        """创建 inotify 实例并监视文件所在目录"""
+        libc = _load_inotify()
+        if libc is None:
+            return False
+
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            logger.debug(f"inotify 不可用: {os.strerror(ctypes.get_errno())}")
+            return False
+
+        wd = libc.inotify_add_watch(fd, os.fsencode(self.path.parent), _IN_WATCH_MASK)
+        if wd < 0:
+            logger.debug(f"inotify 监视失败: {os.strerror(ctypes.get_errno())}")
+            os.close(fd)
+            return False
+
+        self._inotify_fd = fd
+        self._wake_pipe = os.pipe()
+        return True
+
+    def _close_inotify(self):
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        if self._wake_pipe is not None:
+            for fd in self._wake_pipe:
+                os.close(fd)
+            self._wake_pipe = None
+
+    def _read_events(self) -> bool:
+        """读取所有待处理的 inotify 事件，返回是否涉及被监视的文件"""
+        name = os.fsencode(self.path.name)
+        matched = False
+        while True:
+            try:
+                data = os.read(self._inotify_fd, 4096)
+            except BlockingIOError:
+                return matched
+
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                if data[offset:offset + length].rstrip(b'\0') == name:
+                    matched = True
+                offset += length
+
+    def _run_inotify(self):
+        """inotify 监视循环"""
+        fd, wake = self._inotify_fd, self._wake_pipe[0]
+        pending = False
+
+        while not self._stop.is_set():
+            # 有待触发的变化时只等待去抖时间
+            ready, _, _ = select.select([fd, wake], [], [], self.debounce if pending else None)
+            if self._stop.is_set():
+                return
+
+            if fd in ready:
+                pending = self._read_events() or pending
+            elif pending:
+                pending = False
+                self._notify()
+
+    def _stat(self) -> Optional[tuple]:
+        try:
+            stat = self.path.stat()
+            return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            return None
+
+    def _run_polling(self):
+        """轮询监视循环"""
+        last = self._stat()
+        changed_at = None
+
+        while not self._stop.wait(min(self.interval, self.debounce) if changed_at else self.interval):
+            current = self._stat()
+            if current != last:
+                last = current
+                changed_at = time.monotonic()
+            elif changed_at is not None and time.monotonic() - changed_at >= self.debounce:
+                changed_at = None
+                self._notify()
+
+    def _notify(self):
+        """执行回调（异常只记录日志，不终止监视）"""
+        self.events += 1
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error(f"文件变化回调失败: {e}")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
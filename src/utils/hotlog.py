@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+热路径日志
+用于每张卡片、每次字号试探、每次取字体都会经过的代码路径
+
+功能：
+- HOT_DEBUG 开关：启动时从环境变量 EPAPER_HOT_DEBUG 读取一次，之后不变；
+  排版/渲染循环中的调试日志写成 `if HOT_DEBUG: ...`，关闭时只剩一次全局变量判断，
+  不查询日志级别、不构造参数
+- 延迟格式化：消息使用 %-格式和参数，级别未启用时不格式化；
+  计算代价高的参数用 lazy(fn) 包装，真正写出时才求值
+- 按调用点采样与限速：同一条消息模板每 N 次只写一次，和/或每秒最多 R 条；
+  被跳过的条数附在下一条写出的日志末尾
+
+用法:
+    from utils.hotlog import HOT_DEBUG, get_hot_logger, lazy
+
+    hot = get_hot_logger(__name__)
+
+    if HOT_DEBUG:
+        hot.debug("字号试探: %dpx", size, every=10)
+    hot.warning("帧缓存未命中: %s", lazy(lambda: key.hex()), per_second=1)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# 热路径调试开关（EPAPER_HOT_DEBUG=1 启用）
+HOT_DEBUG = os.environ.get("EPAPER_HOT_DEBUG", "").lower() not in ("", "0", "false", "no")
+
+
+class lazy:
+    """延迟求值的日志参数（仅在日志真正格式化时调用 fn）"""
+
+    __slots__ = ('fn',)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return str(self.fn())
+
+    def __repr__(self) -> str:
+        return repr(self.fn())
+
+
+class _CallSite:
+    """单个调用点（消息模板）的采样与限速状态"""
+
+    __slots__ = ('count', 'tokens', 'stamp', 'emitted', 'suppressed', 'pending')
+
+    def __init__(self, per_second: Optional[float]):
+        self.count = 0
+        self.tokens = max(1.0, per_second) if per_second else 0.0
+        self.stamp = time.monotonic()
+        self.emitted = 0
+        self.suppressed = 0   # 累计跳过条数
+        self.pending = 0      # 上次写出后跳过的条数
+
+
+class HotLogger:
+    """
+    带采样与限速的日志记录器包装
+
+    调用点以消息模板区分（模板应为字面量，参数放在 *args 中）；
+    采样间隔与限速取各调用点第一次调用时的值
+    """
+
+    def __init__(self, logger: logging.Logger):
+        """
+        初始化
+
+        Args:
+            logger: 实际写出的日志记录器
+        """
+        self.logger = logger
+        self._sites: Dict[str, _CallSite] = {}
+        self._lock = threading.Lock()
+
+    def debug(self, msg: str, *args, every: int = 1, per_second: Optional[float] = None) -> bool:
+        return self._log(logging.DEBUG, msg, args, every, per_second)
+
+    def info(self, msg: str, *args, every: int = 1, per_second: Optional[float] = None) -> bool:
+        return self._log(logging.INFO, msg, args, every, per_second)
+
+    def warning(self, msg: str, *args, every: int = 1, per_second: Optional[float] = None) -> bool:
+        return self._log(logging.WARNING, msg, args, every, per_second)
+
+    def error(self, msg: str, *args, every: int = 1, per_second: Optional[float] = None) -> bool:
+        return self._log(logging.ERROR, msg, args, every, per_second)
+
+    def _log(self, level: int, msg: str, args: tuple, every: int,
+             per_second: Optional[float]) -> bool:
+        """
+        按采样和限速决定是否写出
+
+        Returns:
+            bool: 本次是否写出
+        """
+        # 级别未启用时不占用调用点状态
+        if not self.logger.isEnabledFor(level):
+            return False
+
+        with self._lock:
+            site = self._sites.get(msg)
+            if site is None:
+                site = self._sites[msg] = _CallSite(per_second)
+
+            site.count += 1
+            if every > 1 and site.count % every != 1:
+                site.suppressed += 1
+                site.pending += 1
+                return False
+
+            if per_second:
+                # 令牌桶：容量为每秒条数（至少 1），按经过的时间补充
+                now = time.monotonic()
+                capacity = max(1.0, per_second)
+                site.tokens = min(capacity, site.tokens + (now - site.stamp) * per_second)
+                site.stamp = now
+                if site.tokens < 1.0:
+                    site.suppressed += 1
+                    site.pending += 1
+                    return False
+                site.tokens -= 1.0
+
+            skipped, site.pending = site.pending, 0
+            site.emitted += 1
+
+        if skipped:
+            msg = msg + " (已跳过 %d 条)"
+            args = args + (skipped,)
+        # stacklevel=3：记录调用 debug()/info() 的位置而不是本方法
+        self.logger.log(level, msg, *args, stacklevel=3)
+        return True
+
+    def get_stats(self) -> Dict[str, dict]:
+        """
+        获取各调用点统计
+
+        Returns:
+            dict: {消息模板: {'calls', 'emitted', 'suppressed'}}
+        """
+        with self._lock:
+            return {msg: {'calls': site.count, 'emitted': site.emitted,
+                          'suppressed': site.suppressed}
+                    for msg, site in self._sites.items()}
+
+    def reset(self):
+        """清空调用点状态"""
+        with self._lock:
+            self._sites.clear()
+
+
+_hot_loggers: Dict[str, HotLogger] = {}
+_hot_loggers_lock = threading.Lock()
+
+
+def get_hot_logger(name: Optional[str] = None) -> HotLogger:
+    """
+    获取热路径日志记录器（同名返回同一实例）
+
+    Args:
+        name: 日志记录器名称，通常为 __name__
+
+    Returns:
+        HotLogger: 热路径日志记录器
+    """
+    with _hot_loggers_lock:
+        hot = _hot_loggers.get(name)
+        if hot is None:
+            hot = _hot_loggers[name] = HotLogger(logging.getLogger(name))
+        return hot
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+内存环形日志缓冲
+日志先写入内存（可选镜像到 tmpfs），再按批写入 SD 卡上的日志文件，减少小块写入造成的磨损和 I/O 停顿
+
+功能：
+- 定时批量写出（flush_interval 秒）；缓冲超过一半容量、出现 WARNING 及以上时提前写出
+- 定时与容量触发的写出在后台线程中进行；WARNING 及以上在记录线程中同步写出（确保已落盘）
+- 缓冲写满（后台线程来不及写出）时丢弃最旧的一半记录并计数
+- 每日写入字节上限：超出后当天剩余的日志丢弃，只写一条提示
+- 可选 tmpfs 镜像（ring_dir）：进程崩溃后重启时先写出上次未写出的日志，当日写入量也保存在其中
+- 日志文件按大小轮转（同 RotatingFileHandler 的命名）
+
+用法:
+    handler = RingBufferHandler("data/logs/service.log", ring_size=256 * 1024,
+                                flush_interval=300, daily_max_bytes=5 * 1024 * 1024)
+    logging.getLogger().addHandler(handler)
+"""
+
+import datetime
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    内存环形缓冲日志处理器
+
+    锁顺序：_flush_lock → 处理器锁；emit() 在处理器锁内执行，只追加并唤醒后台线程，不直接写文件；
+    WARNING 及以上由 handle() 在释放处理器锁后同步写出
+    """
+
+    def __init__(self, filename: str, ring_size: int = 256 * 1024, flush_interval: float = 300,
+                 flush_level: int = logging.WARNING, daily_max_bytes: int = 0,
+                 max_bytes: int = 0, backup_count: int = 0, ring_dir: Optional[str] = None):
+        """
+        初始化处理器（立即启动后台写出线程）
+
+        Args:
+            filename: 日志文件路径
+            ring_size: 内存缓冲容量（字节），超过一半时提前写出
+            flush_interval: 定时写出间隔（秒）
+            flush_level: 达到该级别的记录立即触发写出
+            daily_max_bytes: 每日写入上限（字节，0 表示不限）
+            max_bytes: 日志文件轮转大小（字节，0 表示不轮转）
+            backup_count: 轮转保留份数
+            ring_dir: tmpfs 镜像目录（如 /dev/shm/epaper-news，None 表示只在进程内存中缓冲）
+        """
+        super().__init__()
+        # 与 FileHandler 一致保存绝对路径（之后改变工作目录不影响写出位置）
+        self.filename = Path(filename).absolute()
+        self.ring_size = ring_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.daily_max_bytes = daily_max_bytes
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._lines: List[bytes] = []
+        self._buffered = 0
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._day = datetime.date.today().isoformat()
+        self._written_today = 0
+        self._cap_noted = False
+        self._stats = {'records': 0, 'flushes': 0, 'bytes_written': 0,
+                       'dropped_overflow': 0, 'dropped_cap': 0, 'write_errors': 0}
+
+        # tmpfs 镜像：未写出的日志与当日写入量
+        self._mirror = None
+        self._quota_path = None
+        if ring_dir:
+            self._open_mirror(Path(ring_dir))
+
+        self._thread = threading.Thread(target=self._run, name="log-ring-flush", daemon=True)
+        self._thread.start()
+
+    def _open_mirror(self, ring_dir: Path):
+        """打开 tmpfs 镜像，恢复上次未写出的日志与当日写入量"""
+        ring_dir.mkdir(parents=True, exist_ok=True)
+        # 多个服务共用同一日志文件时按进程脚本名区分镜像
+        stem = f"{self.filename.name}.{Path(sys.argv[0]).stem or 'python'}"
+        mirror_path = ring_dir / (stem + ".ring")
+        self._quota_path = ring_dir / (stem + ".quota")
+
+        try:
+            quota = json.loads(self._quota_path.read_text(encoding='utf-8'))
+            if quota.get('day') == self._day:
+                self._written_today = int(quota.get('bytes', 0))
+                self._cap_noted = bool(quota.get('cap_noted', False))
+        except (OSError, ValueError):
+            pass
+
+        if mirror_path.exists():
+            for line in mirror_path.read_bytes().splitlines(keepends=True):
+                self._lines.append(line)
+                self._buffered += len(line)
+
+        # 重写镜像（内容与内存缓冲一致），之后只追加
+        self._mirror = open(mirror_path, 'wb', buffering=0)
+        self._mirror.write(b''.join(self._lines))
+        if self._lines:
+            self._wake.set()
+
+    def emit(self, record: logging.LogRecord):
+        """追加到内存缓冲（超过一半容量时唤醒后台线程写出）"""
+        try:
+            line = (self.format(record) + "\n").encode('utf-8')
+            self._lines.append(line)
+            self._buffered += len(line)
+            self._stats['records'] += 1
+            if self._mirror is not None:
+                self._mirror.write(line)
+
+            # 后台线程来不及写出时丢弃最旧的记录（一次腾出一半容量，镜像随之重写）
+            if self._buffered > self.ring_size:
+                dropped = 0
+                while self._buffered * 2 > self.ring_size and len(self._lines) > dropped + 1:
+                    self._buffered -= len(self._lines[dropped])
+                    dropped += 1
+                del self._lines[:dropped]
+                self._stats['dropped_overflow'] += dropped
+                if self._mirror is not None:
+                    self._mirror.seek(0)
+                    self._mirror.truncate()
+                    self._mirror.write(b''.join(self._lines))
+
+            if self._buffered * 2 >= self.ring_size:
+                self._wake.set()
+        except Exception:
+            self.handleError(record)
+
+    def handle(self, record: logging.LogRecord):
+        """记录日志；达到 flush_level 时在释放处理器锁后同步写出（返回时已落盘）"""
+        rv = super().handle(record)
+        if rv and record.levelno >= self.flush_level:
+            self.flush()
+        return rv
+
+    def flush(self):
+        """把缓冲中的日志一次写入日志文件"""
+        with self._flush_lock:
+            self.acquire()
+            try:
+                lines, self._lines, self._buffered = self._lines, [], 0
+                if self._mirror is not None:
+                    self._mirror.seek(0)
+                    self._mirror.truncate()
+            finally:
+                self.release()
+
+            if lines:
+                self._write_batch(lines)
+
+    def _write_batch(self, lines: List[bytes]):
+        """按每日上限截取后写入（调用方持有 _flush_lock）"""
+        today = datetime.date.today().isoformat()
+        if today != self._day:
+            self._day, self._written_today, self._cap_noted = today, 0, False
+
+        # 计入上限的字节数（每日上限提示本身不计入）
+        size = 0
+        kept = len(lines)
+        if self.daily_max_bytes > 0:
+            allowed = self.daily_max_bytes - self._written_today
+            for n, line in enumerate(lines):
+                if size + len(line) > allowed:
+                    kept = n
+                    break
+                size += len(line)
+        else:
+            size = sum(len(line) for line in lines)
+
+        if kept < len(lines):
+            self._stats['dropped_cap'] += len(lines) - kept
+            lines = lines[:kept]
+            if not self._cap_noted:
+                self._cap_noted = True
+                lines.append(f"{datetime.datetime.now():%Y-%m-%d %H:%M:%S} - {__name__} - "
+                             f"[WARNING] - 日志已达当日写入上限 {self.daily_max_bytes} 字节，"
+                             f"今天之后的日志将被丢弃\n".encode('utf-8'))
+        if not lines:
+            return
+
+        data = b''.join(lines)
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            self._rotate_if_needed(len(data))
+            with open(self.filename, 'ab') as f:
+                f.write(data)
+        except OSError as e:
+            self._stats['write_errors'] += 1
+            sys.stderr.write(f"日志写入失败: {self.filename}: {e}\n")
+            return
+
+        self._written_today += size
+        self._stats['flushes'] += 1
+        self._stats['bytes_written'] += len(data)
+        self._save_quota()
+
+    def _rotate_if_needed(self, incoming: int):
+        """写入后超过轮转大小时先轮转（service.log → service.log.1 → ...）"""
+        if self.max_bytes <= 0:
+            return
+        try:
+            current = self.filename.stat().st_size
+        except FileNotFoundError:
+            return
+        if current == 0 or current + incoming <= self.max_bytes:
+            return
+
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = Path(f"{self.filename}.{i}")
+                if src.exists():
+                    os.replace(src, f"{self.filename}.{i + 1}")
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            self.filename.unlink()
+
+    def _save_quota(self):
+        """保存当日写入量到 tmpfs（进程重启后继续计数）"""
+        if self._quota_path is None:
+            return
+        try:
+            self._quota_path.write_text(json.dumps({'day': self._day, 'bytes': self._written_today,
+                                                    'cap_noted': self._cap_noted}),
+                                        encoding='utf-8')
+        except OSError:
+            pass
+
+    def _run(self):
+        """后台线程：定时或被唤醒时写出"""
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed:
+                break
+            self.flush()
+
+    def get_stats(self) -> dict:
+        """
+        获取统计信息
+
+        Returns:
+            dict: buffered（当前缓冲字节）、records、flushes、bytes_written、
+                  written_today、dropped_overflow、dropped_cap、write_errors
+        """
+        return dict(self._stats, buffered=self._buffered, written_today=self._written_today)
+
+    def close(self):
+        """停止后台线程并写出全部缓冲"""
+        if not self._closed:
+            self._closed = True
+            self._wake.set()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self.flush()
+            if self._mirror is not None:
+                self._mirror.close()
+                self._mirror = None
+        super().close()
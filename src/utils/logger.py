@@ -5,24 +5,162 @@ Logger Utility
 
 基于 DEVELOPMENT_GUIDE.md 第7.1节实现
 提供统一的日志系统配置和工具函数
+
+非阻塞日志：
+- 业务线程只把日志记录放入有界队列（QueueHandler），文件与控制台写入由后台线程完成
+- 队列满时按丢弃策略处理（丢弃新记录或最旧的记录），不阻塞渲染/显示线程
+- 队列深度与丢弃计数可通过 get_logging_stats() 查询
+
+内存环形缓冲（logging.ring_enabled）：
+- 日志文件改为先写内存缓冲，按间隔、WARNING 及以上或退出时批量写入（见 log_ring.py）
+- 每日写入字节有上限，减少 SD 卡磨损和刷新时的 I/O 停顿
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
+
+from .log_ring import RingBufferHandler
 
 # 模块级日志记录器
 logger = logging.getLogger(__name__)
 
+# 队列满时的丢弃策略
+DROP_NEW = "drop_new"        # 丢弃新记录（WARNING 及以上改为丢弃最旧的记录）
+DROP_OLDEST = "drop_oldest"  # 丢弃队列中最旧的记录
+
+LOG_FORMAT = '%(asctime)s - %(name)s - [%(levelname)s] - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    有界队列日志处理器
+
+    emit() 从不阻塞：队列满时按丢弃策略丢弃一条记录并计数
+    （Handler.handle() 持有处理器锁调用 emit()，计数无需另加锁）
+    """
+
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = DROP_NEW):
+        """
+        初始化处理器
+
+        Args:
+            log_queue: 有界队列（queue.Queue(maxsize)）
+            drop_policy: 丢弃策略（drop_new / drop_oldest）
+        """
+        super().__init__(log_queue)
+        if drop_policy not in (DROP_NEW, DROP_OLDEST):
+            raise ValueError(f"无效的日志丢弃策略: {drop_policy}")
+        self.drop_policy = drop_policy
+        self.enqueued = 0
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        """放入队列（满时按丢弃策略处理）"""
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+            return
+        except queue.Full:
+            pass
+
+        self.dropped += 1
+        if self.drop_policy == DROP_NEW and record.levelno < logging.WARNING:
+            return
+
+        # 腾出一个位置给新记录（后台线程可能同时取走记录，失败时放弃）
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            pass
+
+
+class BoundedQueueListener(QueueListener):
+    """后台写日志线程（停止时阻塞等待队列腾出位置放入结束标记）"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+# 当前生效的队列处理器与后台线程
+_queue_handler: Optional[BoundedQueueHandler] = None
+_listener: Optional[BoundedQueueListener] = None
+_ring_handler: Optional[RingBufferHandler] = None
+
+
+def _parse_level(name: str) -> int:
+    """日志级别名称转为数值"""
+    level = logging.getLevelName(name.upper())
+    if not isinstance(level, int):
+        raise ValueError(
+            f"无效的日志级别: {name}\n"
+            f"有效级别: DEBUG, INFO, WARNING, ERROR, CRITICAL"
+        )
+    return level
+
+
+def _create_output_handlers(config, formatter: logging.Formatter,
+                            log_level: int) -> List[logging.Handler]:
+    """创建实际写出的处理器（文件轮转 + 控制台）"""
+    global _ring_handler
+
+    handlers = []
+    cfg = config.logging
+    log_file = Path(cfg.logfile)
+
+    # Handler 1: 文件轮转（防止日志占满磁盘），可选先经内存环形缓冲批量写出
+    try:
+        if cfg.ring_enabled:
+            file_handler = _ring_handler = RingBufferHandler(
+                log_file,
+                ring_size=cfg.ring_size,
+                flush_interval=cfg.flush_interval,
+                flush_level=_parse_level(cfg.flush_level),
+                daily_max_bytes=cfg.daily_max_bytes,
+                max_bytes=cfg.max_log_size,
+                backup_count=cfg.backup_count,
+                ring_dir=cfg.ring_dir or None
+            )
+        else:
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=cfg.max_log_size,
+                backupCount=cfg.backup_count,
+                encoding='utf-8'
+            )
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(log_level)
+        handlers.append(file_handler)
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"无法创建文件日志处理器: {e}")
+
+    # Handler 2: 控制台输出（方便调试）
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(log_level)
+    handlers.append(console_handler)
+
+    return handlers
+
 
 def setup_logging(config) -> logging.Logger:
     """
     配置全局日志系统
 
     基于 DEVELOPMENT_GUIDE.md 第7.1节实现
-    支持文件轮转和控制台双输出
+    支持文件轮转和控制台双输出；logging.queue_size > 0 时经有界队列由后台线程写出
 
     Args:
         config: Config 配置对象，包含 logging 配置
@@ -31,18 +169,14 @@ def setup_logging(config) -> logging.Logger:
         logging.Logger: 配置好的根日志记录器
 
     Raises:
-        ValueError: 如果日志级别无效
+        ValueError: 如果日志级别或丢弃策略无效
         OSError: 如果无法创建日志文件
     """
+    global _queue_handler, _listener
+
     # 获取日志级别
     log_level_str = config.logging.level.upper()
-    try:
-        log_level = getattr(logging, log_level_str)
-    except AttributeError:
-        raise ValueError(
-            f"无效的日志级别: {config.logging.level}\n"
-            f"有效级别: DEBUG, INFO, WARNING, ERROR, CRITICAL"
-        )
+    log_level = _parse_level(log_level_str)
 
     # 日志文件路径
     log_file = Path(config.logging.logfile)
@@ -53,38 +187,32 @@ def setup_logging(config) -> logging.Logger:
     except OSError as e:
         raise OSError(f"无法创建日志目录: {log_file.parent}: {e}")
 
+    # 重复调用时先停止旧的后台线程（写完已排队的记录）
+    shutdown_logging()
+
     # 配置根记录器
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # 清除旧的 handlers 避免重复添加
-    root_logger.handlers.clear()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
 
     # 定义日志格式
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - [%(levelname)s] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    handlers = _create_output_handlers(config, formatter, log_level)
 
-    # Handler 1: 文件轮转（防止日志占满磁盘）
-    try:
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=config.logging.max_log_size,
-            backupCount=config.logging.backup_count,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(log_level)
-        root_logger.addHandler(file_handler)
-    except Exception as e:
-        logger.error(f"无法创建文件日志处理器: {e}")
-
-    # Handler 2: 控制台输出（方便调试）
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(log_level)
-    root_logger.addHandler(console_handler)
+    queue_size = config.logging.queue_size
+    if queue_size > 0:
+        _queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size),
+                                             drop_policy=config.logging.drop_policy)
+        _listener = BoundedQueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        root_logger.addHandler(_queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # 记录初始化信息
     logger.info("=" * 60)
@@ -92,11 +220,70 @@ def setup_logging(config) -> logging.Logger:
     logger.info(f"日志级别: {log_level_str}")
     logger.info(f"日志文件: {log_file.absolute()}")
     logger.info(f"文件轮转: {config.logging.max_log_size / 1024 / 1024:.1f}MB x {config.logging.backup_count} 份")
+    if queue_size > 0:
+        logger.info(f"异步写出: 队列 {queue_size} 条, 队列满时 {config.logging.drop_policy}")
+    if config.logging.ring_enabled:
+        cap = config.logging.daily_max_bytes
+        logger.info(f"内存缓冲: {config.logging.ring_size / 1024:.0f}KB, "
+                    f"每 {config.logging.flush_interval:g}s 或 {config.logging.flush_level} 及以上写出, "
+                    f"每日上限 {f'{cap / 1024 / 1024:.1f}MB' if cap else '不限'}")
     logger.info("=" * 60)
 
     return root_logger
 
 
+def shutdown_logging():
+    """停止后台写日志线程（已排队及内存缓冲中的记录全部写出后返回）"""
+    global _queue_handler, _listener, _ring_handler
+
+    # 先摘下队列处理器，之后的日志不再进入即将停止的队列
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+    # 同步模式下内存缓冲直接挂在根记录器上
+    if _ring_handler is not None:
+        root = logging.getLogger()
+        if _ring_handler in root.handlers:
+            root.removeHandler(_ring_handler)
+        _ring_handler.close()
+        _ring_handler = None
+
+
+def get_logging_stats() -> dict:
+    """
+    获取日志队列统计信息
+
+    Returns:
+        dict: queue_depth（当前排队数）、queue_size（容量）、enqueued、dropped、drop_policy；
+              未启用队列时返回 {'async': False}；
+              启用内存缓冲时另含 ring（见 RingBufferHandler.get_stats()）
+    """
+    handler = _queue_handler
+    if handler is None:
+        stats = {'async': False}
+    else:
+        stats = {
+            'async': True,
+            'queue_depth': handler.queue.qsize(),
+            'queue_size': handler.queue.maxsize,
+            'enqueued': handler.enqueued,
+            'dropped': handler.dropped,
+            'drop_policy': handler.drop_policy,
+        }
+
+    ring = _ring_handler
+    if ring is not None:
+        stats['ring'] = ring.get_stats()
+    return stats
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     获取日志记录器
@@ -110,6 +297,9 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# 进程退出前写完队列中的日志
+atexit.register(shutdown_logging)
+
 # 便捷别名
 setup = setup_logging
 get = get_logger
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Tracing Utility
+分阶段耗时追踪模块
+
+为一次显示周期中的各阶段（配置加载、字体加载、排版、绘制、打包、SPI 传输、
+查找表上传、BUSY 等待、睡眠/唤醒）记录耗时：
+- span() 上下文管理器 / traced() 装饰器标记阶段
+- 按阶段名聚合直方图（对数分桶，提供 p50/p90/p99）
+- 按需导出一个周期的 Chrome trace-event JSON（chrome://tracing 或 Perfetto 打开）
+
+关闭时 span() 返回共享的空上下文，不读时钟、不创建计时对象；
+调用本身仍会打包关键字参数（**args），热路径上可先判断 get_tracer().enabled。
+
+配置加载阶段（config.load）只在 configure_tracing() 之后的加载中记录，即热加载时；
+进程启动时的首次加载发生在读取 tracing 配置之前，不会被追踪。
+
+用法:
+    from utils.tracing import span, get_tracer
+
+    with span("render.layout"):
+        ...
+
+    tracer = get_tracer()
+    tracer.request_export()            # 下一个周期结束时写出 trace 文件
+    with tracer.cycle("display"):
+        ...
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 直方图桶数：第 i 桶覆盖 [2^(i-1), 2^i) 微秒，最后一桶约 2^38 微秒（~3 天）
+_BUCKETS = 40
+
+# 周期事件: (阶段名, 开始时间 ns, 耗时 ns, 线程 ID, 参数)
+_Event = Tuple[str, int, int, int, Optional[Dict[str, Any]]]
+
+
+class _NullSpan:
+    """追踪关闭时使用的空上下文（全局共享一个实例）"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """一次阶段计时"""
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.tracer._record(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+class Histogram:
+    """
+    耗时直方图（按微秒取对数分桶）
+
+    百分位取所在桶的上界，误差不超过 2 倍，足以定位耗时集中在哪个量级
+    """
+    __slots__ = ('count', 'total_ns', 'min_ns', 'max_ns', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * _BUCKETS
+
+    def add(self, duration_ns: int):
+        """记录一次耗时"""
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        self.buckets[min((duration_ns // 1000).bit_length(), _BUCKETS - 1)] += 1
+
+    def percentile(self, p: float) -> float:
+        """
+        估算百分位耗时
+
+        Args:
+            p: 百分位（0-100）
+
+        Returns:
+            float: 耗时（毫秒），取所在桶的上界且不超过最大值
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(self.count * p / 100 + 0.5))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min((1 << i) / 1000, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+    def to_dict(self) -> Dict[str, float]:
+        """转换为统计字典（毫秒）"""
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+            'min_ms': self.min_ns / 1e6,
+            'max_ms': self.max_ns / 1e6,
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+        }
+
+
+class _Cycle:
+    """一个显示周期：收集期间所有线程的阶段事件"""
+    __slots__ = ('tracer', 'span')
+
+    def __init__(self, tracer: 'Tracer', name: str):
+        self.tracer = tracer
+        self.span = _Span(tracer, name, None)
+
+    def __enter__(self):
+        self.tracer._begin_cycle()
+        self.span.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.span.__exit__(exc_type, exc_val, exc_tb)
+        self.tracer._end_cycle()
+        return False
+
+
+class Tracer:
+    """
+    阶段耗时追踪器
+
+    直方图始终按阶段聚合；事件明细只在 cycle() 内收集（最多 max_events 条），
+    用于导出该周期的 Chrome trace。
+    """
+
+    def __init__(self, enabled: bool = False, trace_dir: str = "data/traces",
+                 max_events: int = 10000):
+        """
+        初始化追踪器
+
+        Args:
+            enabled: 是否启用
+            trace_dir: trace 文件导出目录
+            max_events: 单个周期最多保留的事件数
+        """
+        self.enabled = enabled
+        self.trace_dir = Path(trace_dir)
+        self.max_events = max_events
+
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._events: Optional[List[_Event]] = None   # 当前周期的事件（不在周期内时为 None）
+        self._last_cycle: List[_Event] = []
+        self._dropped = 0
+        self._export_requested = False
+
+    def span(self, name: str, **args) -> Any:
+        """
+        标记一个阶段
+
+        Args:
+            name: 阶段名（如 "render.layout"、"epd.spi_transfer"）
+            **args: 附加到 trace 事件的参数
+
+        Returns:
+            上下文管理器（关闭时为共享的空上下文；参数字典仍由调用方打包）
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, args or None)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """
+        函数装饰器：每次调用记录为一个阶段（是否启用在调用时判断）
+
+        Args:
+            name: 阶段名，默认为函数的限定名
+        """
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name, None):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def cycle(self, name: str = "cycle") -> Any:
+        """
+        标记一个显示周期（收集期间的事件明细，结束时按需导出）
+
+        Args:
+            name: 周期名
+
+        Returns:
+            上下文管理器（关闭时为共享的空上下文）
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _Cycle(self, name)
+
+    def request_export(self):
+        """请求在下一个周期结束时导出 Chrome trace"""
+        self._export_requested = True
+
+    def _record(self, name: str, start_ns: int, duration_ns: int,
+                args: Optional[Dict[str, Any]]):
+        """记录一次阶段耗时"""
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = Histogram()
+            hist.add(duration_ns)
+
+            events = self._events
+            if events is not None:
+                if len(events) < self.max_events:
+                    events.append((name, start_ns, duration_ns, threading.get_ident(), args))
+                else:
+                    self._dropped += 1
+
+    def _begin_cycle(self):
+        with self._lock:
+            self._events = []
+            self._dropped = 0
+
+    def _end_cycle(self):
+        with self._lock:
+            self._last_cycle = self._events or []
+            self._events = None
+            dropped = self._dropped
+
+        if dropped:
+            logger.warning(f"本周期追踪事件超过上限 {self.max_events}，丢弃 {dropped} 条")
+
+        if self._export_requested:
+            self._export_requested = False
+            try:
+                self.export_chrome_trace()
+            except OSError as e:
+                logger.error(f"导出 trace 失败: {e}")
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        最近一个周期的 Chrome trace-event 数据
+
+        Returns:
+            dict: {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        with self._lock:
+            events = list(self._last_cycle)
+
+        origin = min((e[1] for e in events), default=0)
+        pid = os.getpid()
+        trace_events = []
+        for name, start_ns, duration_ns, tid, args in sorted(events, key=lambda e: e[1]):
+            event = {
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': (start_ns - origin) / 1000,
+                'dur': duration_ns / 1000,
+                'pid': pid,
+                'tid': tid,
+            }
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: Optional[str] = None) -> Path:
+        """
+        导出最近一个周期的 Chrome trace JSON
+
+        Args:
+            path: 输出文件路径，默认为 trace_dir/trace-<时间>.json
+
+        Returns:
+            Path: 写出的文件路径
+        """
+        if path is None:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            path = self.trace_dir / f"trace-{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() % 10**6:06d}.json"
+        path = Path(path)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+
+        logger.info(f"trace 已导出: {path}")
+        return path
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """获取各阶段耗时统计（毫秒）"""
+        with self._lock:
+            return {name: hist.to_dict() for name, hist in sorted(self._histograms.items())}
+
+    def reset(self):
+        """清空统计与事件"""
+        with self._lock:
+            self._histograms.clear()
+            self._last_cycle = []
+            if self._events is not None:
+                self._events = []
+
+
+# 进程内共享的追踪器
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """获取全局追踪器"""
+    return _tracer
+
+
+def span(name: str, **args) -> Any:
+    """使用全局追踪器标记一个阶段（见 Tracer.span）"""
+    if not _tracer.enabled:
+        return NULL_SPAN
+    return _Span(_tracer, name, args or None)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """使用全局追踪器的函数装饰器（见 Tracer.traced）"""
+    return _tracer.traced(name)
+
+
+def configure_tracing(config) -> Tracer:
+    """
+    按配置设置全局追踪器
+
+    Args:
+        config: TracingConfig 配置对象（enabled、trace_dir、max_events）
+
+    Returns:
+        Tracer: 全局追踪器
+    """
+    _tracer.enabled = config.enabled
+    _tracer.trace_dir = Path(config.trace_dir)
+    _tracer.max_events = config.max_events
+    logger.info(f"阶段耗时追踪: {'启用' if config.enabled else '关闭'}")
+    return _tracer
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+测试进程池批量渲染
+验证多进程结果与单进程渲染逐字节相同且保持顺序、PNG 输出，并打印不同进程数的吞吐量
+
+用法:
+    python tests/test_batch_renderer.py
+    python -m pytest tests/test_batch_renderer.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image
+
+from config import Config
+from display.batch_renderer import create_batch_renderer
+from display.fonts import create_font_manager
+from display.framebuffer import pack_image
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+
+ARTICLES = [
+    {'title': f'第 {i} 篇：新算法在图像识别任务中表现优异',
+     'summary': f'研究团队开发出一种新的深度学习算法（{i}），在多个基准测试中取得了突破性进展。' * (1 + i % 3),
+     'source': '科技日报', 'published': '2025-12-26T08:00:00Z'}
+    for i in range(10)
+]
+
+
+def reference_frames(cfg):
+    font_mgr = create_font_manager(cfg.display)
+    renderer = create_renderer(cfg, font_mgr, create_layout_engine())
+    return [renderer.render_news_card_frame(a, i, len(ARTICLES)) for i, a in enumerate(ARTICLES, 1)]
+
+
+def test_pool_matches_single_process():
+    cfg = Config("config.yml")
+    expected = reference_frames(cfg)
+
+    with create_batch_renderer(cfg, workers=2, chunksize=3) as batch:
+        assert list(batch.render_frames(ARTICLES)) == expected
+        # 进程池复用
+        assert list(batch.render_frames(ARTICLES[:4], total=len(ARTICLES))) == expected[:4]
+
+    with create_batch_renderer(cfg, workers=1) as batch:
+        assert list(batch.render_frames(ARTICLES)) == expected
+
+
+def test_png_output(tmp_path):
+    cfg = Config("config.yml")
+    expected = reference_frames(cfg)
+
+    with create_batch_renderer(cfg, workers=2) as batch:
+        paths = batch.save_pngs(ARTICLES[:3], str(tmp_path), total=len(ARTICLES))
+
+    assert [p.name for p in paths] == ["card_0001.png", "card_0002.png", "card_0003.png"]
+    for path, frame in zip(paths, expected):
+        with Image.open(path) as image:
+            assert image.size == (cfg.display.width, cfg.display.height)
+            assert pack_image(image) == frame
+
+
+def run_benchmark(count: int = 200):
+    cfg = Config("config.yml")
+    articles = [dict(ARTICLES[i % len(ARTICLES)], id=i) for i in range(count)]
+    print(f"CPU 核数: {os.cpu_count()}")
+
+    baseline = None
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        with create_batch_renderer(cfg, workers=workers, chunksize=8) as batch:
+            list(batch.render_frames(articles[:workers * 2]))  # 预热（启动进程、加载字体）
+            start = time.perf_counter()
+            frames = sum(1 for _ in batch.render_frames(articles))
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers} 个进程: {frames} 张 {elapsed:.2f}s ({frames / elapsed:.0f} 张/秒, "
+              f"加速 {baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+测试字符断行分类表
+验证汉字、假名、谚文、CJK 标点的分类及避头尾断行
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.char_classes import (
+    char_class, classify, iter_runs,
+    CLASS_ALPHA, CLASS_SPACE, CLASS_IDEOGRAPHIC, CLASS_OPEN, CLASS_CLOSE
+)
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def test_char_class():
+    assert char_class("a") == CLASS_ALPHA
+    assert char_class("7") == CLASS_ALPHA
+    assert char_class(" ") == CLASS_SPACE
+    assert char_class("　") == CLASS_SPACE
+    for char in "中文ひらがなカタカナ한국어ｱ𠀀😀":
+        assert char_class(char) == CLASS_IDEOGRAPHIC, char
+    for char in "。、，」）ーっ":
+        assert char_class(char) == CLASS_CLOSE, char
+    for char in "「（《":
+        assert char_class(char) == CLASS_OPEN, char
+
+
+def test_classify_matches_char_class():
+    text = "AI 新闻：「テスト」한국어 𠀀😀 tail\t"
+    assert classify(text) == "".join(char_class(c) for c in text)
+    assert "".join(text[s:e] for _, s, e in iter_runs(text)) == text
+
+
+def test_japanese_and_korean_wrap():
+    cfg = Config("config.yml")
+    font = create_font_manager(cfg.display).get_font(cfg.display.font_size_summary)
+    layout = create_layout_engine()
+    max_width = 100
+
+    for text in ["これは日本語のテキストです。「改行」のテストをします。" * 3,
+                 "한국어텍스트줄바꿈테스트입니다" * 3]:
+        lines = layout.wrap_text(text, font, max_width)
+        logger.info(f"{text[:10]}... → {len(lines)} 行")
+
+        # 不再被当作一个超长单词
+        assert len(lines) > 1
+        assert "".join(lines) == text
+        for line in lines:
+            assert layout._get_text_width(line, font) <= max_width
+            # 避头尾：行首不出现闭合标点，行尾不出现开括号
+            assert char_class(line[0]) != CLASS_CLOSE
+            assert char_class(line[-1]) != CLASS_OPEN
+
+
+if __name__ == "__main__":
+    test_char_class()
+    test_classify_matches_char_class()
+    test_japanese_and_korean_wrap()
+    print("✅ 字符分类测试通过")
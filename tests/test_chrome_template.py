@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+测试静态页面框架模板
+验证模板拼接的页眉与逐字绘制一致、计数器位图缓存有界
+
+用法:
+    python tests/test_chrome_template.py     # 对比逐字绘制与模板拼接的耗时
+    python -m pytest tests/test_chrome_template.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image, ImageDraw
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+
+ARTICLE = {'title': '模板测试', 'summary': '页眉和页脚来自预渲染模板。', 'source': '测试来源',
+           'published': '2025-12-26T08:00:00Z'}
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    return create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def draw_header_directly(renderer, index, total):
+    """不使用模板：逐字绘制页眉"""
+    image = Image.new('1', (renderer.width, renderer.height), 255)
+    renderer._draw_header(ImageDraw.Draw(image), index, total)
+    return image
+
+
+def test_header_matches_direct_drawing():
+    renderer = setup()
+    chrome = renderer._get_chrome()
+
+    for index, total in [(1, 1), (3, 10), (42, 99), (7, 1234), (0, 0)]:
+        image = chrome.new_canvas()
+        region = renderer._layout_header(index, total)
+        chrome.draw_header(image, index, total, renderer._header_text_y(region))
+
+        expected = draw_header_directly(renderer, index, total)
+        header_box = (0, 0, renderer.width, renderer.title_height + 1)
+        assert image.crop(header_box).tobytes() == expected.crop(header_box).tobytes()
+
+    # 固定前缀 + 数字和 "/"，缓存不随文章数增长
+    assert chrome.get_stats()['bitmaps'] <= 13
+
+
+def test_canvas_is_a_copy():
+    renderer = setup()
+    chrome = renderer._get_chrome()
+    base = chrome.base.tobytes()
+
+    renderer.render_news_card(ARTICLE, 5, 9)
+    assert chrome.base.tobytes() == base
+
+    # 显示配置变化后重建模板
+    renderer.clear_cache()
+    assert renderer._chrome is None
+
+
+def run_benchmark(count: int = 300):
+    renderer = setup()
+    renderer.render_news_card(ARTICLE)
+
+    start = time.perf_counter()
+    for i in range(count):
+        draw_header_directly(renderer, i, count)
+    direct = (time.perf_counter() - start) / count
+
+    chrome = renderer._get_chrome()
+    text_y = renderer._header_text_y(renderer._layout_header(1, count))
+    start = time.perf_counter()
+    for i in range(count):
+        chrome.draw_header(chrome.new_canvas(), i, count, text_y)
+    templated = (time.perf_counter() - start) / count
+
+    print(f"画布 + 页眉: 逐字绘制 {direct * 1000:.3f}ms, 模板 {templated * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
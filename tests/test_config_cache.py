@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+测试配置快照缓存
+验证快照命中与失效（mtime、内容摘要、结构变化）、推导值，并打印加载耗时对比
+
+用法:
+    python tests/test_config_cache.py
+    python -m pytest tests/test_config_cache.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import yaml
+
+import config as config_module
+from config import Config
+
+CONFIG_FILE = Path(__file__).parent.parent / "config.yml"
+
+
+def copy_config(tmp_path) -> Path:
+    path = tmp_path / "config.yml"
+    shutil.copy(CONFIG_FILE, path)
+    return path
+
+
+def test_snapshot_opt_in(tmp_path, monkeypatch):
+    path = copy_config(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    cfg = Config(str(path))
+    assert cfg.cache_dir is None and not cfg.from_snapshot
+    cfg.derived
+    assert not (tmp_path / "data" / "cache").exists()
+
+
+def test_snapshot_hit_matches_yaml(tmp_path):
+    path = copy_config(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    first = Config(str(path), cache_dir)
+    assert not first.from_snapshot
+    second = Config(str(path), cache_dir)
+    assert second.from_snapshot
+
+    uncached = Config(str(path), None)
+    for name, _, _ in config_module._SECTIONS:
+        assert asdict(getattr(second, name)) == asdict(getattr(uncached, name)), name
+
+
+def test_derived_values_cached(tmp_path):
+    path = copy_config(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    cfg = Config(str(path), cache_dir)
+    derived = cfg.derived
+    display = cfg.display
+    assert derived.content_width == display.width - 2 * display.margin
+    assert derived.content_height > 0
+    assert derived.max_lines[display.font_size_summary] >= 1
+    assert set(derived.line_heights) == set(derived.max_lines)
+
+    reloaded = Config(str(path), cache_dir)
+    assert reloaded._derived == derived
+
+
+def test_modified_display_not_written(tmp_path):
+    path = copy_config(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    cfg = Config(str(path), cache_dir)
+    cfg.display.margin = 20
+    assert cfg.derived.content_width == cfg.display.width - 40
+
+    # 代码中修改过的配置不写入快照
+    reloaded = Config(str(path), cache_dir)
+    assert reloaded.display.margin != 20
+    assert reloaded._derived is None
+    assert reloaded.derived.content_width == reloaded.display.width - 2 * reloaded.display.margin
+
+
+def test_invalidation(tmp_path):
+    path = copy_config(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    Config(str(path), cache_dir)
+
+    # 只修改 mtime：内容摘要不变，仍然命中
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert Config(str(path), cache_dir).from_snapshot
+
+    # 修改内容：重新解析
+    text = path.read_text(encoding='utf-8').replace("margin: 6", "margin: 8")
+    path.write_text(text, encoding='utf-8')
+    cfg = Config(str(path), cache_dir)
+    assert not cfg.from_snapshot and cfg.display.margin == 8
+    assert Config(str(path), cache_dir).display.margin == 8
+
+    # 配置结构变化（字段或默认值）：旧快照失效
+    snapshot = next((tmp_path / "cache").iterdir())
+    snapshot.write_text(snapshot.read_text(encoding='utf-8').replace(
+        config_module._schema_digest(), "0" * 32), encoding='utf-8')
+    assert not Config(str(path), cache_dir).from_snapshot
+
+    # 损坏的快照文件被忽略
+    snapshot.write_text("{", encoding='utf-8')
+    assert not Config(str(path), cache_dir).from_snapshot
+
+
+def test_prefers_c_loader():
+    if getattr(yaml, '__with_libyaml__', False):
+        assert config_module._YAML_LOADER is yaml.CSafeLoader
+
+
+def run_benchmark(rounds: int = 50):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = copy_config(Path(tmp))
+        cache_dir = str(Path(tmp) / "cache")
+        raw = path.read_bytes()
+
+        def timed(fn):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                fn()
+            return (time.perf_counter() - start) / rounds * 1000
+
+        py_loader = timed(lambda: yaml.load(raw, Loader=yaml.SafeLoader))
+        c_loader = timed(lambda: yaml.load(raw, Loader=config_module._YAML_LOADER))
+        print(f"YAML 解析: 纯 Python {py_loader:.2f}ms, {config_module._YAML_LOADER.__name__} "
+              f"{c_loader:.2f}ms")
+
+        uncached = timed(lambda: Config(str(path), None))
+        Config(str(path), cache_dir).derived
+        cached = timed(lambda: Config(str(path), cache_dir))
+        derive = timed(lambda: config_module._derive(Config(str(path), None).display, []))
+        print(f"Config 加载: 无快照 {uncached:.2f}ms, 快照命中 {cached:.2f}ms "
+              f"({uncached / cached:.1f}x)")
+        print(f"推导值: 计算 {derive:.2f}ms（快照命中时为 0）")
+
+
+if __name__ == "__main__":
+    run_benchmark()
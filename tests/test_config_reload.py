@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+测试配置热加载
+验证配置比较、文件监视（inotify 与轮询）、按变化字段只重建受影响的组件，并打印重新加载耗时
+
+用法:
+    python tests/test_config_reload.py
+    python -m pytest tests/test_config_reload.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config, diff_config
+from display.epaper_driver import create_driver
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.render_ahead import RenderAhead
+from display.renderer import create_renderer
+from utils.config_reloader import ConfigReloader
+from utils.file_watcher import BACKEND_INOTIFY, BACKEND_POLLING, FileWatcher
+
+CONFIG_FILE = Path(__file__).parent.parent / "config.yml"
+
+ARTICLE = {
+    'title': 'AI 突破：新算法在图像识别任务中表现优异',
+    'summary': '研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。' * 3,
+    'source': '科技日报',
+    'published': '2025-12-26T08:00:00Z',
+}
+
+
+def copy_config(tmp_path) -> Path:
+    path = tmp_path / "config.yml"
+    shutil.copy(CONFIG_FILE, path)
+    return path
+
+
+def edit(path: Path, old: str, new: str, atomic: bool = False):
+    text = path.read_text(encoding='utf-8')
+    assert old in text, old
+    text = text.replace(old, new, 1)
+    if atomic:
+        # 编辑器常用的保存方式：写临时文件后重命名
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, path)
+    else:
+        path.write_text(text, encoding='utf-8')
+
+
+def setup(path):
+    cfg = Config(str(path), None)
+    renderer = create_renderer(cfg, create_font_manager(cfg.display), create_layout_engine())
+    return cfg, renderer
+
+
+def test_diff_config(tmp_path):
+    path = copy_config(tmp_path)
+    old = Config(str(path), None)
+    assert diff_config(old, Config(str(path), None)) == {}
+
+    edit(path, "margin: 6", "margin: 8")
+    edit(path, "interval_minutes: 20", "interval_minutes: 30")
+    changes = diff_config(old, Config(str(path), None))
+    assert changes['display'] == {'margin': (6, 8)}
+    assert set(changes) == {'display', 'services'}
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _check_watcher(tmp_path, use_inotify, expected_backend):
+    path = copy_config(tmp_path)
+    hits = []
+    with FileWatcher(str(path), lambda: hits.append(1), interval=0.05, debounce=0.05,
+                     use_inotify=use_inotify) as watcher:
+        assert watcher.backend == expected_backend
+        # 文件时间戳精度有限（内核时钟节拍），紧接着复制后的修改轮询可能无法区分
+        time.sleep(0.05)
+        edit(path, "margin: 6", "margin: 7")
+        assert wait_for(lambda: len(hits) == 1)
+        edit(path, "margin: 7", "margin: 8", atomic=True)
+        assert wait_for(lambda: len(hits) == 2)
+
+        # 同目录其他文件的变化不触发回调
+        (tmp_path / "other.txt").write_text("x")
+        time.sleep(0.2)
+        assert len(hits) == 2
+
+
+def test_watcher_inotify(tmp_path):
+    probe = FileWatcher(str(tmp_path / "x"), lambda: None)
+    if not probe._open_inotify():
+        return
+    probe._close_inotify()
+    _check_watcher(tmp_path, True, BACKEND_INOTIFY)
+
+
+def test_watcher_polling(tmp_path):
+    _check_watcher(tmp_path, False, BACKEND_POLLING)
+
+
+def test_layout_change_keeps_font_caches(tmp_path):
+    path = copy_config(tmp_path)
+    cfg, renderer = setup(path)
+    reloader = ConfigReloader(cfg)
+    reloader.subscribe(renderer.apply_config, sections=('display',))
+
+    renderer.render_news_card_frame(ARTICLE, 1, 3)
+    fonts_before = renderer.fonts.get_cache_info()['cached_fonts']
+    wraps_before = renderer.layout.get_cache_info()['entries']
+    glyphs = renderer._glyphs
+
+    edit(path, "margin: 6", "margin: 10")
+    changes = reloader.reload()
+    assert changes == {'display': {'margin': (6, 10)}}
+    assert renderer.margin == 10 and renderer.content_width == renderer.width - 20
+    assert renderer.get_cache_info()['frames']['entries'] == 0
+    assert renderer._glyphs is glyphs
+    assert renderer.fonts.get_cache_info()['cached_fonts'] == fonts_before
+    assert renderer.layout.get_cache_info()['entries'] == wraps_before
+
+    # 与按新配置新建的渲染器输出完全相同
+    _, fresh = setup(path)
+    assert renderer.render_news_card_frame(ARTICLE, 1, 3) == fresh.render_news_card_frame(ARTICLE, 1, 3)
+
+
+def test_reload_while_rendering_ahead(tmp_path):
+    path = copy_config(tmp_path)
+    cfg, renderer = setup(path)
+    articles = [dict(ARTICLE, title=f"{ARTICLE['title']} {i}") for i in range(4)]
+    jobs = [(a, i + 1, len(articles)) for i, a in enumerate(articles)]
+
+    # 两种边距下的参考帧：热加载期间取到的每一帧都必须完整属于其中一种
+    references = set()
+    for margin in (6, 10):
+        edit(path, "margin: 6", f"margin: {margin}")
+        _, fresh = setup(path)
+        references.update(fresh.render_news_card_frame(*job) for job in jobs)
+        edit(path, f"margin: {margin}", "margin: 6")
+
+    reloader = ConfigReloader(cfg)
+    errors = []
+    frames = []
+    with RenderAhead(renderer, depth=3) as ahead:
+        reloader.subscribe(ahead.apply_config, sections=('display',))
+        stop = threading.Event()
+
+        def display_loop():
+            try:
+                while not stop.is_set():
+                    for n, job in enumerate(jobs):
+                        ahead.schedule(jobs[n + 1:] + jobs[:n])
+                        frames.append(ahead.get_frame(*job))
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=display_loop)
+        worker.start()
+        margin = 6
+        for _ in range(10):
+            new_margin = 10 if margin == 6 else 6
+            edit(path, f"margin: {margin}", f"margin: {new_margin}")
+            margin = new_margin
+            assert reloader.reload() == {'display': {'margin': (6 if margin == 10 else 10, margin)}}
+            time.sleep(0.02)
+        stop.set()
+        worker.join()
+
+        assert not errors
+        assert frames and set(frames) <= references
+        # 热加载后不再返回旧配置下预渲染的帧
+        _, fresh = setup(path)
+        for job in jobs:
+            assert ahead.get_frame(*job) == fresh.render_news_card_frame(*job)
+
+
+def test_font_change_rebuilds_fonts(tmp_path):
+    path = copy_config(tmp_path)
+    cfg, renderer = setup(path)
+    renderer.render_news_card_frame(ARTICLE, 1, 3)
+
+    fallback = cfg.display.font_file_fallback
+    edit(path, f'font_file: "{cfg.display.font_file}"', f'font_file: "{fallback}"')
+    new = Config(str(path), None)
+    rebuilt = renderer.apply_config(new, diff_config(cfg, new))
+    assert rebuilt == ['fonts']
+    assert renderer.fonts.font_file == fallback
+    assert renderer.get_cache_info()['frames']['entries'] == 0
+
+
+def test_unrelated_change_keeps_renderer(tmp_path):
+    path = copy_config(tmp_path)
+    cfg, renderer = setup(path)
+    reloader = ConfigReloader(cfg)
+    calls = []
+    reloader.subscribe(lambda c, ch: calls.append('display'), sections=('display',))
+    reloader.subscribe(lambda c, ch: calls.append('scheduler'), sections=('services', 'display_scheduler'))
+
+    renderer.render_news_card_frame(ARTICLE, 1, 3)
+    edit(path, "interval_minutes: 20", "interval_minutes: 25")
+    assert set(reloader.reload()) == {'services'}
+    assert calls == ['scheduler']
+    assert reloader.config.services.interval_minutes == 25
+    assert renderer.get_cache_info()['frames']['entries'] == 1
+
+
+def test_invalid_yaml_keeps_config(tmp_path):
+    path = copy_config(tmp_path)
+    cfg = Config(str(path), None)
+    reloader = ConfigReloader(cfg)
+    path.write_text("display: [\n", encoding='utf-8')
+    assert reloader.reload() == {}
+    assert reloader.config is cfg
+    assert reloader.get_stats()['failures'] == 1
+
+
+def test_refresh_change_keeps_screen_state(tmp_path):
+    path = copy_config(tmp_path)
+    cfg = Config(str(path), None)
+    driver = create_driver(config=cfg)
+    try:
+        frame = b'\x0f' * (driver.width // 8 * driver.height)
+        driver.refresh_scheduler.reset(frame)
+
+        edit(path, "region_rows: 6", "region_rows: 4")
+        new = Config(str(path), None)
+        driver.apply_config(new, diff_config(cfg, new)).result()
+        assert driver.refresh_scheduler.region_rows == 4
+        assert driver.refresh_scheduler.last_frame == frame
+    finally:
+        driver.close()
+
+
+def test_reload_via_watcher(tmp_path):
+    path = copy_config(tmp_path)
+    cfg, renderer = setup(path)
+    done = threading.Event()
+    with ConfigReloader(cfg, interval=0.05, debounce=0.05) as reloader:
+        reloader.subscribe(renderer.apply_config, sections=('display',))
+        reloader.subscribe(lambda c, ch: done.set())
+        edit(path, "margin: 6", "margin: 12", atomic=True)
+        assert done.wait(5)
+    assert renderer.margin == 12
+
+
+def run_benchmark(rounds: int = 20):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = copy_config(Path(tmp))
+        cfg, renderer = setup(path)
+
+        def full_rebuild():
+            new = Config(str(path), None)
+            fresh = create_renderer(new, create_font_manager(new.display), create_layout_engine())
+            fresh.render_news_card_frame(ARTICLE, 1, 3)
+
+        def targeted():
+            reloader.reload()
+            renderer.render_news_card_frame(ARTICLE, 1, 3)
+
+        reloader = ConfigReloader(cfg)
+        reloader.subscribe(renderer.apply_config, sections=('display',))
+        renderer.render_news_card_frame(ARTICLE, 1, 3)
+
+        margins = iter(range(1, 10 * rounds))
+        elapsed = {'full': 0.0, 'targeted': 0.0}
+        current = 6
+        for _ in range(rounds):
+            margin = next(margins) % 9 + 2
+            if margin == current:
+                margin += 1
+            edit(path, f"margin: {current}", f"margin: {margin}")
+            current = margin
+            for name, fn in (('targeted', targeted), ('full', full_rebuild)):
+                start = time.perf_counter()
+                fn()
+                elapsed[name] += time.perf_counter() - start
+
+        print(f"边距变化后重新渲染: 全部重建 {elapsed['full'] / rounds * 1000:.2f}ms, "
+              f"按变化重建 {elapsed['targeted'] / rounds * 1000:.2f}ms")
+
+        for use_inotify in (True, False):
+            done = threading.Event()
+            with ConfigReloader(reloader.config, interval=0.5, debounce=0.05,
+                                use_inotify=use_inotify) as watcher:
+                watcher.subscribe(lambda c, ch: done.set())
+                time.sleep(0.1)
+                start = time.perf_counter()
+                edit(path, f"margin: {current}", f"margin: {current + 1}")
+                current += 1
+                done.wait(5)
+                print(f"文件修改到回调 ({watcher.backend}): "
+                      f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
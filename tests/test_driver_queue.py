@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+测试墨水屏驱动命令队列
+验证多生产者提交时的串行执行、优先级和请求合并（Mock 模式，无需硬件）
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image
+
+from display.epaper_driver import (
+    create_driver, PRIORITY_ALERT, PRIORITY_INPUT, PRIORITY_SCHEDULED
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_recording_driver(refresh_seconds: float = 0.0):
+    """
+    创建记录显示顺序的 Mock 驱动
+
+    Returns:
+        (driver, shown, active): 驱动、已显示图像标签列表、并发检测计数
+    """
+    driver = create_driver()
+    driver.is_mock = True
+    shown = []
+    active = {'now': 0, 'max': 0}
+    lock = threading.Lock()
+
+    def fake_display(image, waveform=None):
+        with lock:
+            active['now'] += 1
+            active['max'] = max(active['max'], active['now'])
+        time.sleep(refresh_seconds)
+        shown.append(image.info.get('label'))
+        with lock:
+            active['now'] -= 1
+        return True
+
+    driver._mock_display = fake_display
+    driver.init_display()
+    return driver, shown, active
+
+
+def labeled_image(label: str) -> Image.Image:
+    image = Image.new('1', (240, 360), 255)
+    image.info['label'] = label
+    return image
+
+
+def block_worker(driver, seconds: float):
+    """让工作线程忙于一次"刷新"，以便后续命令排队"""
+    future = driver.submit_display(labeled_image('busy'), priority=PRIORITY_ALERT, coalesce=False)
+    time.sleep(seconds)
+    return future
+
+
+def test_priority_and_coalescing():
+    driver, shown, _ = create_recording_driver(refresh_seconds=0.2)
+    try:
+        busy = block_worker(driver, 0.05)
+
+        scheduled = [driver.submit_display(labeled_image(f'tick{i}')) for i in range(3)]
+        user = driver.submit_display(labeled_image('input'), priority=PRIORITY_INPUT)
+        alert = driver.submit_display(labeled_image('alert'), priority=PRIORITY_ALERT)
+
+        assert busy.result(timeout=5)
+        assert alert.result(timeout=5) and user.result(timeout=5)
+        assert scheduled[-1].result(timeout=5)
+
+        # 被取代的定时请求不会显示
+        assert scheduled[0].cancelled() and scheduled[1].cancelled()
+        logger.info(f"显示顺序: {shown}")
+        assert shown == ['busy', 'alert', 'input', 'tick2']
+    finally:
+        driver.close()
+
+
+def test_producers_do_not_block():
+    driver, _, active = create_recording_driver(refresh_seconds=0.3)
+    try:
+        elapsed = []
+
+        def producer(name):
+            start = time.perf_counter()
+            for i in range(5):
+                driver.submit_display(labeled_image(f'{name}{i}'), coalesce=False)
+            elapsed.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=producer, args=(n,)) for n in ('a', 'b', 'c')]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 提交立即返回，不等待 0.3 秒的刷新
+        assert max(elapsed) < 0.2
+    finally:
+        driver.close()
+
+    # 硬件操作从不并发
+    assert active['max'] == 1
+
+
+def test_clear_and_sleep_from_queue():
+    driver, shown, _ = create_recording_driver()
+    assert driver.display_image(labeled_image('sync'))
+    assert driver.clear()
+    driver.sleep()
+    driver.close()
+
+    # close() 之后可以重新使用
+    assert driver.display_image(labeled_image('after-close'))
+    driver.close()
+    assert shown == ['sync', 'after-close']
+
+
+def main():
+    """主函数"""
+    for test in (test_priority_and_coalescing, test_producers_do_not_block,
+                 test_clear_and_sleep_from_queue):
+        test()
+        print(f"✅ {test.__name__}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+测试渲染预演（dry-run）
+验证 layout_news_card 不创建图像、与实际渲染布局一致，并测量每秒可评估的文章数
+
+用法:
+    python tests/test_dry_run.py
+    python -m pytest tests/test_dry_run.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display import renderer as renderer_module
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+
+# 每秒至少能预演的文章数（树莓派上约为此处的 1/5）
+MIN_ARTICLES_PER_SECOND = 100
+
+
+def make_articles(count: int):
+    """生成内容各不相同的文章（避免命中排版缓存）"""
+    return [
+        {
+            'title': f'第 {i} 篇：新型深度学习算法提升图像识别准确率',
+            'summary': f'研究团队在第 {i} 次实验中开发出一种新的深度学习算法。' * (1 + i % 8),
+            'source': '科技日报',
+            'published': '2025-12-26T10:30:00Z',
+        }
+        for i in range(count)
+    ]
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    return cfg, create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def test_dry_run_does_not_draw(monkeypatch):
+    _, renderer = setup()
+
+    def no_image(*args, **kwargs):
+        raise AssertionError("dry-run 不应创建图像")
+
+    monkeypatch.setattr(renderer_module.Image, 'new', no_image)
+    monkeypatch.setattr(renderer_module.ImageDraw, 'Draw', no_image)
+
+    short, long = make_articles(8)[0], make_articles(8)[7]
+    long['summary'] *= 4
+
+    card = renderer.layout_news_card(short, 1, 2)
+    assert not card.overflow
+    assert card.summary.line_count > 0
+    assert card.title.box[3] < card.summary.box[1] <= card.summary.box[3] <= card.footer.box[1]
+
+    card = renderer.layout_news_card(long, 2, 2)
+    assert card.summary.overflow and card.overflow
+    assert set(card.to_dict()) == {'header', 'title', 'summary', 'footer'}
+
+
+def test_dry_run_throughput():
+    _, renderer = setup()
+    articles = make_articles(300)
+    renderer.layout_news_card(articles[0])  # 预热字符宽度表
+
+    start = time.perf_counter()
+    for i, article in enumerate(articles, 1):
+        renderer.layout_news_card(article, i, len(articles))
+    rate = len(articles) / (time.perf_counter() - start)
+
+    print(f"dry-run: {rate:.0f} 篇/秒")
+    assert rate >= MIN_ARTICLES_PER_SECOND
+
+
+def run_benchmark():
+    _, renderer = setup()
+    articles = make_articles(300)
+    renderer.layout_news_card(articles[0])
+
+    for name, func in [("layout_news_card", renderer.layout_news_card),
+                       ("render_news_card", renderer.render_news_card)]:
+        renderer.layout.clear_cache()
+        start = time.perf_counter()
+        for article in articles:
+            func(article)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<18} {elapsed / len(articles) * 1000:6.2f}ms/篇  {len(articles) / elapsed:6.0f} 篇/秒")
+
+
+if __name__ == "__main__":
+    run_benchmark()
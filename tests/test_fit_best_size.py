@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+测试自适应字号（二分查找）
+验证短文本使用大字号、长文本缩小字号、超时回退截断，并打印试探耗时
+
+用法:
+    python tests/test_fit_best_size.py
+    python -m pytest tests/test_fit_best_size.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+
+SHORT_TEXT = "新模型发布。"
+LONG_TEXT = "研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。" * 4
+AREA = (228, 200)
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    return cfg, font_mgr, create_layout_engine()
+
+
+def fits(layout, font_mgr, text, size):
+    """不截断时该字号能否放入 AREA"""
+    font = font_mgr.get_font(size)
+    max_lines = layout.calculate_max_lines(AREA[1], font)
+    return not layout.layout_block(text, font, AREA[0], max_lines).truncated
+
+
+def test_picks_largest_fitting_size():
+    _, font_mgr, layout = setup()
+
+    size, block = layout.fit_best_size(SHORT_TEXT, AREA, 10, 24, font_mgr.get_font)
+    assert size == 24 and not block.truncated
+
+    size, block = layout.fit_best_size(LONG_TEXT, AREA, 8, 24, font_mgr.get_font)
+    assert 8 <= size < 24 and not block.truncated
+    assert fits(layout, font_mgr, LONG_TEXT, size)
+    assert not fits(layout, font_mgr, LONG_TEXT, size + 1)
+
+
+def test_falls_back_to_truncation():
+    _, font_mgr, layout = setup()
+
+    # 最小字号也放不下
+    size, block = layout.fit_best_size(LONG_TEXT * 10, AREA, 12, 16, font_mgr.get_font)
+    assert size == 12 and block.truncated
+
+    # 截止时间已过：不试探，直接截断
+    size, block = layout.fit_best_size(LONG_TEXT, AREA, 8, 24, font_mgr.get_font,
+                                       deadline=time.perf_counter() - 1)
+    assert size == 8 and block.lines
+
+
+def test_renderer_auto_size():
+    cfg, font_mgr, layout = setup()
+    cfg.display.summary_auto_size = True
+    renderer = create_renderer(cfg, font_mgr, layout)
+    assert renderer.summary_size_range == (cfg.display.font_size_summary_min,
+                                           cfg.display.font_size_summary_max)
+
+    image = renderer.render_news_card({'title': '标题', 'summary': SHORT_TEXT, 'source': '测试'})
+    assert image.size == (cfg.display.width, cfg.display.height)
+
+
+def run_benchmark():
+    _, font_mgr, layout = setup()
+    for name, text in [("短文本", SHORT_TEXT), ("长文本", LONG_TEXT), ("超长文本", LONG_TEXT * 10)]:
+        # 首次查找需要为每个字号建立字符宽度表，第二次使用不同区域避免命中排版缓存
+        for area in (AREA, (AREA[0] - 10, AREA[1])):
+            start = time.perf_counter()
+            size, block = layout.fit_best_size(text, area, 10, 24, font_mgr.get_font)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{name:<6} 区域 {area}: 字号 {size}, {len(block.lines)} 行, "
+                  f"截断 {block.truncated}, {elapsed:.1f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+测试热路径日志
+验证延迟格式化、按调用点采样与限速、HOT_DEBUG 开关，并打印与原 f-string 日志的开销对比
+
+用法:
+    python tests/test_hot_logging.py
+    EPAPER_HOT_DEBUG=1 python tests/test_hot_logging.py
+    python -m pytest tests/test_hot_logging.py
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+from utils.hotlog import HOT_DEBUG, HotLogger, lazy
+
+ARTICLE = {
+    'title': 'AI 突破：新算法在图像识别任务中表现优异',
+    'summary': '研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。' * 3,
+    'source': '科技日报',
+    'published': '2025-12-26T08:00:00Z',
+}
+
+
+class ListHandler(logging.Handler):
+    """收集格式化后的消息"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def make_logger(name, level=logging.DEBUG):
+    log = logging.getLogger(name)
+    log.handlers[:] = []
+    log.propagate = False
+    log.setLevel(level)
+    handler = ListHandler()
+    log.addHandler(handler)
+    return log, handler
+
+
+def test_lazy_not_evaluated_when_disabled():
+    log, handler = make_logger("test.hot.lazy", logging.INFO)
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "value"
+
+    hot = HotLogger(log)
+    assert not hot.debug("x %s", lazy(expensive))
+    log.debug("x %s", lazy(expensive))
+    assert calls == [] and handler.messages == []
+    assert hot.get_stats() == {}
+
+    log.info("x %s", lazy(expensive))
+    assert calls == [1] and handler.messages == ["x value"]
+
+
+def test_sampling_reports_skipped():
+    log, handler = make_logger("test.hot.every")
+    hot = HotLogger(log)
+    for i in range(10):
+        hot.debug("probe %d", i, every=3)
+    assert handler.messages == ["probe 0", "probe 3 (已跳过 2 条)",
+                                "probe 6 (已跳过 2 条)", "probe 9 (已跳过 2 条)"]
+    assert hot.get_stats()["probe %d"] == {'calls': 10, 'emitted': 4, 'suppressed': 6}
+
+
+def test_rate_limit_per_call_site():
+    log, handler = make_logger("test.hot.rate")
+    hot = HotLogger(log)
+    for i in range(100):
+        hot.info("a %d", i, per_second=5)
+        hot.info("b %d", i, per_second=1)
+    stats = hot.get_stats()
+    # 令牌桶初始为满，紧接着的调用只能写出容量内的条数（循环本身可能补充少量令牌）
+    assert 5 <= stats["a %d"]['emitted'] <= 6
+    assert 1 <= stats["b %d"]['emitted'] <= 2
+    assert stats["a %d"]['calls'] == stats["b %d"]['calls'] == 100
+
+    # 令牌补充后写出，并带上期间跳过的条数
+    time.sleep(1.05)
+    assert hot.info("b %d", 100, per_second=1)
+    assert handler.messages[-1].startswith("b 100 (已跳过")
+
+
+def test_font_cache_hit_silent_without_hot_debug():
+    if HOT_DEBUG:
+        return
+    log, handler = make_logger("display.fonts")
+    try:
+        cfg = Config("config.yml")
+        fonts = create_font_manager(cfg.display)
+        fonts.get_font(20)
+        loaded = len(handler.messages)
+        for _ in range(100):
+            fonts.get_font(20)
+        assert len(handler.messages) == loaded
+    finally:
+        log.handlers[:] = []
+        log.propagate = True
+        log.setLevel(logging.NOTSET)
+
+
+def test_hot_debug_switch_from_environment():
+    code = "import sys; sys.path.insert(0, 'src'); from utils.hotlog import HOT_DEBUG; print(HOT_DEBUG)"
+    root = Path(__file__).parent.parent
+    for value, expected in (("1", "True"), ("0", "False"), ("", "False")):
+        env = dict(os.environ, EPAPER_HOT_DEBUG=value)
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, env=env,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        assert out == expected
+
+
+def _per_call(fn, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def run_benchmark(count: int = 200000):
+    print(f"HOT_DEBUG = {HOT_DEBUG}")
+    log = logging.getLogger("bench.hot")
+    log.handlers[:] = [logging.NullHandler()]
+    log.propagate = False
+    font_path, size = "fonts/wqy-microhei.ttc", 20
+
+    # 1. 取字体缓存命中：原实现无条件构造 f-string（含 Path(...).name）
+    cache = {(font_path, size): object()}
+
+    def old_get_font():
+        key = (font_path, size)
+        if key in cache:
+            log.debug(f"从缓存获取字体: {Path(font_path).name} {size}px")
+            return cache[key]
+
+    cfg = Config("config.yml")
+    fonts = create_font_manager(cfg.display)
+    fonts.get_font(size)
+
+    log.setLevel(logging.INFO)
+    logging.getLogger("display.fonts").setLevel(logging.INFO)
+    print(f"取字体（缓存命中，DEBUG 关闭）: 原 f-string {_per_call(old_get_font, count):.0f}ns, "
+          f"现在 {_per_call(lambda: fonts.get_font(size), count):.0f}ns")
+
+    # 2. 单条日志调用（DEBUG 关闭）
+    hot = HotLogger(log)
+
+    def guarded():
+        if HOT_DEBUG:
+            hot.debug("字号试探: %dpx %s", size, font_path, every=10)
+
+    results = {
+        'f-string': _per_call(lambda: log.debug(f"字号试探: {size}px {font_path}"), count),
+        '%-参数': _per_call(lambda: log.debug("字号试探: %dpx %s", size, font_path), count),
+        'HotLogger': _per_call(lambda: hot.debug("字号试探: %dpx %s", size, font_path, every=10), count),
+        'if HOT_DEBUG': _per_call(guarded, count),
+    }
+    print("日志调用（DEBUG 关闭）: " + ", ".join(f"{k} {v:.0f}ns" for k, v in results.items()))
+
+    # 3. DEBUG 开启时：全部写出 vs 采样/限速
+    log.setLevel(logging.DEBUG)
+    hot.reset()
+    results = {
+        '全部写出': _per_call(lambda: log.debug("字号试探: %dpx %s", size, font_path), count // 4),
+        '每 10 条': _per_call(lambda: hot.debug("字号试探: %dpx %s", size, font_path, every=10), count // 4),
+        '每秒 5 条': _per_call(lambda: hot.debug("取字体: %dpx", size, per_second=5), count // 4),
+    }
+    print("日志调用（DEBUG 开启）: " + ", ".join(f"{k} {v:.0f}ns" for k, v in results.items()))
+    print(f"调用点统计: {hot.get_stats()}")
+
+    # 4. 一张卡片的排版会取多少次字体
+    renderer = create_renderer(cfg, fonts, create_layout_engine())
+    calls = [0]
+    get_font = fonts.get_font
+
+    def counting_get_font(*args, **kwargs):
+        calls[0] += 1
+        return get_font(*args, **kwargs)
+
+    fonts.get_font = counting_get_font
+    renderer.layout.clear_cache()
+    renderer.layout_news_card(ARTICLE, 1, 3)
+    fonts.get_font = get_font
+    print(f"每张卡片排版取字体 {calls[0]} 次")
+
+    rounds = 50
+    start = time.perf_counter()
+    for _ in range(rounds):
+        renderer.layout.clear_cache()
+        renderer.layout_news_card(ARTICLE, 1, 3)
+    print(f"卡片排版（无缓存）: {(time.perf_counter() - start) / rounds * 1000:.2f}ms/张")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+排版内存分配测量
+对比字符串行（truncate_text 拼接后再 split）与行区间（truncate_spans）两种表示
+在一次卡片排版中的内存分配
+
+用法:
+    python tests/test_layout_allocations.py
+    python -m pytest tests/test_layout_allocations.py
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import LayoutEngine
+from display.renderer import create_renderer
+
+ARTICLE = {
+    'title': '超长标题测试：这是一个非常非常非常非常长的标题，用来测试标题区域如何处理超长文本的显示问题',
+    'summary': ('DeepSeek 团队发布了最新的 V3 模型。该模型在多项基准测试中表现优异。'
+                'A revolutionary Python framework for web development has been released. ') * 20,
+    'source': '测试来源',
+    'published': '2025-12-26T08:00:00Z',
+}
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    # 关闭换行缓存，测量每次排版的真实分配
+    layout = LayoutEngine(cache_size=0)
+    return cfg, font_mgr, layout
+
+
+def layout_as_strings(layout, font, text, max_width, max_lines):
+    """原方式：截断为带换行符的字符串，再拆分成行"""
+    return layout.truncate_text(text, font, max_width, max_lines).split("\n")
+
+
+def layout_as_spans(layout, font, text, max_width, max_lines):
+    """行区间方式：绘制时才切片"""
+    return [span.text_of(text) for span in layout.truncate_spans(text, font, max_width, max_lines)]
+
+
+def measure(func, *args):
+    """
+    测量一次调用的内存分配
+
+    Returns:
+        (peak, retained): 调用期间的峰值字节数、返回值持有的字节数
+    """
+    func(*args)  # 预热（字符宽度表等）
+    tracemalloc.start()
+    result = func(*args)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def test_spans_match_strings():
+    cfg, font_mgr, layout = setup()
+    font = font_mgr.get_font(cfg.display.font_size_summary)
+    max_width = cfg.display.width - 2 * cfg.display.margin
+
+    for max_lines in (1, 5, 100):
+        assert (layout_as_spans(layout, font, ARTICLE['summary'], max_width, max_lines) ==
+                layout_as_strings(layout, font, ARTICLE['summary'], max_width, max_lines))
+
+
+def run_benchmark():
+    cfg, font_mgr, layout = setup()
+    font = font_mgr.get_font(cfg.display.font_size_summary)
+    max_width = cfg.display.width - 2 * cfg.display.margin
+    text = ARTICLE['summary']
+
+    print(f"{'方式':<24} {'峰值':>10} {'结果占用':>10}")
+    for name, func, args in [
+        ("truncate_text + split", layout_as_strings, (layout, font, text, max_width, 12)),
+        ("truncate_spans", layout.truncate_spans, (text, font, max_width, 12)),
+        ("wrap_text (全文)", layout.wrap_text, (text, font, max_width)),
+        ("wrap_spans (全文)", layout.wrap_spans, (text, font, max_width)),
+    ]:
+        peak, retained = measure(func, *args)
+        print(f"{name:<24} {peak:>9}B {retained:>9}B")
+
+    renderer = create_renderer(cfg, font_mgr, layout)
+    peak, _ = measure(renderer.render_news_card, ARTICLE)
+    print(f"{'render_news_card':<24} {peak:>9}B")
+
+
+if __name__ == "__main__":
+    run_benchmark()
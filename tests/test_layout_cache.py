@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+测试排版引擎换行结果缓存
+验证命中/淘汰计数、内存上限以及缓存结果与实时计算一致
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.cache import LRUCache
+from display.fonts import create_font_manager
+from display.layout_engine import LayoutEngine, create_layout_engine
+
+TEXT = "DeepSeek 团队发布了最新的 V3 模型。该模型在多项基准测试中表现优异，特别是在代码生成和数学推理方面。"
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    max_width = cfg.display.width - 2 * cfg.display.margin
+    return font_mgr, max_width
+
+
+def test_lru_cache_limits():
+    cache = LRUCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1      # a 成为最近使用
+    cache.put('c', 3)               # 淘汰 b
+    assert 'b' not in cache and cache.get('c') == 3
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 2 and stats['evictions'] == 1
+
+    # 内存上限
+    cache = LRUCache(max_entries=100, max_bytes=100)
+    for i in range(10):
+        cache.put(i, i, size=30)
+    assert len(cache) == 3 and cache.get_stats()['bytes'] <= 100
+
+    # 超过上限的单个值不缓存
+    cache.put('big', 'x', size=1000)
+    assert 'big' not in cache
+
+
+def test_wrap_cache_hits():
+    font_mgr, max_width = setup()
+    font = font_mgr.get_font(15)
+    layout = create_layout_engine()
+
+    first = layout.wrap_text(TEXT, font, max_width)
+    second = layout.wrap_text(TEXT, font, max_width)
+    assert first == second
+
+    # 返回值可被调用方修改而不影响缓存
+    second.append("mutated")
+    assert layout.wrap_text(TEXT, font, max_width) == first
+
+    info = layout.get_cache_info()
+    assert info['misses'] == 1 and info['hits'] == 2
+
+    # 宽度、字号不同视为不同条目
+    layout.wrap_text(TEXT, font, max_width - 20)
+    layout.wrap_text(TEXT, font_mgr.get_font(18), max_width)
+    assert layout.get_cache_info()['entries'] == 3
+
+    # truncate_text 缓存与换行缓存互不干扰
+    truncated = layout.truncate_text(TEXT, font, max_width, max_lines=2)
+    assert layout.truncate_text(TEXT, font, max_width, max_lines=2) == truncated
+    assert layout.truncate_text(TEXT, font, max_width, max_lines=2, add_ellipsis=False) != truncated
+
+
+def test_cache_matches_uncached():
+    font_mgr, max_width = setup()
+    font = font_mgr.get_font(15)
+    cached = LayoutEngine(cache_size=2)
+    uncached = LayoutEngine(cache_size=0)
+
+    texts = [TEXT, TEXT * 3, "短文本", TEXT[::-1]]
+    for _ in range(2):
+        for text in texts:
+            assert cached.wrap_text(text, font, max_width) == uncached.wrap_text(text, font, max_width)
+
+    assert cached.get_cache_info()['evictions'] > 0
+    assert uncached.get_cache_info()['entries'] == 0
+
+
+if __name__ == "__main__":
+    test_lru_cache_limits()
+    test_wrap_cache_hits()
+    test_cache_matches_uncached()
+    print("✅ 排版缓存测试通过")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+排版引擎性能基准
+对比增量换行（累计宽度数组 + 二分查找）与原逐字符换行算法
+
+用法:
+    python tests/test_layout_performance.py          # 1KB / 10KB / 100KB 基准
+    python -m pytest tests/test_layout_performance.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import (
+    create_layout_engine, WRAP_MODE_LEGACY, WRAP_MODE_INCREMENTAL
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SAMPLE_TEXT = (
+    "DeepSeek 团队发布了最新的 V3 模型。该模型在多项基准测试中表现优异，特别是在代码生成和数学推理方面。"
+    "A revolutionary Python framework for web development has been released. "
+    "It promises to be 3x faster than Flask and 5x faster than Django. "
+    "中文和英文之间应该有自然的过渡。  Double  spaces and\ttabs too. "
+)
+
+BENCHMARK_SIZES = [1024, 10 * 1024, 100 * 1024]
+
+# 原算法不处理避头尾，对比结果时去掉 CJK 标点
+PLAIN_TEXT = "".join(c for c in SAMPLE_TEXT if c not in "。，")
+
+
+def make_text(size_bytes: int, sample: str = SAMPLE_TEXT) -> str:
+    """生成 UTF-8 编码约为 size_bytes 字节的中英混排文本"""
+    repeat = size_bytes // len(sample.encode('utf-8')) + 1
+    text = sample * repeat
+    while len(text.encode('utf-8')) > size_bytes:
+        text = text[:-1]
+    return text
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    font = font_mgr.get_font(cfg.display.font_size_summary)
+    max_width = cfg.display.width - 2 * cfg.display.margin
+    return font, max_width
+
+
+def time_wrap(layout, text, font, max_width):
+    start = time.perf_counter()
+    lines = layout.wrap_text(text, font, max_width)
+    return lines, time.perf_counter() - start
+
+
+def test_incremental_matches_legacy():
+    """不含 CJK 标点时，增量换行与原算法结果一致"""
+    font, max_width = setup()
+    legacy = create_layout_engine(wrap_mode=WRAP_MODE_LEGACY)
+    incremental = create_layout_engine(wrap_mode=WRAP_MODE_INCREMENTAL)
+
+    for text in [PLAIN_TEXT, make_text(1024, PLAIN_TEXT), make_text(10 * 1024, PLAIN_TEXT),
+                 "短文本", "a", " "]:
+        assert incremental.wrap_text(text, font, max_width) == legacy.wrap_text(text, font, max_width)
+
+
+def test_incremental_is_faster():
+    """10KB 文本上增量换行快于原算法"""
+    font, max_width = setup()
+    text = make_text(10 * 1024)
+    legacy = create_layout_engine(wrap_mode=WRAP_MODE_LEGACY)
+    incremental = create_layout_engine(wrap_mode=WRAP_MODE_INCREMENTAL)
+
+    _, legacy_time = time_wrap(legacy, text, font, max_width)
+    _, incremental_time = time_wrap(incremental, text, font, max_width)
+    logger.info(f"10KB: legacy {legacy_time * 1000:.1f}ms, incremental {incremental_time * 1000:.1f}ms")
+
+    assert incremental_time < legacy_time
+
+
+def run_benchmark():
+    """打印 1KB / 10KB / 100KB 基准结果"""
+    font, max_width = setup()
+    legacy = create_layout_engine(wrap_mode=WRAP_MODE_LEGACY)
+    incremental = create_layout_engine(wrap_mode=WRAP_MODE_INCREMENTAL)
+
+    print(f"{'输入':>8} {'行数':>11} {'legacy':>12} {'incremental':>12} {'加速比':>8}")
+    for size in BENCHMARK_SIZES:
+        text = make_text(size)
+        legacy_lines, legacy_time = time_wrap(legacy, text, font, max_width)
+        lines, incremental_time = time_wrap(incremental, text, font, max_width)
+        print(f"{size // 1024:>6}KB {len(legacy_lines):>5}/{len(lines):<5} {legacy_time * 1000:>10.1f}ms "
+              f"{incremental_time * 1000:>10.1f}ms {legacy_time / incremental_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
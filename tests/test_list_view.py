@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+测试标题列表页
+验证一屏多条标题、逐行截断、只排版可见行、翻页只排版新行，并打印排版/渲染耗时
+
+用法:
+    python tests/test_list_view.py
+    python -m pytest tests/test_list_view.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+
+ARTICLES = [
+    {'title': f'第 {i} 条：新算法在图像识别任务中表现优异',
+     'source': '科技日报', 'published': '2025-12-26T08:00:00Z'}
+    for i in range(1000)
+]
+LONG_TITLE = "研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。" * 3
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    return cfg, create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def test_page_packs_rows_with_truncation():
+    cfg, renderer = setup()
+    articles = [dict(ARTICLES[0], title=LONG_TITLE)] + ARTICLES[1:20]
+    page = renderer.layout_list_page(articles)
+
+    assert page.offset == 0 and len(page.rows) > 3
+    assert page.next_offset == len(page.rows) and page.has_more
+
+    first = page.rows[0][2]
+    assert first.overflow and len(first.items[0][2].lines) == cfg.display.list_title_lines
+
+    # 行依次排列且都在内容区域内
+    tops = [y for _, y, _ in page.rows]
+    assert tops[0] == renderer._content_top()
+    assert all(y1 + row.height == y2 for (_, y1, row), y2 in zip(page.rows, tops[1:]))
+    last_index, last_y, last_row = page.rows[-1]
+    assert last_y + last_row.height <= renderer._content_bottom()
+
+
+def test_only_visible_rows_laid_out():
+    _, renderer = setup()
+
+    page1 = renderer.layout_list_page(ARTICLES)
+    misses = renderer.get_cache_info()['list_rows']['misses']
+    assert misses == len(page1.rows) + 1  # 可见行 + 判断放不下的下一行
+
+    # 翻到下一页：只排版新出现的行（第一行已在上一页排版过）
+    page2 = renderer.layout_list_page(ARTICLES, page1.next_offset)
+    assert page2.offset == page1.next_offset
+    assert renderer.get_cache_info()['list_rows']['misses'] == misses + len(page2.rows)
+
+    # 向前翻页回到第一页
+    assert renderer.list_previous_offset(ARTICLES, page2.offset) == 0
+
+    # 重复显示同一页不再排版
+    renderer.layout_list_page(ARTICLES, page1.next_offset)
+    assert renderer.get_cache_info()['list_rows']['misses'] == misses + len(page2.rows)
+
+
+def test_render_list_page():
+    cfg, renderer = setup()
+
+    image = renderer.render_list_page(ARTICLES[:5])
+    assert image.size == (cfg.display.width, cfg.display.height)
+
+    last = renderer.layout_list_page(ARTICLES, len(ARTICLES) - 2)
+    assert not last.has_more and len(last.rows) == 2
+    assert renderer.layout_list_page([]).rows == []
+    renderer.render_list_page([])
+
+
+def run_benchmark():
+    _, renderer = setup()
+    for count in (50, 1000):
+        articles = [dict(a, title=f"{a['title']}（{count}）") for a in ARTICLES[:count]]
+        renderer.clear_cache()
+
+        start = time.perf_counter()
+        page = renderer.layout_list_page(articles)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        next_page = renderer.layout_list_page(articles, page.next_offset)
+        scroll = time.perf_counter() - start
+
+        start = time.perf_counter()
+        renderer.render_list_page(articles, page.next_offset)
+        render = time.perf_counter() - start
+
+        print(f"{count:>5} 条: 每页 {len(page.rows)} 条, 首页排版 {cold * 1000:.2f}ms, "
+              f"翻页排版 {scroll * 1000:.2f}ms, 渲染 {render * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+测试内存环形日志缓冲
+验证批量写出（定时、WARNING、退出）、缓冲溢出、每日写入上限、tmpfs 镜像恢复与文件轮转，
+并打印与逐条写文件的写入次数和耗时对比
+
+用法:
+    python tests/test_log_ring.py
+    python -m pytest tests/test_log_ring.py
+"""
+
+import contextlib
+import io
+import logging
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from utils.log_ring import RingBufferHandler
+from utils.logger import LOG_FORMAT, get_logging_stats, setup_logging, shutdown_logging
+
+
+def record(level, msg):
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def read_lines(path):
+    return path.read_text(encoding='utf-8').splitlines() if path.exists() else []
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_batches_until_flush(tmp_path):
+    log_file = tmp_path / "service.log"
+    handler = RingBufferHandler(log_file, flush_interval=60)
+    try:
+        for i in range(50):
+            handler.handle(record(logging.INFO, f"info {i}"))
+        assert not log_file.exists()
+        assert handler.get_stats()['records'] == 50
+
+        # WARNING 返回时已写入文件（连同之前缓冲的记录，一次写出）
+        handler.handle(record(logging.WARNING, "warn"))
+        assert read_lines(log_file)[-1] == "warn"
+        assert len(read_lines(log_file)) == 51
+        assert handler.get_stats()['flushes'] == 1
+    finally:
+        handler.close()
+
+
+def test_interval_and_close_flush(tmp_path):
+    log_file = tmp_path / "service.log"
+    handler = RingBufferHandler(log_file, flush_interval=0.05)
+    handler.handle(record(logging.INFO, "first"))
+    assert wait_for(lambda: read_lines(log_file) == ["first"])
+
+    handler.flush_interval = 60
+    time.sleep(0.1)  # 让后台线程进入新的等待间隔
+    handler.handle(record(logging.INFO, "second"))
+    handler.close()
+    assert read_lines(log_file) == ["first", "second"]
+
+
+def test_overflow_drops_oldest(tmp_path):
+    log_file = tmp_path / "service.log"
+    handler = RingBufferHandler(log_file, ring_size=1000, flush_interval=60)
+    try:
+        # 持有写出锁模拟 SD 卡停顿，后台线程无法写出
+        with handler._flush_lock:
+            for i in range(100):
+                handler.handle(record(logging.INFO, f"line {i:03d} " + "x" * 20))
+            stats = handler.get_stats()
+            assert stats['dropped_overflow'] > 0
+            assert stats['buffered'] <= 1000
+        handler.flush()
+        lines = read_lines(log_file)
+        assert lines[-1].startswith("line 099")
+        assert len(lines) + stats['dropped_overflow'] == 100
+    finally:
+        handler.close()
+
+
+def test_daily_cap(tmp_path):
+    log_file = tmp_path / "service.log"
+    handler = RingBufferHandler(log_file, flush_interval=60, daily_max_bytes=500)
+    try:
+        for i in range(100):
+            handler.handle(record(logging.INFO, f"line {i:03d}"))
+        handler.flush()
+        lines = read_lines(log_file)
+        assert "当日写入上限" in lines[-1]
+        assert sum(len(line) + 1 for line in lines[:-1]) <= 500
+
+        # 达到上限后只写一次提示，之后的日志全部丢弃
+        handler.handle(record(logging.ERROR, "error"))
+        assert read_lines(log_file) == lines
+        stats = handler.get_stats()
+        assert stats['dropped_cap'] == 100 - (len(lines) - 1) + 1
+        assert stats['written_today'] <= 500
+    finally:
+        handler.close()
+
+
+def test_relative_path_fixed_at_creation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    handler = RingBufferHandler("service.log", flush_interval=60)
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path / "other")
+    handler.handle(record(logging.WARNING, "warn"))
+    handler.close()
+    assert read_lines(tmp_path / "service.log") == ["warn"]
+    assert not (tmp_path / "other" / "service.log").exists()
+
+
+def test_mirror_recovers_after_crash(tmp_path):
+    log_file = tmp_path / "service.log"
+    ring_dir = tmp_path / "shm"
+    handler = RingBufferHandler(log_file, flush_interval=60, daily_max_bytes=10000,
+                                ring_dir=str(ring_dir))
+    handler.handle(record(logging.WARNING, "flushed"))
+    for i in range(3):
+        handler.handle(record(logging.INFO, f"pending {i}"))
+
+    # 模拟进程崩溃：后台线程停止，缓冲未写出
+    handler._closed = True
+    handler._wake.set()
+    handler._thread.join()
+    assert read_lines(log_file) == ["flushed"]
+
+    recovered = RingBufferHandler(log_file, flush_interval=60, daily_max_bytes=10000,
+                                  ring_dir=str(ring_dir))
+    # 当日写入量从 tmpfs 恢复
+    assert recovered.get_stats()['written_today'] == len("flushed\n")
+    recovered.close()
+    assert read_lines(log_file) == ["flushed", "pending 0", "pending 1", "pending 2"]
+
+
+def test_rotation(tmp_path):
+    log_file = tmp_path / "service.log"
+    handler = RingBufferHandler(log_file, flush_interval=60, max_bytes=100, backup_count=2)
+    try:
+        for n in range(4):
+            handler.handle(record(logging.INFO, f"batch {n} " + "x" * 60))
+            handler.flush()
+        assert read_lines(log_file)[0].startswith("batch 3")
+        assert read_lines(Path(f"{log_file}.1"))[0].startswith("batch 2")
+        assert read_lines(Path(f"{log_file}.2"))[0].startswith("batch 1")
+        assert not Path(f"{log_file}.3").exists()
+    finally:
+        handler.close()
+
+
+def test_setup_logging_with_ring(tmp_path):
+    log_file = tmp_path / "service.log"
+    cfg = Config("config.yml")
+    cfg.logging.logfile = str(log_file)
+    cfg.logging.ring_enabled = True
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup_logging(cfg)
+            for i in range(20):
+                logging.getLogger("test.ring").info("line %d", i)
+        assert 'ring' in get_logging_stats()
+    finally:
+        shutdown_logging()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+
+    lines = read_lines(log_file)
+    assert lines[-1].endswith("line 19")
+    assert get_logging_stats() == {'async': False}
+
+
+class CountingFileHandler(RotatingFileHandler):
+    """统计写文件次数（RotatingFileHandler 每条记录写出并 flush 一次）"""
+
+    writes = 0
+
+    def flush(self):
+        CountingFileHandler.writes += 1
+        super().flush()
+
+
+def run_benchmark(count: int = 20000):
+    formatter = logging.Formatter(LOG_FORMAT)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        rotating = CountingFileHandler(tmp / "rotating.log", maxBytes=10 * 1024 * 1024,
+                                       backupCount=1, encoding='utf-8')
+        ring = RingBufferHandler(tmp / "ring.log", flush_interval=300, max_bytes=10 * 1024 * 1024,
+                                 backup_count=1)
+
+        for name, handler in (("逐条写文件", rotating), ("内存缓冲", ring)):
+            handler.setFormatter(formatter)
+            start = time.perf_counter()
+            for i in range(count):
+                handler.handle(logging.LogRecord("bench", logging.INFO, __file__, 0,
+                                                 "渲染周期 %d 完成", (i,), None))
+            handler.close()
+            elapsed = (time.perf_counter() - start) / count
+            writes = CountingFileHandler.writes if handler is rotating else handler.get_stats()['flushes']
+            print(f"{name:<5}: 每条 {elapsed * 1e6:.1f}us, 写文件 {writes} 次 ({count} 条)")
+
+        # 每日上限：模拟一天写出远超上限的日志
+        capped = RingBufferHandler(tmp / "capped.log", flush_interval=300, daily_max_bytes=1024 * 1024)
+        capped.setFormatter(formatter)
+        for i in range(count * 5):
+            capped.handle(logging.LogRecord("bench", logging.INFO, __file__, 0,
+                                            "渲染周期 %d 完成", (i,), None))
+        capped.close()
+        stats = capped.get_stats()
+        print(f"每日上限 1MB: 写入 {stats['bytes_written'] / 1024:.0f}KB, "
+              f"丢弃 {stats['dropped_cap']}/{count * 5} 条")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+测试非阻塞队列日志
+验证后台写出、队列满时的丢弃策略与计数、退出时写完队列，并打印业务线程的日志调用耗时
+
+用法:
+    python tests/test_logging_queue.py
+    python -m pytest tests/test_logging_queue.py
+"""
+
+import contextlib
+import io
+import logging
+import queue
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from utils.logger import (DROP_NEW, DROP_OLDEST, BoundedQueueHandler, BoundedQueueListener,
+                          get_logging_stats, setup_logging, shutdown_logging)
+
+
+def make_config(log_file, queue_size=10000, drop_policy=DROP_NEW):
+    cfg = Config("config.yml")
+    cfg.logging.logfile = str(log_file)
+    cfg.logging.queue_size = queue_size
+    cfg.logging.drop_policy = drop_policy
+    return cfg
+
+
+def reset_logging():
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+
+def record(level, msg):
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def test_writes_through_listener(tmp_path):
+    log_file = tmp_path / "service.log"
+    try:
+        setup_logging(make_config(log_file))
+        stats = get_logging_stats()
+        assert stats['async'] and stats['queue_size'] == 10000
+
+        log = logging.getLogger("test.queue")
+        for i in range(100):
+            log.info("line %d", i)
+        assert get_logging_stats()['dropped'] == 0
+    finally:
+        reset_logging()
+
+    # shutdown_logging() 写完队列中的全部记录
+    lines = log_file.read_text(encoding='utf-8').splitlines()
+    assert sum("line" in line for line in lines) == 100
+    assert lines[-1].endswith("line 99")
+    assert get_logging_stats() == {'async': False}
+
+
+def test_synchronous_when_disabled(tmp_path):
+    log_file = tmp_path / "service.log"
+    try:
+        root = setup_logging(make_config(log_file, queue_size=0))
+        assert not any(isinstance(h, BoundedQueueHandler) for h in root.handlers)
+        logging.getLogger("test.sync").warning("direct")
+        assert "direct" in log_file.read_text(encoding='utf-8')
+    finally:
+        reset_logging()
+
+
+def test_drop_new_keeps_warnings():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=3), DROP_NEW)
+    for i in range(5):
+        handler.handle(record(logging.INFO, f"info {i}"))
+    assert handler.queue.qsize() == 3 and handler.dropped == 2
+
+    # 队列满时 WARNING 及以上挤掉最旧的记录
+    handler.handle(record(logging.ERROR, "error"))
+    messages = [handler.queue.get_nowait().getMessage() for _ in range(3)]
+    assert messages == ["info 1", "info 2", "error"]
+    assert handler.dropped == 3 and handler.enqueued == 4
+
+
+def test_drop_oldest():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2), DROP_OLDEST)
+    for i in range(5):
+        handler.handle(record(logging.INFO, f"info {i}"))
+    messages = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+    assert messages == ["info 3", "info 4"]
+    assert handler.dropped == 3
+
+
+def test_invalid_policy_rejected(tmp_path):
+    try:
+        setup_logging(make_config(tmp_path / "x.log", drop_policy="block"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("无效的丢弃策略应当报错")
+    finally:
+        reset_logging()
+
+
+class SlowHandler(logging.Handler):
+    """模拟 SD 卡写入停顿的处理器"""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def emit(self, record):
+        time.sleep(self.delay)
+
+
+def run_benchmark(count: int = 2000):
+    log = logging.getLogger("bench")
+    log.propagate = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for queue_size in (0, 10000):
+            # 只比较文件写出，控制台输出丢弃
+            with contextlib.redirect_stdout(io.StringIO()):
+                setup_logging(make_config(Path(tmp) / "service.log", queue_size=queue_size))
+                start = time.perf_counter()
+                for i in range(count):
+                    log.info("渲染周期 %d 完成", i)
+                elapsed = (time.perf_counter() - start) / count
+                stats = get_logging_stats()
+                reset_logging()
+            mode = "同步写文件" if queue_size == 0 else "队列"
+            print(f"{mode:<6}: 每条 {elapsed * 1e6:.1f}us {stats}")
+
+    # 模拟 SD 卡写入停顿（每条 2ms）
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    slow = SlowHandler(0.002)
+    for mode in ("同步", "队列"):
+        if mode == "同步":
+            root.addHandler(slow)
+        else:
+            handler = BoundedQueueHandler(queue.Queue(maxsize=100), DROP_NEW)
+            listener = BoundedQueueListener(handler.queue, slow)
+            listener.start()
+            root.addHandler(handler)
+
+        start = time.perf_counter()
+        for i in range(200):
+            log.info("渲染周期 %d 完成", i)
+        elapsed = (time.perf_counter() - start) / 200
+        reset_logging()
+        if mode == "队列":
+            listener.stop()
+            print(f"SD 停顿 2ms/条, {mode}: 每条 {elapsed * 1e6:.1f}us "
+                  f"(丢弃 {handler.dropped}/200)")
+        else:
+            print(f"SD 停顿 2ms/条, {mode}: 每条 {elapsed * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+测试直接渲染到打包帧缓冲区（packed 后端）
+验证矩形/字形拼接与 PIL 绘制逐像素一致、卡片输出与 PIL 后端相同，并打印渲染+打包耗时对比
+
+用法:
+    python tests/test_packed_render.py
+    python -m pytest tests/test_packed_render.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image, ImageDraw
+
+from config import Config
+from display.fonts import create_font_manager
+from display.framebuffer import FrameBuffer, GlyphCache, pack_image
+from display.layout_engine import create_layout_engine
+from display.renderer import RENDER_BACKEND_PACKED, create_renderer
+
+ARTICLES = [
+    {'title': 'AI 突破：新算法在图像识别任务中表现优异',
+     'summary': '研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。' * 3,
+     'source': '科技日报', 'published': '2025-12-26T08:00:00Z'},
+    {'title': 'Breaking: New Python Framework Released',
+     'summary': 'A new Python framework for web development has been released. '
+                'It promises to be faster and more efficient than existing solutions.',
+     'source': 'Tech News', 'published': '2025-12-26T09:15:00Z'},
+    {'title': '', 'summary': '', 'source': '', 'custom_footer': 'AVAST Wavy Type'},
+]
+
+CHARS = "AVTWYvwyfj()/.,'\"0123456789 abcdefghijk研究团队开发算法，。"
+
+
+def setup(backend: str = RENDER_BACKEND_PACKED, cache_entries: int = 128):
+    cfg = Config("config.yml")
+    cfg.display.render_backend = backend
+    cfg.display.render_cache_entries = cache_entries
+    font_mgr = create_font_manager(cfg.display)
+    return cfg, font_mgr, create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def test_fill_rect_matches_pil():
+    fb = FrameBuffer(37, 20)
+    image = Image.new('1', (37, 20), 255)
+    draw = ImageDraw.Draw(image)
+
+    for box, fill in [((0, 0, 36, 5), 0), ((3, 2, 30, 18), 255), ((-4, 10, 8, 40), 0), ((20, 1, 20, 1), 255)]:
+        fb.fill_rect(*box, fill=fill)
+        draw.rectangle(box, fill=fill)
+
+    assert fb.to_bytes() == pack_image(image)
+    assert FrameBuffer.from_image(image).to_bytes() == pack_image(image)
+
+
+def test_glyphs_match_pil():
+    _, font_mgr, _ = setup()
+    glyphs = GlyphCache()
+    rng = random.Random(0)
+
+    for size in (12, 15, 20):
+        font = font_mgr.get_font(size)
+        for _ in range(50):
+            text = ''.join(rng.choice(CHARS) for _ in range(rng.randint(1, 16)))
+            x, y = rng.randint(-5, 20), rng.randint(-5, 10)
+
+            image = Image.new('1', (240, 40), 255)
+            ImageDraw.Draw(image).text((x, y), text, font=font, fill=0)
+            fb = FrameBuffer(240, 40)
+            glyphs.draw_text(fb, text, font, x, y)
+            assert fb.to_bytes() == pack_image(image), (size, text, x, y)
+
+    # 白字（页眉）
+    font = font_mgr.get_font(16)
+    image = Image.new('1', (120, 30), 0)
+    ImageDraw.Draw(image).text((4, 4), "AI-RSS | 3/10", font=font, fill=255)
+    fb = FrameBuffer(120, 30)
+    fb.fill_rect(0, 0, 119, 29)
+    glyphs.draw_text(fb, "AI-RSS | 3/10", font, 4, 4, fill=255)
+    assert fb.to_bytes() == pack_image(image)
+
+
+def test_packed_card_matches_pil_backend():
+    _, _, renderer = setup()
+
+    for i, article in enumerate(ARTICLES, 1):
+        frame = renderer.render_news_card_frame(article, i, 12)
+        assert frame == pack_image(renderer.render_news_card(article, i, 12))
+
+    assert renderer.get_cache_info()['glyphs'] > 0
+
+
+def run_benchmark(count: int = 50):
+    for backend in ("pil", RENDER_BACKEND_PACKED):
+        _, _, renderer = setup(backend, cache_entries=0)  # 只测渲染，不命中结果缓存
+        renderer.render_news_card_frame(ARTICLES[0], 1, count)
+
+        start = time.perf_counter()
+        for i in range(count):
+            renderer.render_news_card_frame(ARTICLES[i % 2], i + 1, count)
+        elapsed = (time.perf_counter() - start) / count
+        print(f"{backend:<7} 渲染 + 打包: {elapsed * 1000:.2f}ms/卡片")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+测试长文章分页
+验证页索引覆盖全文、逐页排版与整体排版一致、页索引随文章保存并复用
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.pagination import PAGE_INDEX_FIELD, create_paginator
+from display.renderer import create_renderer
+
+BODY = ("研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。"
+        "The algorithm improves convolutional architectures (ResNet, ViT) significantly. ") * 30
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    return cfg, font_mgr, create_layout_engine()
+
+
+def test_index_covers_text():
+    cfg, font_mgr, layout = setup()
+    paginator = create_paginator(layout)
+    font = font_mgr.get_font(cfg.display.font_size_summary)
+    width = cfg.display.width - 2 * cfg.display.margin
+
+    index = paginator.build_index(BODY, font, width, 250, first_height=150)
+    assert index.page_count > 3
+
+    # 各页拼接即为全文，逐页排版的行与整体换行一致
+    pages = [BODY[slice(*index.page_range(p))] for p in range(1, index.page_count + 1)]
+    assert "".join(pages) == BODY
+
+    all_lines = layout.wrap_text(BODY, font, width)
+    page_lines = []
+    for p in range(1, index.page_count + 1):
+        block = paginator.layout_page(BODY, index, p, font, width)
+        page_lines.extend(block.lines)
+        assert not block.truncated
+        assert len(block.lines) <= layout.calculate_max_lines(150 if p == 1 else 250, font)
+    assert page_lines == all_lines
+
+
+def test_index_stored_with_article():
+    cfg, font_mgr, layout = setup()
+    renderer = create_renderer(cfg, font_mgr, layout)
+    article = {'title': '长文章', 'content': BODY, 'source': '测试'}
+
+    index = renderer.paginate(article)
+    assert len(article[PAGE_INDEX_FIELD]) == 1
+
+    # 可随文章序列化，反序列化后直接复用，不再排版全文
+    restored = json.loads(json.dumps(article))
+    calls = []
+    build = renderer.paginator.build_index
+    renderer.paginator.build_index = lambda *args, **kwargs: calls.append(args) or build(*args, **kwargs)
+    assert renderer.paginate(restored).offsets == index.offsets
+    assert not calls
+
+    # 正文变化后索引失效
+    restored['content'] = BODY[:200]
+    assert renderer.paginate(restored).page_count == 1
+    assert len(calls) == 1
+
+
+def test_render_pages():
+    cfg, font_mgr, layout = setup()
+    renderer = create_renderer(cfg, font_mgr, layout)
+    article = {'title': '长文章', 'content': BODY, 'source': '测试', 'published': '2025-12-26T08:00:00Z'}
+
+    page_count = renderer.paginate(article).page_count
+    for page in (1, 2, page_count, page_count + 5):
+        image = renderer.render_article_page(article, page, 1, 3)
+        assert image.size == (cfg.display.width, cfg.display.height)
+
+
+if __name__ == "__main__":
+    test_index_covers_text()
+    test_index_stored_with_article()
+    test_render_pages()
+    print("✅ 分页测试通过")
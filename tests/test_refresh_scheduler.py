@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+测试刷新调度器
+验证 DU / GC / 完整清屏的决策和刷新预算
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from display.refresh_scheduler import (
+    RefreshScheduler, WAVEFORM_NONE, WAVEFORM_DU, WAVEFORM_GC, WAVEFORM_FULL
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+WIDTH, HEIGHT = 240, 360
+ROW_BYTES = WIDTH // 8
+WHITE_FRAME = b'\xff' * (ROW_BYTES * HEIGHT)
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_frame(black_rows):
+    """创建指定行为黑色的帧"""
+    frame = bytearray(WHITE_FRAME)
+    for y in black_rows:
+        frame[y * ROW_BYTES:(y + 1) * ROW_BYTES] = b'\x00' * ROW_BYTES
+    return bytes(frame)
+
+
+def create_scheduler(**kwargs):
+    clock = FakeClock()
+    params = dict(region_rows=6, du_max_changed_ratio=0.5, max_partial_updates=3,
+                  max_partial_minutes=10, full_clear_every=4, full_clear_minutes=60)
+    params.update(kwargs)
+    scheduler = RefreshScheduler(WIDTH, HEIGHT, clock=clock, **params)
+    scheduler.reset(WHITE_FRAME)
+    return scheduler, clock
+
+
+def apply(scheduler, frame):
+    plan = scheduler.plan(frame)
+    scheduler.record(plan, frame)
+    return plan.waveform
+
+
+def test_unchanged_frame_is_skipped():
+    scheduler, _ = create_scheduler()
+    assert apply(scheduler, WHITE_FRAME) == WAVEFORM_NONE
+
+
+def test_small_change_uses_du_until_budget_exhausted():
+    scheduler, _ = create_scheduler()
+
+    # 每次只改变第一个区域（0~59 行）
+    waveforms = [apply(scheduler, make_frame([i])) for i in range(5)]
+    logger.info(f"波形序列: {waveforms}")
+
+    assert waveforms[:3] == [WAVEFORM_DU] * 3
+    assert waveforms[3] == WAVEFORM_GC
+    assert waveforms[4] == WAVEFORM_DU
+
+
+def test_large_change_uses_gc():
+    scheduler, _ = create_scheduler()
+    assert apply(scheduler, make_frame(range(0, HEIGHT, 2))) == WAVEFORM_GC
+
+
+def test_elapsed_time_forces_gc():
+    scheduler, clock = create_scheduler()
+    assert apply(scheduler, make_frame([0])) == WAVEFORM_DU
+
+    clock.now += 10 * 60
+    assert apply(scheduler, make_frame([1])) == WAVEFORM_GC
+
+
+def test_full_clear_is_bounded():
+    scheduler, clock = create_scheduler()
+    full_frame = make_frame(range(0, HEIGHT, 2))
+    other_frame = make_frame(range(1, HEIGHT, 2))
+
+    waveforms = [apply(scheduler, full_frame if i % 2 else other_frame) for i in range(8)]
+    logger.info(f"波形序列: {waveforms}")
+
+    assert waveforms[3] == WAVEFORM_FULL
+    assert waveforms[7] == WAVEFORM_FULL
+    assert waveforms.count(WAVEFORM_FULL) == 2
+
+    # 时间上限同样触发完整清屏
+    clock.now += 60 * 60
+    assert apply(scheduler, other_frame) == WAVEFORM_FULL
+
+
+def test_unknown_frame_forces_gc():
+    scheduler, _ = create_scheduler()
+    scheduler.reset(None)
+    assert scheduler.plan(make_frame([0])).waveform == WAVEFORM_GC
+    assert scheduler.plan(None).waveform == WAVEFORM_GC
+
+
+def main():
+    """主函数"""
+    tests = [
+        test_unchanged_frame_is_skipped,
+        test_small_change_uses_du_until_budget_exhausted,
+        test_large_change_uses_gc,
+        test_elapsed_time_forces_gc,
+        test_full_clear_is_bounded,
+        test_unknown_frame_forces_gc,
+    ]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
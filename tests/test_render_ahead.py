@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+测试预渲染流水线（render-ahead）
+验证预渲染结果与直接渲染一致、就绪队列有界、顺序变化时取消任务，
+并打印与"刷新完再渲染"相比的翻页耗时
+
+用法:
+    python tests/test_render_ahead.py
+    python -m pytest tests/test_render_ahead.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.render_ahead import RenderAhead, create_render_ahead
+from display.renderer import create_renderer
+
+ARTICLES = [
+    {'title': f'第 {i} 篇文章：新算法在图像识别任务中表现优异',
+     'summary': f'研究团队开发出一种新的深度学习算法（{i}），在多个基准测试中取得了突破性进展。' * 3,
+     'source': '科技日报', 'published': '2025-12-26T08:00:00Z'}
+    for i in range(12)
+]
+TOTAL = len(ARTICLES)
+
+
+def setup(cache_entries: int = 128):
+    cfg = Config("config.yml")
+    cfg.display.render_cache_entries = cache_entries
+    font_mgr = create_font_manager(cfg.display)
+    return cfg, create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def upcoming(position: int, count: int = TOTAL):
+    """position 之后按显示顺序的文章"""
+    return [(ARTICLES[i], i + 1, TOTAL) for i in range(position + 1, min(position + 1 + count, TOTAL))]
+
+
+def wait_ready(ahead: RenderAhead, count: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while ahead.get_stats()['ready'] < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_frames_match_direct_render():
+    cfg, renderer = setup()
+    _, reference = setup()
+
+    with create_render_ahead(cfg, renderer) as ahead:
+        assert ahead.depth == cfg.display.render_ahead_depth
+
+        ahead.schedule(upcoming(-1))
+        wait_ready(ahead, ahead.depth)
+        for i, article in enumerate(ARTICLES[:5]):
+            frame = ahead.get_frame(article, i + 1, TOTAL)
+            assert frame == reference.render_news_card_frame(article, i + 1, TOTAL)
+            ahead.schedule(upcoming(i))
+
+        stats = ahead.get_stats()
+        assert stats['hits'] + stats['waits'] >= 3
+        assert stats['queued'] <= ahead.depth
+
+
+def test_reschedule_cancels_unneeded():
+    _, renderer = setup()
+    with RenderAhead(renderer, depth=2) as ahead:
+        ahead.schedule(upcoming(0))
+        ahead.schedule(upcoming(6))   # 跳转：之前安排的帧不再需要
+        wait_ready(ahead, 2)
+
+        stats = ahead.get_stats()
+        assert stats['queued'] == 2
+        assert stats['rendered'] + stats['cancelled'] >= 2
+
+        # 不在就绪队列中的文章同步渲染
+        ahead.get_frame(ARTICLES[0], 1, TOTAL)
+        assert ahead.get_stats()['misses'] == 1
+        ahead.get_frame(ARTICLES[7], 8, TOTAL)
+        assert ahead.get_stats()['hits'] == 1
+
+
+def test_disabled_and_closed():
+    _, renderer = setup()
+    ahead = RenderAhead(renderer, depth=0)
+    ahead.schedule(upcoming(-1))
+    assert ahead.get_stats()['queued'] == 0
+    assert ahead.get_frame(ARTICLES[0], 1, TOTAL)
+
+    ahead = RenderAhead(renderer, depth=3)
+    ahead.schedule(upcoming(-1))
+    ahead.close()
+    assert ahead.get_stats()['queued'] == 0
+    ahead.schedule(upcoming(-1))
+    assert ahead.get_stats()['queued'] == 0
+
+
+def run_benchmark(refresh_seconds: float = 0.05, count: int = 8):
+    """模拟刷新（BUSY 等待释放 GIL）：比较切换到下一篇时调用方等待渲染的时间"""
+    _, renderer = setup(cache_entries=0)
+    start = time.perf_counter()
+    for i in range(count):
+        renderer.render_news_card_frame(ARTICLES[i], i + 1, TOTAL)
+        time.sleep(refresh_seconds)
+    sequential = (time.perf_counter() - start) / count
+
+    _, renderer = setup(cache_entries=0)
+    with RenderAhead(renderer, depth=3) as ahead:
+        ahead.schedule(upcoming(-1))
+        render_wait = 0.0
+        start = time.perf_counter()
+        for i in range(count):
+            t = time.perf_counter()
+            ahead.get_frame(ARTICLES[i], i + 1, TOTAL)
+            render_wait += time.perf_counter() - t
+            ahead.schedule(upcoming(i))
+            time.sleep(refresh_seconds)
+        pipelined = (time.perf_counter() - start) / count
+        stats = ahead.get_stats()
+
+    print(f"每次翻页（刷新 {refresh_seconds * 1000:.0f}ms）: 顺序 {sequential * 1000:.1f}ms, "
+          f"预渲染 {pipelined * 1000:.1f}ms, 取帧等待 {render_wait / count * 1000:.2f}ms "
+          f"(命中 {stats['hits']}, 等待 {stats['waits']}, 未命中 {stats['misses']})")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+测试渲染结果缓存（按内容指纹复用打包帧）
+验证重复显示不再渲染、内容/索引/配置变化时重新渲染、内存上限，以及驱动直接显示打包帧
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.epaper_driver import create_driver
+from display.fonts import create_font_manager
+from display.framebuffer import frame_size, pack_image, unpack_frame
+from display.layout_engine import create_layout_engine
+from display.renderer import create_renderer
+
+ARTICLES = [
+    {'title': f'第 {i} 篇文章', 'summary': f'这是第 {i} 篇文章的摘要。' * 5,
+     'source': '测试来源', 'published': '2025-12-26T08:00:00Z'}
+    for i in range(5)
+]
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    renderer = create_renderer(cfg, font_mgr, create_layout_engine())
+
+    renders = []
+    render = renderer.render_news_card
+    renderer.render_news_card = lambda *args: renders.append(args) or render(*args)
+    return cfg, renderer, renders
+
+
+def test_repeat_cycle_does_not_render():
+    cfg, renderer, renders = setup()
+
+    first = [renderer.render_news_card_frame(a, i, len(ARTICLES)) for i, a in enumerate(ARTICLES, 1)]
+    assert len(renders) == len(ARTICLES)
+    assert all(len(frame) == frame_size(cfg.display.width, cfg.display.height) for frame in first)
+
+    # 第二轮循环完全命中缓存
+    second = [renderer.render_news_card_frame(dict(a), i, len(ARTICLES))
+              for i, a in enumerate(ARTICLES, 1)]
+    assert second == first and len(renders) == len(ARTICLES)
+
+    stats = renderer.get_cache_info()['frames']
+    assert stats['hits'] == len(ARTICLES) and stats['hit_rate'] == 0.5
+
+
+def test_changes_invalidate():
+    _, renderer, renders = setup()
+    article = dict(ARTICLES[0])
+
+    renderer.render_news_card_frame(article, 1, 5)
+    renderer.render_news_card_frame(article, 2, 5)          # 索引变化
+    renderer.render_news_card_frame(dict(article, title='新标题'), 1, 5)
+    renderer.render_news_card_frame(dict(article, id=99), 1, 5)  # 不参与渲染的字段
+    assert len(renders) == 3
+
+    # 显示配置变化
+    renderer.margin += 2
+    renderer.clear_cache()
+    renderer.render_news_card_frame(article, 1, 5)
+    assert len(renders) == 4
+
+
+def test_custom_footer_presence():
+    _, renderer, _ = setup()
+    article = dict(ARTICLES[0])
+
+    # 页脚按 custom_footer 是否存在选择文字：存在但为空与缺少该字段渲染结果不同
+    plain = renderer.card_fingerprint(article)
+    assert renderer.card_fingerprint(dict(article, custom_footer=None)) != plain
+    assert renderer.card_fingerprint(dict(article, custom_footer='')) != plain
+    assert renderer.card_fingerprint(dict(article)) == plain
+
+
+def test_memory_budget():
+    cfg, renderer, _ = setup()
+    renderer._frame_cache.max_bytes = 3 * frame_size(cfg.display.width, cfg.display.height)
+
+    for i, article in enumerate(ARTICLES, 1):
+        renderer.render_news_card_frame(article, i, len(ARTICLES))
+
+    stats = renderer.get_cache_info()['frames']
+    assert stats['entries'] == 3 and stats['evictions'] == 2
+    assert stats['bytes'] <= renderer._frame_cache.max_bytes
+
+
+def test_frame_matches_image_and_driver():
+    cfg, renderer, _ = setup()
+    image = renderer.render_news_card(ARTICLES[0], 1, 5)
+    frame = renderer.render_news_card_frame(ARTICLES[0], 1, 5)
+    assert frame == pack_image(image)
+    assert unpack_frame(frame, cfg.display.width, cfg.display.height).tobytes() == image.tobytes()
+
+    driver = create_driver()
+    driver.is_mock = True
+    shown = []
+    driver._mock_display = lambda image, waveform=None: shown.append(image) or True
+    driver.init_display()
+    try:
+        assert driver.display_image(frame)
+        assert shown == [frame]
+        assert driver._pack_frame(frame) == frame
+    finally:
+        driver.close()
+
+
+if __name__ == "__main__":
+    test_repeat_cycle_does_not_render()
+    test_changes_invalidate()
+    test_memory_budget()
+    test_frame_matches_image_and_driver()
+    print("✅ 渲染缓存测试通过")
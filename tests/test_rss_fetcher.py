@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+测试并发 RSS 抓取器
+用本地 HTTP 服务（后台线程）提供 tests/fixtures/feeds 中的订阅源，验证解析、重试、超时、
+全局与每主机并发上限，并打印 10 / 100 / 1000 个订阅源的抓取吞吐
+
+用法:
+    python tests/test_rss_fetcher.py
+    python -m pytest tests/test_rss_fetcher.py
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from fetchers.rss_fetcher import (AsyncRSSFetcher, BACKEND_AIOHTTP, BACKEND_REQUESTS, aiohttp,
+                                  collect_articles, create_rss_fetcher, parse_feed)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "feeds"
+
+
+class FeedServer(ThreadingHTTPServer):
+    """本地订阅源服务：记录每个主机同时进行的请求数"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(("127.0.0.1", 0), FeedHandler)
+        self.latency = latency
+        self.feeds = {name: (FIXTURES / f"{name}.xml").read_bytes() for name in ("rss2", "atom")}
+        self.lock = threading.Lock()
+        self.inflight = defaultdict(int)
+        self.max_inflight = defaultdict(int)
+        self.max_total = 0
+        self.hits = defaultdict(int)
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def url(self, path: str, host: str = "127.0.0.1") -> str:
+        return f"http://{host}:{self.server_address[1]}{path}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """
+    路由:
+        /rss2/<n>、/atom/<n>  固定订阅源
+        /slow/<n>            等待 1 秒后返回
+        /flaky/<n>           第一次返回 503，之后正常
+        /garbage             非订阅源内容
+        其他                 404
+    """
+
+    def do_GET(self):
+        server = self.server
+        host = self.headers.get('Host', '').rsplit(':', 1)[0]
+        with server.lock:
+            server.inflight[host] += 1
+            server.max_inflight[host] = max(server.max_inflight[host], server.inflight[host])
+            server.max_total = max(server.max_total, sum(server.inflight.values()))
+            server.hits[self.path] += 1
+            hits = server.hits[self.path]
+        try:
+            if server.latency:
+                time.sleep(server.latency)
+            kind = self.path.strip('/').split('/')[0]
+            if kind in server.feeds:
+                status, body = 200, server.feeds[kind]
+            elif kind == "slow":
+                time.sleep(1.0)
+                status, body = 200, server.feeds["rss2"]
+            elif kind == "flaky":
+                status, body = 503 if hits == 1 else 200, server.feeds["atom"]
+            elif kind == "garbage":
+                status, body = 200, b"this is not a feed"
+            else:
+                status, body = 404, b"not found"
+        finally:
+            # 回复前结束计数：客户端收到响应后即可发起下一个请求
+            with server.lock:
+                server.inflight[host] -= 1
+        self._reply(status, body)
+
+    def _reply(self, status, body):
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_fetcher(**kwargs):
+    options = dict(timeout=2, retries=0, retry_delay=0.01, use_aiohttp=False)
+    options.update(kwargs)
+    return AsyncRSSFetcher(**options)
+
+
+def test_parse_fixtures():
+    title, articles = parse_feed("rss", (FIXTURES / "rss2.xml").read_bytes())
+    assert title == "科技日报" and len(articles) == 3
+    first, second, third = articles
+    assert first.summary == "研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了 突破性 进展。"
+    assert first.published == "2025-12-26T08:00:00Z"
+    assert first.image_url == "https://example.com/images/1.jpg"
+    assert "&" in second.summary and second.published == "2025-12-25T12:30:00Z"
+    assert second.image_url == "https://example.com/images/2.png"
+    assert third.published == "" and third.image_url is None
+    assert first.to_dict()['source'] == "科技日报" and 'image_url' not in third.to_dict()
+
+    title, articles = parse_feed("atom", (FIXTURES / "atom.xml").read_bytes(), max_articles=1)
+    assert title == "Solidot" and len(articles) == 1
+    assert articles[0].link == "https://example.org/story/1"
+
+
+def test_results_and_errors():
+    with FeedServer() as server, make_fetcher() as fetcher:
+        urls = [server.url("/rss2/1"), server.url("/atom/1"), server.url("/missing"),
+                server.url("/garbage")]
+        results = fetcher.fetch(urls)
+    assert [r.url for r in results] == urls
+    assert [r.ok for r in results] == [True, True, False, False]
+    assert len(results[0].articles) == 3 and results[1].title == "Solidot"
+    assert results[2].status == 404 and results[2].attempts == 1
+    assert "解析失败" in results[3].error
+    assert fetcher.get_stats()['failed'] == 2
+
+
+def test_retry_on_server_error():
+    with FeedServer() as server, make_fetcher(retries=2) as fetcher:
+        result, = fetcher.fetch([server.url("/flaky/1")])
+    assert result.ok and result.attempts == 2 and len(result.articles) == 2
+    assert fetcher.get_stats()['retries'] == 1
+
+
+def test_timeout():
+    with FeedServer() as server, make_fetcher(timeout=0.2) as fetcher:
+        start = time.perf_counter()
+        slow, fast = fetcher.fetch([server.url("/slow/1"), server.url("/rss2/1")])
+        elapsed = time.perf_counter() - start
+    assert not slow.ok and "超时" in slow.error and slow.status is None
+    assert fast.ok
+    assert elapsed < 0.9
+
+
+def test_concurrency_limits():
+    with FeedServer(latency=0.05) as server, \
+            make_fetcher(max_concurrency=3, per_host_limit=2) as fetcher:
+        urls = [server.url(f"/rss2/{i}", host) for host in ("127.0.0.1", "localhost")
+                for i in range(12)]
+        results = fetcher.fetch(urls)
+    assert all(r.ok for r in results)
+    assert max(server.max_inflight.values()) == 2
+    assert server.max_total <= 3
+
+
+def test_fetch_articles_merges():
+    with FeedServer() as server, make_fetcher(max_articles=4) as fetcher:
+        # 同一订阅源出现在多个地址：按链接去重
+        urls = [server.url("/rss2/1"), server.url("/rss2/2"), server.url("/atom/1")]
+        articles = fetcher.fetch_articles(urls)
+    assert len(articles) == 4
+    assert [a.title for a in articles[:2]] == ["Linux 6.18 发布", "AI 突破：新算法在图像识别任务中表现优异"]
+    assert len({a.key for a in articles}) == 4
+
+    assert len(collect_articles([])) == 0
+
+
+def test_parse_in_processes():
+    with FeedServer() as server, make_fetcher(parse_in_processes=True) as fetcher:
+        result, = fetcher.fetch([server.url("/atom/1")])
+    assert result.ok and len(result.articles) == 2
+
+
+def test_aiohttp_backend():
+    if aiohttp is None:
+        assert make_fetcher(use_aiohttp=None).backend == BACKEND_REQUESTS
+        return
+    with FeedServer() as server, make_fetcher(use_aiohttp=True) as fetcher:
+        assert fetcher.backend == BACKEND_AIOHTTP
+        results = fetcher.fetch([server.url("/rss2/1"), server.url("/missing")])
+    assert [r.ok for r in results] == [True, False]
+
+
+def test_create_from_config():
+    cfg = Config("config.yml")
+    fetcher = create_rss_fetcher(cfg)
+    assert fetcher.timeout == cfg.network.timeout_seconds
+    assert fetcher.retries == cfg.network.retries
+    assert fetcher.max_articles == cfg.services.max_articles_per_fetch
+    assert fetcher.per_host_limit == cfg.network.per_host_limit
+
+
+def run_benchmark(latency: float = 0.02):
+    hosts = ("127.0.0.1", "localhost")
+    with FeedServer(latency=latency) as server:
+        print(f"本地服务每个请求延迟 {latency * 1000:.0f}ms, 主机 {len(hosts)} 个")
+        for count in (10, 100, 1000):
+            urls = [server.url(f"/{'rss2' if i % 2 else 'atom'}/{i}", hosts[i % len(hosts)])
+                    for i in range(count)]
+            modes = [("并发 16/每主机 8", dict(max_concurrency=16, per_host_limit=8))]
+            if count <= 100:
+                modes.insert(0, ("顺序", dict(max_concurrency=1, per_host_limit=1)))
+            for name, limits in modes:
+                with make_fetcher(timeout=10, **limits) as fetcher:
+                    start = time.perf_counter()
+                    results = fetcher.fetch(urls)
+                    elapsed = time.perf_counter() - start
+                failed = sum(not r.ok for r in results)
+                articles = sum(len(r.articles) for r in results)
+                print(f"{count:>5} 个订阅源 {name:<14}: {elapsed:.2f}s, {count / elapsed:.0f} 个/秒, "
+                      f"{articles} 篇, 失败 {failed}")
+
+        # 解析放在进程池中（多核设备可并行解析）
+        urls = [server.url(f"/rss2/{i}", hosts[i % len(hosts)]) for i in range(1000)]
+        for name, in_processes in (("解析线程池", False), ("解析进程池", True)):
+            with make_fetcher(timeout=10, max_concurrency=16, per_host_limit=8,
+                              parse_in_processes=in_processes) as fetcher:
+                start = time.perf_counter()
+                fetcher.fetch(urls)
+                print(f" 1000 个订阅源 {name}: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
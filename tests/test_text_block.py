@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+测试文本块排版结果（TextBlock）
+验证一次排版得到的行、尺寸、截断标记与各便捷方法一致
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import LayoutEngine, create_layout_engine
+
+TEXT = "研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。" \
+       "The algorithm improves convolutional architectures significantly."
+
+
+def setup():
+    cfg = Config("config.yml")
+    font = create_font_manager(cfg.display).get_font(cfg.display.font_size_summary)
+    max_width = cfg.display.width - 2 * cfg.display.margin
+    return font, max_width
+
+
+def test_block_metrics():
+    font, max_width = setup()
+    layout = create_layout_engine()
+    block = layout.layout_block(TEXT, font, max_width)
+
+    assert block.lines == layout.wrap_text(TEXT, font, max_width)
+    assert not block.truncated
+    assert len(block.widths) == len(block.lines) > 1
+    assert block.width == max(block.widths) <= max_width
+    assert block.height == layout.calculate_text_height(TEXT, font, max_width)
+    assert block.tops[1] - block.tops[0] == block.line_pitch
+    assert all(baseline > top for baseline, top in zip(block.baselines, block.tops))
+    assert block.advance == len(block.lines) * block.line_pitch
+
+
+def test_block_truncation():
+    font, max_width = setup()
+    layout = create_layout_engine()
+
+    block = layout.layout_block(TEXT, font, max_width, max_lines=1)
+    assert block.truncated and len(block.lines) == 1
+    assert block.lines[0].endswith(layout.ELLIPSIS)
+    assert "\n".join(block.lines) == layout.truncate_text(TEXT, font, max_width, max_lines=1)
+
+    plain = layout.layout_block(TEXT, font, max_width, max_lines=1, add_ellipsis=False)
+    assert plain.truncated and not plain.lines[0].endswith(layout.ELLIPSIS)
+
+    assert not layout.layout_block(TEXT, font, max_width, max_lines=100).truncated
+
+
+def test_center_text_single_pass():
+    font, max_width = setup()
+    layout = LayoutEngine(cache_size=0)
+    calls = []
+    wrap = layout._wrap_spans_incremental
+
+    def counting_wrap(*args):
+        calls.append(args)
+        return wrap(*args)
+
+    layout._wrap_spans_incremental = counting_wrap
+    x, y = layout.center_text(TEXT, font, max_width, 300)
+
+    assert len(calls) == 1
+    assert 0 <= x <= max_width and 0 <= y <= 300
+
+
+if __name__ == "__main__":
+    test_block_metrics()
+    test_block_truncation()
+    test_center_text_single_pass()
+    print("✅ 文本块排版测试通过")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+测试文章配图缩略图
+验证 draft 解码、抖动、打包缓存（内存与磁盘）、卡片合成（两种渲染后端一致），并打印耗时对比
+
+用法:
+    python tests/test_thumbnails.py
+    python -m pytest tests/test_thumbnails.py
+"""
+
+import io
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PIL import Image, ImageDraw
+
+from config import Config
+from display.fonts import create_font_manager
+from display.framebuffer import pack_image
+from display.layout_engine import create_layout_engine
+from display.renderer import RENDER_BACKEND_PACKED, create_renderer
+from display.thumbnails import (DITHER_FLOYD, DITHER_ORDERED, DITHER_THRESHOLD,
+                                Thumbnail, ThumbnailCache, decode_thumbnail, dither_image)
+
+IMAGE_URL = "https://example.com/images/lead.jpg"
+
+ARTICLE = {
+    'title': 'AI 突破：新算法在图像识别任务中表现优异',
+    'summary': '研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。' * 3,
+    'source': '科技日报',
+    'published': '2025-12-26T08:00:00Z',
+    'image_url': IMAGE_URL,
+}
+
+
+def make_jpeg(size=(2400, 1600), quality=90) -> bytes:
+    """生成带渐变和图形的测试 JPEG"""
+    width, height = size
+    image = Image.linear_gradient('L').resize(size).convert('RGB')
+    draw = ImageDraw.Draw(image)
+    for i in range(0, width, 120):
+        draw.ellipse((i, height // 4, i + 100, height // 4 + 100), fill=(200, 40, 40))
+    draw.rectangle((width // 3, height // 2, width // 2, height - 100), fill=(20, 20, 20))
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def naive_thumbnail(data: bytes, size) -> Image.Image:
+    """对照：全尺寸解码后缩放、误差扩散"""
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert('L')
+        scale = max(size[0] / image.width, size[1] / image.height)
+        image = image.resize((round(image.width * scale), round(image.height * scale)),
+                             Image.Resampling.LANCZOS)
+        left = (image.width - size[0]) // 2
+        top = (image.height - size[1]) // 2
+        image = image.crop((left, top, left + size[0], top + size[1]))
+    return image.convert('1')
+
+
+def setup(cache_dir, backend="pil"):
+    cfg = Config("config.yml")
+    cfg.display.thumbnails_enabled = True
+    cfg.display.thumbnail_cache_dir = str(cache_dir)
+    cfg.display.render_backend = backend
+    font_mgr = create_font_manager(cfg.display)
+    return create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def test_decode_size_and_mode():
+    data = make_jpeg()
+    for dither in (DITHER_ORDERED, DITHER_FLOYD, DITHER_THRESHOLD):
+        thumb = decode_thumbnail(data, (228, 96), dither)
+        assert thumb.mode == '1' and thumb.size == (228, 96)
+
+
+def test_ordered_dither_levels():
+    # 有序抖动后黑色比例与灰度一致
+    for level in (0, 64, 128, 192, 255):
+        gray = Image.new('L', (64, 64), level)
+        bits = dither_image(gray, DITHER_ORDERED)
+        white = sum(bin(b).count('1') for b in bits.tobytes())
+        assert abs(white / (64 * 64) - level / 255) < 1 / 32, level
+
+
+def test_thumbnail_rows_match_image():
+    image = decode_thumbnail(make_jpeg((400, 300)), (37, 20), DITHER_FLOYD)
+    thumb = Thumbnail.from_image(image, "k")
+    assert thumb.to_image().tobytes() == image.tobytes()
+
+    for y, row in enumerate(thumb.ink_rows()):
+        for x in range(37):
+            ink = (row >> (36 - x)) & 1
+            assert ink == (image.getpixel((x, y)) == 0)
+
+
+def test_cache_memory_and_disk(tmp_path):
+    data = make_jpeg((800, 600))
+    cache = ThumbnailCache(cache_dir=str(tmp_path))
+    assert cache.get(IMAGE_URL, (100, 50)) is None
+
+    thumb = cache.put(IMAGE_URL, data, (100, 50))
+    assert cache.get(IMAGE_URL, (100, 50)) is thumb
+    assert cache.get(IMAGE_URL, (120, 50)) is None
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # 新实例从磁盘读取打包位图
+    reloaded = ThumbnailCache(cache_dir=str(tmp_path)).get(IMAGE_URL, (100, 50))
+    assert reloaded.data == thumb.data and reloaded.key == thumb.key
+
+    # 损坏的缓存文件被忽略
+    next(tmp_path.iterdir()).write_bytes(b'\0' * 3)
+    assert ThumbnailCache(cache_dir=str(tmp_path)).get(IMAGE_URL, (100, 50)) is None
+
+
+def test_miss_cached_until_put(tmp_path):
+    cache = ThumbnailCache(cache_dir=str(tmp_path))
+    reads = []
+    original = Path.read_bytes
+
+    def counting_read(self):
+        reads.append(self)
+        return original(self)
+
+    Path.read_bytes = counting_read
+    try:
+        for _ in range(5):
+            assert cache.get(IMAGE_URL, (100, 50)) is None
+        assert len(reads) == 1
+
+        # 其他进程生成的缩略图在未命中记录过期前不可见
+        ThumbnailCache(cache_dir=str(tmp_path)).put(IMAGE_URL, make_jpeg((400, 300)), (100, 50))
+        assert cache.get(IMAGE_URL, (100, 50)) is None
+        cache.miss_ttl = 0
+        assert cache.get(IMAGE_URL, (100, 50)) is not None
+
+        # 本实例 put() 立即清除未命中记录
+        other = ThumbnailCache(cache_dir=str(tmp_path))
+        assert other.get(IMAGE_URL, (80, 40)) is None
+        other.put(IMAGE_URL, make_jpeg((400, 300)), (80, 40))
+        assert other.get(IMAGE_URL, (80, 40)) is not None
+    finally:
+        Path.read_bytes = original
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    """/small 返回小图，/large 返回超过上限的图（/large-chunked 不带 Content-Length）"""
+
+    def do_GET(self):
+        body = self.server.images.get(self.path.strip('/'), b'')
+        self.send_response(200 if body else 404)
+        if self.path != "/large-chunked":
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_fetch_size_limit(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageHandler)
+    small = make_jpeg((400, 300))
+    server.images = {'small': small, 'large': make_jpeg(), 'large-chunked': make_jpeg()}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        cache = ThumbnailCache(cache_dir=str(tmp_path), max_image_bytes=len(small) + 1)
+        assert cache.fetch(f"{base}/small", (100, 50)) is not None
+        assert cache.fetch(f"{base}/large", (100, 50)) is None
+        assert cache.fetch(f"{base}/large-chunked", (100, 50)) is None
+        assert len(list(tmp_path.iterdir())) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_card_composites_cached_thumbnail(tmp_path):
+    renderer = setup(tmp_path)
+    plain = renderer.layout_news_card(ARTICLE, 1, 3)
+    assert plain.thumbnail is None
+    before = renderer.card_fingerprint(ARTICLE, 1, 3)
+
+    renderer.thumbnails.put(IMAGE_URL, make_jpeg(), renderer.thumbnail_size)
+    card = renderer.layout_news_card(ARTICLE, 1, 3)
+    assert card.thumbnail is not None
+    assert card.summary.box[1] > card.thumbnail.box[3] > card.title.box[3]
+    assert 'thumbnail' in card.to_dict()
+    assert renderer.card_fingerprint(ARTICLE, 1, 3) != before
+
+    image = renderer.render_news_card(ARTICLE, 1, 3)
+    x0, y0, x1, y1 = card.thumbnail.box
+    assert image.crop((x0, y0, x1, y1)).tobytes() == card.thumbnail.image.data
+
+    # 直接渲染到打包帧的结果与 PIL 渲染完全相同
+    packed = setup(tmp_path, RENDER_BACKEND_PACKED)
+    assert packed.render_news_card_frame(ARTICLE, 1, 3) == pack_image(image)
+
+
+def test_disabled_without_cache(tmp_path):
+    renderer = setup(tmp_path)
+    renderer.thumbnails = None
+    assert renderer.layout_news_card(ARTICLE, 1, 3).thumbnail is None
+    assert renderer.prepare_thumbnail(ARTICLE) is None
+
+
+def run_benchmark(rounds: int = 5):
+    data = make_jpeg()
+    size = (228, 96)
+    print(f"测试图片: 2400×1600 JPEG, {len(data) / 1024:.0f}KB -> {size[0]}×{size[1]}")
+
+    def timed(fn):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        return (time.perf_counter() - start) / rounds * 1000
+
+    naive = timed(lambda: naive_thumbnail(data, size))
+    print(f"  全尺寸解码 + 缩放 + 误差扩散: {naive:.1f}ms")
+    for dither in (DITHER_ORDERED, DITHER_FLOYD):
+        ms = timed(lambda: decode_thumbnail(data, size, dither))
+        print(f"  draft 解码 + {dither:<8}:        {ms:.1f}ms ({naive / ms:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        renderer = setup(tmp)
+        renderer.thumbnails.put(IMAGE_URL, data, renderer.thumbnail_size)
+        other = dict(ARTICLE, image_url=None)
+        renderer.render_news_card(ARTICLE, 1, 3)
+
+        with_thumb = timed(lambda: renderer.render_news_card(ARTICLE, 1, 3))
+        without = timed(lambda: renderer.render_news_card(other, 1, 3))
+        print(f"渲染卡片: 无配图 {without:.2f}ms, 含缓存缩略图 {with_thumb:.2f}ms "
+              f"(合成 {with_thumb - without:+.2f}ms)")
+
+        ms = timed(lambda: ThumbnailCache(cache_dir=tmp).get(IMAGE_URL, renderer.thumbnail_size))
+        print(f"磁盘缓存读取: {ms:.3f}ms, 内存缓存: {renderer.thumbnails.get_stats()}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+测试分阶段耗时追踪
+验证关闭时零记录、渲染与驱动各阶段的直方图、Chrome trace 导出，并打印追踪开销
+
+用法:
+    python tests/test_tracing.py
+    python -m pytest tests/test_tracing.py
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.epaper_driver import create_driver
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from display.refresh_scheduler import WAVEFORM_DU
+from display.renderer import create_renderer
+from utils.tracing import NULL_SPAN, Histogram, get_tracer, span
+
+ARTICLE = {
+    'title': 'AI 突破：新算法在图像识别任务中表现优异',
+    'summary': '研究团队开发出一种新的深度学习算法，在多个图像识别基准测试中取得了突破性进展。' * 3,
+    'source': '科技日报',
+    'published': '2025-12-26T08:00:00Z',
+}
+
+
+class FakeEPD:
+    """记录调用的假硬件（不访问 SPI/GPIO）"""
+    WHITE = 0xFF
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append(name)
+
+
+def setup():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    return create_renderer(cfg, font_mgr, create_layout_engine())
+
+
+def enable_tracing():
+    tracer = get_tracer()
+    tracer.reset()
+    tracer.enabled = True
+    return tracer
+
+
+def disable_tracing():
+    tracer = get_tracer()
+    tracer.enabled = False
+    tracer.reset()
+
+
+def test_disabled_records_nothing():
+    disable_tracing()
+    tracer = get_tracer()
+
+    assert span("render.layout") is NULL_SPAN
+    assert tracer.cycle() is NULL_SPAN
+
+    setup().render_news_card_frame(ARTICLE, 1, 3)
+    assert tracer.get_stats() == {}
+
+
+def test_render_stages_and_trace_export(tmp_path):
+    renderer = setup()
+    tracer = enable_tracing()
+    try:
+        with tracer.cycle("display"):
+            renderer.render_news_card_frame(ARTICLE, 1, 3)
+
+        stats = tracer.get_stats()
+        for name in ("display", "render.layout", "render.draw_header", "render.draw_title",
+                     "render.draw_summary", "render.draw_footer", "render.pack"):
+            assert stats[name]['count'] == 1, name
+        assert stats['display']['total_ms'] >= stats['render.layout']['total_ms']
+
+        path = tracer.export_chrome_trace(str(tmp_path / "trace.json"))
+        events = json.loads(path.read_text(encoding='utf-8'))['traceEvents']
+        assert {e['ph'] for e in events} == {'X'}
+        cycle = next(e for e in events if e['name'] == 'display')
+        assert cycle['ts'] == 0
+        assert all(e['ts'] + e['dur'] <= cycle['dur'] + 1 for e in events)
+
+        # 周期外只聚合直方图，不保留事件明细
+        renderer.render_news_card(ARTICLE, 2, 3)
+        assert tracer.get_stats()['render.layout']['count'] == 2
+        assert len(tracer.chrome_trace()['traceEvents']) == len(events)
+    finally:
+        disable_tracing()
+
+
+def test_requested_export_writes_one_cycle(tmp_path):
+    tracer = enable_tracing()
+    tracer.trace_dir = tmp_path
+    try:
+        with tracer.cycle():
+            pass
+        assert not list(tmp_path.iterdir())
+
+        tracer.request_export()
+        with tracer.cycle():
+            with span("render.layout", lines=3):
+                pass
+        files = list(tmp_path.iterdir())
+        assert len(files) == 1
+        events = json.loads(files[0].read_text(encoding='utf-8'))['traceEvents']
+        assert [e.get('args') for e in events if e['name'] == 'render.layout'] == [{'lines': 3}]
+    finally:
+        tracer.trace_dir = Path("data/traces")
+        disable_tracing()
+
+
+def test_driver_stages():
+    driver = create_driver()
+    driver.is_mock = False
+    driver.is_initialized = True
+    driver.epd = FakeEPD()
+    tracer = enable_tracing()
+    try:
+        frame = b'\xff' * (driver.width // 8 * driver.height)
+        assert driver._hardware_display(frame, WAVEFORM_DU)
+        driver._do_sleep()
+
+        stats = tracer.get_stats()
+        for name in ("epd.spi_transfer", "epd.lut_upload", "epd.busy_wait", "epd.sleep"):
+            assert stats[name]['count'] == 1, name
+        assert driver.epd.calls == ['display', 'lut_DU', 'refresh', 'sleep']
+    finally:
+        disable_tracing()
+        driver.epd = None
+        driver.close()
+
+
+def test_histogram_percentiles():
+    hist = Histogram()
+    for us in [100] * 90 + [5000] * 9 + [80000]:
+        hist.add(us * 1000)
+
+    stats = hist.to_dict()
+    assert stats['count'] == 100
+    assert stats['min_ms'] == 0.1 and stats['max_ms'] == 80.0
+    assert 0.1 <= stats['p50_ms'] <= 0.2
+    assert 5 <= stats['p99_ms'] <= 10.24
+
+
+def test_overhead_below_one_percent():
+    renderer = setup()
+    renderer.render_news_card(ARTICLE, 1, 3)
+    tracer = enable_tracing()
+    try:
+        count = 20000
+        start = time.perf_counter()
+        for _ in range(count):
+            with span("bench"):
+                pass
+        per_span = (time.perf_counter() - start) / count
+
+        start = time.perf_counter()
+        renderer.render_news_card(ARTICLE, 1, 3)
+        card = time.perf_counter() - start
+        spans_per_card = sum(s['count'] for s in tracer.get_stats().values()) - count
+
+        assert spans_per_card * per_span < 0.01 * card
+    finally:
+        disable_tracing()
+
+
+def run_benchmark(count: int = 100):
+    renderer = setup()
+    renderer.render_news_card(ARTICLE, 1, count)
+    tracer = get_tracer()
+
+    results = {}
+    for enabled in (False, True, False, True):
+        tracer.enabled = enabled
+        start = time.perf_counter()
+        for i in range(count):
+            renderer.render_news_card(ARTICLE, i + 1, count)
+        results[enabled] = (time.perf_counter() - start) / count
+
+    print(f"渲染卡片: 追踪关闭 {results[False] * 1000:.3f}ms, 开启 {results[True] * 1000:.3f}ms "
+          f"({(results[True] / results[False] - 1) * 100:+.2f}%)")
+    for name, stats in tracer.get_stats().items():
+        print(f"  {name:<22} n={stats['count']:<4} mean {stats['mean_ms']:.3f}ms "
+              f"p90 {stats['p90_ms']:.3f}ms")
+    disable_tracing()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+换行模糊测试 / 性能上限测试
+用病态输入（超长 URL、无空格文本、混合文字）验证强制断行：
+- 每行宽度不超过 max_width（单个字符本身超宽时除外）
+- 换行结果拼接后与原文一致
+- 每个输入的耗时不超过上限
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+from display.fonts import create_font_manager
+from display.layout_engine import create_layout_engine
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 单个输入的耗时上限（秒），树莓派上约为此处的 5~10 倍
+TIME_CEILING = 1.0
+
+ALPHABETS = [
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+    "这是一个用于测试的中文字符集合包含常用汉字",
+    "ひらがなカタカナ한국어텍스트",
+    "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+    "/?&=%#:.-_~+",
+    " \t",
+    "​́",
+]
+
+
+def make_pathological_inputs():
+    """生成病态输入: {名称: 文本}"""
+    rng = random.Random(20251226)
+    url = "https://example.com/" + "/".join(
+        "".join(rng.choice(ALPHABETS[0] + "-_") for _ in range(40)) for _ in range(250))
+    base64_blob = "".join(rng.choice(ALPHABETS[0] + "+/") for _ in range(10 * 1024)) + "=="
+    mixed = "".join(rng.choice(rng.choice(ALPHABETS)) for _ in range(10 * 1024))
+
+    return {
+        "10KB URL": url[:10 * 1024],
+        "URL 夹在正文中": "请访问 " + url[:2048] + " 获取详情。Read more at " + url[:1024],
+        "base64": base64_blob,
+        "SHA256 列表": " ".join("%064x" % rng.getrandbits(256) for _ in range(100)),
+        "无空格英文": "x" * 10 * 1024,
+        "连续空格": " " * 2048 + "end",
+        "随机混合文字": mixed,
+        "单个宽字符": "W",
+    }
+
+
+def check_wrap(layout, font, text, max_width):
+    """换行并校验结果，返回耗时"""
+    start = time.perf_counter()
+    lines = layout.wrap_text(text, font, max_width)
+    elapsed = time.perf_counter() - start
+
+    assert "".join(lines) == text
+    for line in lines:
+        if len(line) > 1:
+            width = layout._get_text_width(line, font)
+            assert width <= max_width, f"行宽 {width} > {max_width}: {line[:40]!r}"
+
+    return elapsed
+
+
+def test_pathological_inputs():
+    cfg = Config("config.yml")
+    font_mgr = create_font_manager(cfg.display)
+    layout = create_layout_engine()
+
+    for font_size in (cfg.display.font_size_summary, cfg.display.font_size_title):
+        font = font_mgr.get_font(font_size)
+        for max_width in (cfg.display.width - 2 * cfg.display.margin, 40, 5):
+            for name, text in make_pathological_inputs().items():
+                elapsed = check_wrap(layout, font, text, max_width)
+                logger.info(f"{name} ({len(text)} 字符, {font_size}px, 宽 {max_width}): "
+                            f"{elapsed * 1000:.1f}ms")
+                assert elapsed < TIME_CEILING, f"{name} 耗时 {elapsed:.2f}s 超过上限"
+
+
+def test_truncate_long_token():
+    cfg = Config("config.yml")
+    font = create_font_manager(cfg.display).get_font(cfg.display.font_size_summary)
+    max_width = cfg.display.width - 2 * cfg.display.margin
+
+    for break_long_words in (True, False):
+        layout = create_layout_engine()
+        layout.break_long_words = break_long_words
+
+        start = time.perf_counter()
+        truncated = layout.truncate_text("z" * 10 * 1024 + " tail words", font, max_width, max_lines=1)
+        assert time.perf_counter() - start < TIME_CEILING
+
+        assert "\n" not in truncated and truncated.endswith(layout.ELLIPSIS)
+        assert layout._get_text_width(truncated, font) <= max_width
+
+
+if __name__ == "__main__":
+    test_pathological_inputs()
+    test_truncate_long_token()
+    print("✅ 换行模糊测试通过")